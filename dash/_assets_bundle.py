@@ -0,0 +1,134 @@
+import hashlib
+import json
+import posixpath
+import re
+import threading
+
+from .fingerprint import build_fingerprint
+from .version import __version__
+
+_base64 = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+
+_css_url = re.compile(r"""url\(\s*(['"]?)([^'")\s]+)\1\s*\)""")
+_css_import = re.compile(r"@import\b", re.IGNORECASE)
+# a scheme, a path from the root, a protocol-relative URL or a fragment
+_absolute_url = re.compile(r"^(?:[a-zA-Z][\w+.-]*:|/|#)")
+
+
+def _vlq(value):
+    # base64 VLQ as used by source maps, sign in the lowest bit
+    value = (-value << 1) | 1 if value < 0 else value << 1
+    encoded = ""
+    while True:
+        digit = value & 31
+        value >>= 5
+        encoded += _base64[digit | 32 if value else digit]
+        if not value:
+            return encoded
+
+
+def _resolve_css_urls(css, asset_path, get_asset_url):
+    """`css` with its relative `url(...)` references resolved against the
+    URL of its asset file, as they are no longer served from there."""
+    folder = posixpath.dirname(asset_path)
+
+    def resolve(match):
+        quote, url = match.groups()
+        if _absolute_url.match(url):
+            return match.group(0)
+        url = get_asset_url(posixpath.normpath(posixpath.join(folder, url)))
+        return "url({0}{1}{0})".format(quote, url)
+
+    return _css_url.sub(resolve, css)
+
+
+class AssetsBundle:
+    """The local JS or CSS assets concatenated in load order, with a
+    source map pointing every line back to its asset file."""
+
+    def __init__(self, extension):
+        self.extension = extension
+        self.content = ""
+        self.source_map = ""
+        self.filename = ""
+        self._files = {}
+        self._key = None
+        self._lock = threading.Lock()
+
+    def _read(self, resource):
+        cached = self._files.get(resource["filepath"])
+        if cached is None or cached[0] != resource["hash"]:
+            with open(resource["filepath"], encoding="utf-8") as f:
+                cached = self._files[resource["filepath"]] = (
+                    resource["hash"],
+                    f.read(),
+                )
+        return cached[1]
+
+    def can_bundle(self, resource):
+        """Whether the asset can be part of the bundle: not stylesheets with
+        `@import` rules, which are ignored after the start of a stylesheet."""
+        return self.extension == "js" or not _css_import.search(self._read(resource))
+
+    def update(self, resources, get_asset_url):
+        """Rebuild the bundle from the `asset_path` resources.
+        Only the files whose hash changed since the last build are read."""
+        key = tuple((r["filepath"], r["hash"]) for r in resources)
+        if key == self._key:
+            return
+        with self._lock:
+            if key != self._key:
+                self._build(resources, get_asset_url)
+                # last, so the bundle is never seen half built under the key
+                self._key = key
+
+    def _build(self, resources, get_asset_url):
+        contents = [self._read(r) for r in resources]
+        self._files = {r["filepath"]: self._files[r["filepath"]] for r in resources}
+        if self.extension == "css":
+            contents = [
+                _resolve_css_urls(content, r["asset_path"], get_asset_url)
+                for r, content in zip(resources, contents)
+            ]
+
+        # JS files are closed by a line of their own, in case one relies
+        # on automatic semicolon insertion at its end
+        separator = ";" if self.extension == "js" else ""
+        chunks, mappings = [], []
+        source, line = 0, 0
+        for i, content in enumerate(contents):
+            lines = content.splitlines()
+            for n, text in enumerate(lines):
+                # one segment per line: column 0 of line n of source i, with
+                # the source and line relative to the previous segment
+                chunks.append(text)
+                mappings.append("A" + _vlq(i - source) + _vlq(n - line) + "A")
+                source, line = i, n
+            chunks.append(separator)
+            mappings.append("")
+
+        data = "\n".join(chunks)
+        filename = build_fingerprint(
+            "bundle." + self.extension,
+            __version__,
+            hashlib.sha1(data.encode("utf-8")).hexdigest()[:16],
+        )
+        source_map = json.dumps(
+            {
+                "version": 3,
+                "file": filename,
+                "sources": [get_asset_url(r["asset_path"]) for r in resources],
+                "names": [],
+                "mappings": ";".join(mappings),
+            }
+        )
+        self.filename, self.content, self.source_map = filename, data, source_map
+
+    def served(self):
+        """The bundle as served from its own URL, linked to its source map."""
+        comment = (
+            "//# sourceMappingURL={}.map"
+            if self.extension == "js"
+            else "/*# sourceMappingURL={}.map */"
+        )
+        return self.content + "\n" + comment.format(self.filename) + "\n"
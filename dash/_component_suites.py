@@ -0,0 +1,49 @@
+import gzip
+import hashlib
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def _gzip(data, server_config):
+    return gzip.compress(data, compresslevel=server_config.get("COMPRESS_LEVEL", 6))
+
+
+def _brotli(data, server_config):
+    return brotli.compress(data, quality=server_config.get("COMPRESS_BR_LEVEL", 4))
+
+
+_encoders = {"gzip": _gzip}
+if brotli is not None:
+    _encoders["br"] = _brotli
+
+
+def get_encodings(server_config):
+    """The precompressed encodings to offer, in the order of the
+    flask-compress `COMPRESS_ALGORITHM` setting."""
+    algorithms = server_config.get("COMPRESS_ALGORITHM", ["gzip"])
+    if isinstance(algorithms, str):
+        algorithms = [a.strip() for a in algorithms.split(",")]
+    return [a for a in algorithms if a in _encoders]
+
+
+class ComponentSuiteFile:
+    """A file served from `_dash-component-suites`, read once, with its ETag
+    and each compressed variant computed the first time it is requested."""
+
+    def __init__(self, data):
+        self.data = data
+        self.etag = hashlib.sha1(data).hexdigest()
+        self._encoded = {}
+
+    def get(self, encoding, server_config):
+        """Return the body and ETag of the file in `encoding`."""
+        if encoding is None:
+            return self.data, self.etag
+
+        if encoding not in self._encoded:
+            self._encoded[encoding] = _encoders[encoding](self.data, server_config)
+
+        return self._encoded[encoding], "{}-{}".format(self.etag, encoding)
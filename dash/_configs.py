@@ -19,6 +19,11 @@ def load_dash_env_vars():
                 "DASH_INCLUDE_ASSETS_FILES",
                 "DASH_COMPONENTS_CACHE_MAX_AGE",
                 "DASH_INCLUDE_ASSETS_FILES",
+                "DASH_BUNDLE_ASSETS",
+                "DASH_PRELOAD_HEADERS",
+                "DASH_LAZY_COMPONENT_SUITES",
+                "DASH_INLINE_BOOTSTRAP",
+                "DASH_PRERENDER_LAYOUT",
                 "DASH_SERVE_DEV_BUNDLES",
                 "DASH_DEBUG",
                 "DASH_UI",
@@ -27,9 +32,15 @@ def load_dash_env_vars():
                 "DASH_HOT_RELOAD_INTERVAL",
                 "DASH_HOT_RELOAD_WATCH_INTERVAL",
                 "DASH_HOT_RELOAD_MAX_RETRY",
+                "DASH_HOT_RELOAD_LONG_POLL",
+                "DASH_HOT_SWAP",
                 "DASH_SILENCE_ROUTES_LOGGING",
                 "DASH_PRUNE_ERRORS",
                 "DASH_COMPRESS",
+                "DASH_WORKERS",
+                "DASH_THREADS",
+                "DASH_MAX_REQUESTS",
+                "DASH_MAX_RSS_GROWTH",
                 "HOST",
                 "PORT",
             )
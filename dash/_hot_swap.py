@@ -0,0 +1,131 @@
+import importlib
+import inspect
+import os
+import sys
+import sysconfig
+
+
+class RestartRequired(Exception):
+    pass
+
+
+def swappable_modules(app, root):
+    """The modules that can be reloaded in place, as {filename: name}: the
+    ones imported from under `root`, except `__main__`, the installed
+    packages and the module creating `app`, in import order."""
+    installed = [
+        os.path.realpath(path)
+        for key, path in sysconfig.get_paths().items()
+        if key in ("stdlib", "platstdlib", "purelib", "platlib")
+    ]
+    modules = {}
+    for name, module in list(sys.modules.items()):
+        filename = getattr(module, "__file__", None)
+        if name in ("__main__", app.config.name):
+            continue
+        if not filename or not filename.endswith(".py"):
+            continue
+        filename = os.path.realpath(filename)
+        if not filename.startswith(root + os.sep) or any(
+            filename.startswith(path + os.sep) for path in installed
+        ):
+            continue
+        modules[filename] = name
+    return modules
+
+
+def _using(module, names):
+    for value in list(vars(module).values()):
+        if inspect.ismodule(value):
+            used = value.__name__
+        elif inspect.isfunction(value) or inspect.isclass(value):
+            used = value.__module__
+        else:
+            continue
+        if used in names:
+            return True
+    return False
+
+
+def dependents(names, modules):
+    """`names` and the modules of `modules` that import from them, directly
+    or not, in import order."""
+    names = set(names)
+    grew = True
+    while grew:
+        grew = False
+        for name in modules.values():
+            if name not in names and _using(sys.modules[name], names):
+                names.add(name)
+                grew = True
+    return [name for name in modules.values() if name in names]
+
+
+def swap(app, names):
+    """Reload the modules `names` in place. Their callbacks are rebound in
+    `app.callback_map` if their outputs and dependencies didn't change,
+    otherwise `RestartRequired` is raised.
+
+    Returns whether the page needs a hard reload, or None if a module failed
+    to reload and the app was left as it was.
+    """
+    # the module creating the app would be left with the previous versions
+    for creating in ("__main__", app.config.name):
+        module = sys.modules.get(creating)
+        if module is not None and _using(module, names):
+            raise RestartRequired("{} imports from {}".format(creating, names[0]))
+
+    # pylint: disable=protected-access
+    # the modules register their callbacks in a copy, the requests served
+    # meanwhile keep using the previous ones
+    callback_map = app.callback_map
+    app.callback_map = dict(callback_map)
+    callback_list = list(app._callback_list)
+    inline_scripts = list(app._inline_scripts)
+    layout = app._layout, app._layout_is_function, app.validation_layout
+
+    def set_inline_scripts(scripts):
+        if app._inline_scripts != scripts:
+            app._inline_scripts[:] = scripts
+            # the version only grows, a version is never served twice
+            app._inline_scripts_version += 1
+
+    def restore():
+        app.callback_map = callback_map
+        app._callback_list[:] = callback_list
+        set_inline_scripts(inline_scripts)
+        app._layout, app._layout_is_function, app.validation_layout = layout
+
+    try:
+        for name in names:
+            importlib.reload(sys.modules[name])
+    except Exception:  # pylint: disable=broad-except
+        restore()
+        app.logger.exception("Reloading %s failed", ", ".join(names))
+        return None
+
+    specs = {spec["output"]: spec for spec in callback_list}
+    registered = app._callback_list[len(callback_list) :]
+    for spec in registered:
+        if specs.get(spec["output"]) != spec:
+            restore()
+            raise RestartRequired("the callback of {} changed".format(spec["output"]))
+
+    outputs = {spec["output"] for spec in registered}
+    for output, callback in callback_map.items():
+        func = callback.get("callback")
+        if func is not None and func.__module__ in names and output not in outputs:
+            restore()
+            raise RestartRequired("the callback of {} was removed".format(output))
+
+    # the callbacks are the same, their entries in callback_map are new
+    app._callback_list[:] = callback_list
+    # the clientside callbacks registered again, only those with a new
+    # function need the page to load them
+    added = [
+        script
+        for script in app._inline_scripts[len(inline_scripts) :]
+        if script not in inline_scripts
+    ]
+    set_inline_scripts(inline_scripts + added)
+    return bool(added)
@@ -0,0 +1,292 @@
+import os
+import select
+import signal
+import socket
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from werkzeug.serving import BaseWSGIServer
+
+from .exceptions import ServerError
+
+
+def listen(host, port):
+    """The listening socket the workers share. It is non-blocking, so the
+    workers that lose the race to accept a connection go back to waiting,
+    and `SO_REUSEPORT` lets the next server bind the port while this one is
+    still finishing its requests."""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if hasattr(socket, "SO_REUSEPORT"):
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    sock.listen(BaseWSGIServer.request_queue_size)
+    sock.setblocking(False)
+    return sock
+
+
+def notify(state):
+    """Send `state` to the service manager, as `sd_notify` does, when it
+    asked for it with `NOTIFY_SOCKET`."""
+    address = os.getenv("NOTIFY_SOCKET")
+    if not address:
+        return
+    if address.startswith("@"):
+        address = "\0" + address[1:]
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+            sock.connect(address)
+            sock.sendall(state.encode("utf-8"))
+    except OSError:
+        pass
+
+
+def rss():
+    """The resident set size of the process in bytes, or None if it can't be
+    read. Off Linux, the peak resident set size is used instead."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        pass
+    try:
+        import resource  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class WorkerServer(BaseWSGIServer):
+    """Serves the requests accepted on the shared socket `sock`, `threads`
+    at a time, until `stop` is called or it is due to be recycled."""
+
+    multiprocess = True
+
+    def __init__(self, app, sock, threads, ssl_context=None):
+        super().__init__(
+            sock.getsockname()[0], 0, app, ssl_context=ssl_context, fd=sock.fileno()
+        )
+        self.multithread = threads > 1
+        self.max_requests = None
+        self.max_rss = None
+        self.handled = 0
+        self._stopping = False
+        self._pool = ThreadPoolExecutor(threads) if threads > 1 else None
+        # accept only what can be handled now, leaving the rest to the others
+        self._slots = threading.BoundedSemaphore(threads)
+
+    def stop(self):
+        if not self._stopping:
+            self._stopping = True
+            # `shutdown` waits for `serve_forever`, which runs in this thread
+            threading.Thread(target=self.shutdown, daemon=True).start()
+
+    def get_request(self):
+        self._slots.acquire()
+        try:
+            return super().get_request()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def process_request(self, request, client_address):
+        self.handled += 1
+        if self._pool is None:
+            self._process_request(request, client_address)
+        else:
+            self._pool.submit(self._process_request, request, client_address)
+
+    def _process_request(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:  # pylint: disable=broad-except
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            self._slots.release()
+
+    def service_actions(self):
+        if self._stopping:
+            return
+        if self.max_requests and self.handled >= self.max_requests:
+            self.log("info", "Worker %s served %s requests", os.getpid(), self.handled)
+            self.stop()
+        elif self.max_rss and (rss() or 0) > self.max_rss:
+            self.log("info", "Worker %s outgrew its memory limit", os.getpid())
+            self.stop()
+
+    def server_close(self):
+        super().server_close()
+        if self._pool is not None:
+            # finish the requests in progress
+            self._pool.shutdown(wait=True)
+
+
+class Master:
+    """Forks the workers serving `app` and keeps `workers` of them running:
+    the ones that exit are replaced, and on SIGHUP all of them are, the
+    previous ones stopping once the new ones are ready. SIGINT and SIGTERM
+    stop the workers, letting them finish their requests for up to
+    `graceful_timeout` seconds."""
+
+    def __init__(
+        self,
+        app,
+        sock,
+        workers,
+        threads,
+        max_requests=None,
+        max_rss_growth=None,
+        ssl_context=None,
+        graceful_timeout=30,
+        logger=None,
+    ):
+        self.app = app
+        self.logger = logger or app.logger
+        self.sock = sock
+        self.workers = workers
+        self.threads = threads
+        self.max_requests = max_requests
+        self.max_rss_growth = max_rss_growth
+        self.ssl_context = ssl_context
+        self.graceful_timeout = graceful_timeout
+
+        # {pid: generation}, a generation being the workers started together
+        self.children = {}
+        self.ready = set()
+        self.generation = 0
+        self.announced = -1
+        self.signals = []
+        self._ready_r, self._ready_w = os.pipe()
+
+    def spawn(self):
+        pid = os.fork()
+        if pid:
+            self.children[pid] = self.generation
+            return
+
+        status = 1
+        try:
+            self._work()
+            status = 0
+        except BaseException:  # pylint: disable=broad-except
+            self.logger.exception("Worker %s failed", os.getpid())
+        finally:
+            os._exit(status)  # pylint: disable=protected-access
+
+    def _work(self):
+        for sig in (signal.SIGHUP, signal.SIGTERM):
+            signal.signal(sig, signal.SIG_DFL)
+        # the master stops the workers on Ctrl+C
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        os.close(self._ready_r)
+
+        server = WorkerServer(self.app, self.sock, self.threads, self.ssl_context)
+        self.sock.close()
+        server.max_requests = self.max_requests
+        if self.max_rss_growth:
+            server.max_rss = (rss() or 0) + self.max_rss_growth
+        signal.signal(signal.SIGTERM, lambda *_: server.stop())
+
+        os.write(self._ready_w, "{}\n".format(os.getpid()).encode("ascii"))
+        server.serve_forever()
+
+    def run(self):
+        def on_signal(sig, _):
+            self.signals.append(sig)
+
+        handlers = {
+            sig: signal.signal(sig, on_signal)
+            for sig in (signal.SIGHUP, signal.SIGINT, signal.SIGTERM)
+        }
+
+        try:
+            for _ in range(self.workers):
+                self.spawn()
+            while self._handle_signals():
+                self._read_ready(0.5)
+                self._reap()
+        finally:
+            notify("STOPPING=1")
+            self.stop()
+            for sig, handler in handlers.items():
+                signal.signal(sig, handler)
+
+    def _handle_signals(self):
+        while self.signals:
+            sig = self.signals.pop(0)
+            if sig != signal.SIGHUP:
+                return False
+            self.logger.info("Replacing the workers")
+            notify("RELOADING=1")
+            self.generation += 1
+            for _ in range(self.workers):
+                self.spawn()
+        return True
+
+    def _read_ready(self, timeout):
+        if select.select([self._ready_r], [], [], timeout)[0]:
+            for pid in os.read(self._ready_r, 4096).split():
+                self.ready.add(int(pid))
+
+        current = [pid for pid, gen in self.children.items() if gen == self.generation]
+        if self.announced == self.generation or not self.ready.issuperset(current):
+            return
+
+        self.announced = self.generation
+        for pid, gen in self.children.items():
+            if gen != self.generation:
+                os.kill(pid, signal.SIGTERM)
+        self.logger.info(
+            "Dash is ready with %s workers of %s threads", self.workers, self.threads
+        )
+        notify("READY=1")
+
+    def _reap(self):
+        while self.children:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+            if not pid:
+                return
+            generation = self.children.pop(pid, None)
+            if generation != self.generation:
+                continue
+            if pid not in self.ready:
+                raise ServerError(
+                    "Worker {} exited with status {} before serving".format(pid, status)
+                )
+            self.ready.discard(pid)
+            self.spawn()
+
+    def stop(self):
+        for pid in self.children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+        deadline = time.monotonic() + self.graceful_timeout
+        while self.children and time.monotonic() < deadline:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+            if pid:
+                self.children.pop(pid, None)
+            else:
+                time.sleep(0.1)
+
+        for pid in self.children:
+            self.logger.warning("Killing worker %s", pid)
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+        self.children.clear()
+        self.sock.close()
+
+
+def serve(app, host, port, workers, threads, **options):
+    """Serve the flask server `app` from `workers` processes forked from this
+    one, see `Master`, until it is stopped."""
+    if not hasattr(os, "fork"):
+        raise ServerError("Serving with workers needs os.fork")
+    Master(app, listen(host, port), workers, threads, **options).run()
@@ -0,0 +1,210 @@
+import argparse
+import collections
+import importlib
+import itertools
+import json
+import os
+import shutil
+import sys
+
+from .development.base_component import Component
+from .exceptions import StaticExportError
+from .fingerprint import cache_regex
+from ._utils import split_callback_id, to_json
+
+_callbacks_file = "_dash-callbacks.json"
+
+
+def _write(directory, relative_path, data):
+    path = os.path.join(directory, *relative_path.split("/"))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def _copy_tree(source, destination):
+    # `shutil.copytree` only merges into an existing folder from Python 3.8
+    for current, _, files in os.walk(source):
+        target = os.path.join(destination, os.path.relpath(current, source))
+        os.makedirs(target, exist_ok=True)
+        for name in files:
+            shutil.copy2(os.path.join(current, name), os.path.join(target, name))
+
+
+def _fingerprinted(rel_path, fingerprint):
+    # `build_fingerprint`, from the fingerprint of another file of the package
+    parts = rel_path.split("/")
+    filename, extension = parts[-1].split(".", 1)
+    return "/".join(parts[:-1] + [filename + "." + fingerprint + "." + extension])
+
+
+def _initial_values(layout):
+    values = {}
+    if isinstance(layout, Component):
+        # pylint: disable=protected-access
+        for component in layout._traverse_ids():
+            for prop in component._prop_names:
+                if hasattr(component, prop):
+                    key = "{}.{}".format(component.id, prop)
+                    values[key] = [getattr(component, prop)]
+    return values
+
+
+def _callback_results(app, client, input_values):
+    """The responses of the server callbacks for every combination of the
+    values of their inputs and state, keyed by output."""
+    values = _initial_values(app._layout_value())  # pylint: disable=protected-access
+    for key, enumerated in (input_values or {}).items():
+        known = values.setdefault(key, [])
+        known.extend(v for v in enumerated if v not in known)
+
+    table = {}
+    # pylint: disable=protected-access
+    for callback in app._callback_list:
+        deps = callback["inputs"] + callback["state"]
+        keys = ["{}.{}".format(d["id"], d["property"]) for d in deps]
+        if (
+            callback.get("clientside_function")
+            or any(isinstance(d["id"], dict) for d in deps)
+            or not all(key in values for key in keys)
+        ):
+            # clientside, pattern-matching, or with a value not enumerated
+            continue
+
+        outputs = split_callback_id(callback["output"])
+        entries = table[callback["output"]] = []
+        n_inputs = len(callback["inputs"])
+        for combination in itertools.product(*(values[key] for key in keys)):
+            args = [dict(d, value=v) for d, v in zip(deps, combination)]
+            response = client.post(
+                app.config.routes_pathname_prefix + "_dash-update-component",
+                data=to_json(
+                    {
+                        "output": callback["output"],
+                        "outputs": outputs,
+                        "inputs": args[:n_inputs],
+                        "state": args[n_inputs:],
+                        "changedPropIds": [],
+                    }
+                ),
+                content_type="application/json",
+            )
+            if response.status_code not in (200, 204):
+                continue
+            entries.append(
+                {
+                    "inputs": list(combination[:n_inputs]),
+                    "state": list(combination[n_inputs:]),
+                    # null for PreventUpdate
+                    "response": response.get_json() if response.data else None,
+                }
+            )
+
+    return table
+
+
+def export_static(app, path, input_values=None):
+    """See `Dash.export_static`."""
+    # pylint: disable=protected-access
+    prefix = app.config.requests_pathname_prefix
+    routes = app.config.routes_pathname_prefix
+    client = app.server.test_client()
+
+    def fetch(url):
+        # write the file served at `url` to its path under the directory
+        relative = url[len(prefix) :].split("?")[0]
+        response = client.get(routes + relative)
+        if response.status_code != 200:
+            raise StaticExportError(
+                "{} could not be exported: {}".format(url, response.status)
+            )
+        _write(path, relative, response.data)
+        return relative
+
+    # the first request sets the server up
+    client.get(routes)
+
+    table = _callback_results(app, client, input_values)
+    _write(
+        path,
+        _callbacks_file,
+        to_json(table).encode("utf-8"),
+    )
+
+    app._static_export = {"static_callbacks": prefix + _callbacks_file}
+    app._index_cache.clear()
+    try:
+        _write(path, "index.html", app.index().encode("utf-8"))
+        links = app._script_srcs() + app._css_links()
+    finally:
+        app._static_export = None
+        app._index_cache.clear()
+
+    fetch(prefix + "_dash-layout")
+    fetch(prefix + "_dash-dependencies")
+    fetch(prefix + "_favicon.ico")
+
+    # async chunks are requested with the fingerprint of the script loading
+    # them, so the other files of a package are written with those of its
+    # scripts the pages reference
+    suites = prefix + "_dash-component-suites/"
+    fingerprints = collections.defaultdict(set)
+    exported = set()
+    for url in links:
+        if isinstance(url, str) and url.startswith(prefix):
+            exported.add(fetch(url))
+            if url.startswith(prefix + "_dash-assets-bundle/"):
+                fetch(url + ".map")
+            elif url.startswith(suites):
+                package, _, filename = url[len(suites) :].split("?")[0].partition("/")
+                name_parts = filename.split("/")[-1].split(".")
+                if len(name_parts) > 2 and cache_regex.match(name_parts[1]):
+                    fingerprints[package].add(name_parts[1])
+
+    for package, package_fingerprints in fingerprints.items():
+        directory = os.path.dirname(sys.modules[package].__file__)
+        for rel_path in app.registered_paths[package]:
+            # like the server, skip the files missing from the package
+            if not os.path.isfile(os.path.join(directory, rel_path)):
+                continue
+            for fingerprint in package_fingerprints:
+                url = suites + package + "/" + _fingerprinted(rel_path, fingerprint)
+                if url[len(prefix) :] not in exported:
+                    exported.add(fetch(url))
+
+    if app.config.assets_folder and os.path.isdir(app.config.assets_folder):
+        _copy_tree(
+            app.config.assets_folder,
+            os.path.join(path, *app.config.assets_url_path.strip("/").split("/")),
+        )
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(
+        prog="dash-export-static",
+        description="Export a Dash app to a directory a static web server can host.",
+    )
+    parser.add_argument(
+        "app", help="The app to export, as <module>:<variable>, `app` by default."
+    )
+    parser.add_argument("path", help="The directory to write the app to.")
+    parser.add_argument(
+        "--input-values",
+        help="A JSON file mapping <id>.<property> to the values that callback "
+        "input or state takes, to precompute the callback results for.",
+    )
+    return parser.parse_args()
+
+
+def cli():
+    args = _parse_args()
+    module, _, variable = args.app.partition(":")
+    sys.path.insert(0, os.getcwd())
+    app = getattr(importlib.import_module(module), variable or "app")
+
+    input_values = None
+    if args.input_values:
+        with open(args.input_values) as f:
+            input_values = json.load(f)
+
+    export_static(app, args.path, input_values)
@@ -1,23 +1,23 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
+import base64
 import shlex
 import sys
 import uuid
 import hashlib
 import collections
+import collections.abc
 import subprocess
 import logging
 import io
 import json
 from functools import wraps
-import future.utils as utils
 from . import exceptions
 
 logger = logging.getLogger()
 
-# py2/3 json.dumps-compatible strings - these are equivalent in py3, not in py2
-# note because we import unicode_literals u"" and "" are both unicode
-_strings = (type(""), type(utils.bytes_to_native_str(b"")))
+# json.dumps-compatible strings
+_strings = (str,)
 
 
 def interpolate_str(template, **data):
@@ -102,7 +102,7 @@ def strip_relative_path(requests_pathname, path):
 
 # pylint: disable=no-member
 def patch_collections_abc(member):
-    return getattr(collections if utils.PY2 else collections.abc, member)
+    return getattr(collections.abc, member)
 
 
 class AttributeDict(dict):
@@ -229,9 +229,42 @@ def run_command_with_process(cmd):
             proc.communicate()
 
 
+def to_json(value):
+    # plotly is slow to import, it is only imported to serialize a response
+    # pylint: disable=import-outside-toplevel
+    from plotly.utils import PlotlyJSONEncoder
+
+    return json.dumps(value, cls=PlotlyJSONEncoder)
+
+
+def _hash_file(path, *algorithms):
+    # in binary chunks, large bundles aren't held in memory
+    hashes = [hashlib.new(algorithm) for algorithm in algorithms]
+    with io.open(path, "rb") as fp:
+        for chunk in iter(lambda: fp.read(1 << 16), b""):
+            for h in hashes:
+                h.update(chunk)
+    return hashes
+
+
 def compute_md5(path):
-    with io.open(path, encoding="utf-8") as fp:
-        return hashlib.md5(fp.read().encode("utf-8")).hexdigest()
+    return _hash_file(path, "md5")[0].hexdigest()
+
+
+def _sri(h):
+    return "{}-{}".format(h.name, base64.b64encode(h.digest()).decode("ascii"))
+
+
+def compute_sri(path, algorithm="sha384"):
+    """The Subresource Integrity value of the file at `path`."""
+    return _sri(_hash_file(path, algorithm)[0])
+
+
+def compute_digests(path):
+    """The MD5 and the SHA-384 Subresource Integrity value of a file, read
+    once."""
+    md5, sha384 = _hash_file(path, "md5", "sha384")
+    return md5.hexdigest(), _sri(sha384)
 
 
 def job(msg=""):
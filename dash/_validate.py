@@ -1,4 +1,3 @@
-import collections
 import re
 from textwrap import dedent
 
@@ -7,6 +6,8 @@ from .development.base_component import Component
 from . import exceptions
 from ._utils import patch_collections_abc, _strings, stringify_id
 
+MutableSequence = patch_collections_abc("MutableSequence")
+
 
 def validate_callback(outputs, inputs, state, extra_args, types):
     Input, Output, State = types
@@ -254,26 +255,32 @@ def fail_callback_output(output_value, output):
         # val is a Component
         if isinstance(val, Component):
             # pylint: disable=protected-access
-            for p, j in val._traverse_with_paths():
+            # paths are only built for the error message
+            for j in val._traverse():
                 # check each component value in the tree
                 if not _value_is_valid(j):
-                    _raise_invalid(bad_val=j, outer_val=val, path=p, index=index)
+                    _raise_invalid(
+                        bad_val=j, outer_val=val, path=val._get_path(j), index=index
+                    )
 
                 # Children that are not of type Component or
                 # list/tuple not returned by traverse
                 child = getattr(j, "children", None)
-                if not isinstance(child, (tuple, collections.MutableSequence)):
+                if not isinstance(child, (tuple, MutableSequence)):
                     if child and not _value_is_valid(child):
                         _raise_invalid(
                             bad_val=child,
                             outer_val=val,
-                            path=p + "\n" + "[*] " + type(child).__name__,
+                            path=val._get_path(j)
+                            + "\n"
+                            + "[*] "
+                            + type(child).__name__,
                             index=index,
                         )
 
             # Also check the child of val, as it will not be returned
             child = getattr(val, "children", None)
-            if not isinstance(child, (tuple, collections.MutableSequence)):
+            if not isinstance(child, (tuple, MutableSequence)):
                 if child and not _value_is_valid(child):
                     _raise_invalid(
                         bad_val=child,
@@ -1,19 +1,60 @@
 import collections
+import ctypes
+import ctypes.util
 import os
 import re
+import select
+import struct
+import sys
 import time
 
+# inotify(7) event masks
+_IN_MODIFY = 0x2
+_IN_CLOSE_WRITE = 0x8
+_IN_MOVED_FROM = 0x40
+_IN_MOVED_TO = 0x80
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_DELETE_SELF = 0x400
+_IN_MOVE_SELF = 0x800
+_IN_Q_OVERFLOW = 0x4000
+_IN_ISDIR = 0x40000000
+_IN_MASK = (
+    _IN_MODIFY
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+)
 
-def watch(folders, on_change, pattern=None, sleep_time=0.1):
+# struct inotify_event: wd, mask, cookie, len, then the name
+_event = struct.Struct("iIII")
+
+
+def _filter(pattern, ignore):
     pattern = re.compile(pattern) if pattern else None
+    ignore = re.compile(ignore) if ignore else None
+
+    def watched(filename):
+        return (not pattern or pattern.search(filename)) and not (
+            ignore and ignore.search(filename)
+        )
+
+    return watched
+
+
+def _poll(folders, on_change, watched_file, sleep_time, stop):
     watched = collections.defaultdict(lambda: -1)
 
     def walk():
-        walked = []
+        walked = set()
         for folder in folders:
             for current, _, files in os.walk(folder):
                 for f in files:
-                    if pattern and not pattern.search(f):
+                    if not watched_file(f):
                         continue
                     path = os.path.join(current, f)
 
@@ -24,13 +65,170 @@ def watch(folders, on_change, pattern=None, sleep_time=0.1):
                         on_change(path, new_time, False)
 
                     watched[path] = new_time
-                    walked.append(path)
+                    walked.add(path)
 
         # Look for deleted files
         for w in [x for x in watched.keys() if x not in walked]:
             del watched[w]
             on_change(w, -1, True)
 
-    while True:
+    while not (stop and stop.is_set()):
         walk()
-        time.sleep(sleep_time)
+        if stop:
+            stop.wait(sleep_time)
+        else:
+            time.sleep(sleep_time)
+
+
+class _Inotify:
+    """The inotify watches of a set of directory trees, through libc."""
+
+    def __init__(self):
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.directories = {}
+
+    def add_tree(self, folder):
+        """Watch `folder` and its subdirectories, return their files."""
+        files = []
+        for current, _, names in os.walk(folder):
+            wd = self._libc.inotify_add_watch(self.fd, os.fsencode(current), _IN_MASK)
+            if wd < 0:
+                # most likely the fs.inotify.max_user_watches limit
+                errno = ctypes.get_errno()
+                raise OSError(errno, os.strerror(errno), current)
+            self.directories[wd] = current
+            files.extend(os.path.join(current, name) for name in names)
+        return files
+
+    def remove_tree(self, folder):
+        """Stop watching `folder` and its subdirectories, moved elsewhere:
+        their watches would report the events with their previous path."""
+        for wd, directory in list(self.directories.items()):
+            if directory == folder or directory.startswith(folder + os.sep):
+                self._libc.inotify_rm_watch(self.fd, wd)
+                del self.directories[wd]
+
+    def read(self):
+        """The events available, as (mask, path) pairs."""
+        events = []
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return events
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = _event.unpack_from(data, offset)
+                offset += _event.size
+                name = data[offset : offset + length].rstrip(b"\0")
+                offset += length
+                if mask & _IN_Q_OVERFLOW:
+                    events.append((mask, None))
+                elif wd in self.directories:
+                    directory = self.directories[wd]
+                    if mask & _IN_DELETE_SELF:
+                        del self.directories[wd]
+                        continue
+                    if mask & _IN_MOVE_SELF:
+                        self.remove_tree(directory)
+                        continue
+                    events.append((mask, os.path.join(directory, os.fsdecode(name))))
+
+    def close(self):
+        os.close(self.fd)
+
+
+def _watch_inotify(inotify, folders, on_change, watched_file, sleep_time, stop):
+    """Report the changes until `stop` is set, then return True, or return
+    False once inotify can't watch all the folders anymore."""
+
+    def report(paths):
+        for path in paths:
+            if not watched_file(os.path.basename(path)):
+                continue
+            try:
+                modified = os.stat(path).st_mtime
+            except FileNotFoundError:
+                on_change(path, -1, True)
+            else:
+                on_change(path, modified, False)
+
+    while not (stop and stop.is_set()):
+        # blocks until something changes, no CPU is used while idle unless
+        # it has to wake up to check `stop`
+        if not select.select([inotify.fd], [], [], sleep_time if stop else None)[0]:
+            continue
+
+        # debounce: wait for `sleep_time` without events, so a file saved
+        # in several writes, or many files changed at once, is reported once
+        changed = set()
+        overflow = False
+        while True:
+            for mask, path in inotify.read():
+                if path is None:
+                    overflow = True
+                elif mask & _IN_ISDIR:
+                    if mask & _IN_MOVED_FROM:
+                        inotify.remove_tree(path)
+                    elif mask & (_IN_CREATE | _IN_MOVED_TO):
+                        try:
+                            changed.update(inotify.add_tree(path))
+                        except FileNotFoundError:
+                            # already moved or deleted again
+                            pass
+                        except OSError:
+                            # over the limit of watches
+                            report(changed)
+                            return False
+                else:
+                    changed.add(path)
+            if not select.select([inotify.fd], [], [], sleep_time)[0]:
+                break
+
+        if overflow:
+            # events were lost, report every file as changed
+            for folder in folders:
+                for current, _, files in os.walk(folder):
+                    changed.update(os.path.join(current, f) for f in files)
+
+        report(changed)
+    return True
+
+
+def watch(folders, on_change, pattern=None, sleep_time=0.1, ignore=None, stop=None):
+    """Call `on_change(path, modified, deleted)` for the files changed or
+    deleted in `folders`, until the `threading.Event` `stop` is set if
+    given. Files whose name doesn't match `pattern`, or matches `ignore`,
+    are left out.
+
+    On Linux the changes come from inotify and are reported once no more
+    happen for `sleep_time`. Elsewhere, or when inotify can't watch all the
+    folders, the folders are walked every `sleep_time`.
+    """
+    watched_file = _filter(pattern, ignore)
+
+    if sys.platform.startswith("linux"):
+        inotify = None
+        existing = [f for f in folders if os.path.isdir(f)]
+        try:
+            inotify = _Inotify()
+            for folder in existing:
+                inotify.add_tree(folder)
+        except (OSError, AttributeError):
+            # no inotify in libc, or over the limit of watches
+            if inotify is not None:
+                inotify.close()
+        else:
+            # the errors of `on_change` reach the caller
+            try:
+                if _watch_inotify(
+                    inotify, existing, on_change, watched_file, sleep_time, stop
+                ):
+                    return
+            finally:
+                inotify.close()
+
+    _poll(folders, on_change, watched_file, sleep_time, stop)
@@ -4,6 +4,7 @@ import React, {useEffect, useRef, useState, createContext} from 'react';
 import PropTypes from 'prop-types';
 import TreeContainer from './TreeContainer';
 import GlobalErrorContainer from './components/error/GlobalErrorContainer.react';
+import Placeholder from './components/core/Placeholder.react';
 import {
     dispatchError,
     hydrateInitialOutputs,
@@ -14,7 +15,7 @@ import {
 } from './actions';
 import {computePaths} from './actions/paths';
 import {computeGraphs} from './actions/dependencies';
-import apiThunk from './actions/api';
+import apiThunk, {dispatchInlined} from './actions/api';
 import {EventEmitter} from './actions/utils';
 import {applyPersistence} from './persistence';
 import {getAppState} from './reducers/constants';
@@ -106,7 +107,7 @@ const UnconnectedContainer = props => {
             </DashContext.Provider>
         );
     } else {
-        content = <div className='_dash-loading'>Loading...</div>;
+        content = <Placeholder />;
     }
 
     return config && config.ui === true ? (
@@ -119,6 +120,7 @@ const UnconnectedContainer = props => {
 function storeEffect(props, events, setErrorLoading) {
     const {
         appLifecycle,
+        config,
         dependenciesRequest,
         dispatch,
         error,
@@ -128,7 +130,11 @@ function storeEffect(props, events, setErrorLoading) {
     } = props;
 
     if (isEmpty(layoutRequest)) {
-        dispatch(apiThunk('_dash-layout', 'GET', 'layoutRequest'));
+        if (
+            !dispatchInlined(dispatch, config, '_dash-layout', 'layoutRequest')
+        ) {
+            dispatch(apiThunk('_dash-layout', 'GET', 'layoutRequest'));
+        }
     } else if (layoutRequest.status === STATUS.OK) {
         if (isEmpty(layout)) {
             const finalLayout = applyPersistence(
@@ -143,7 +149,18 @@ function storeEffect(props, events, setErrorLoading) {
     }
 
     if (isEmpty(dependenciesRequest)) {
-        dispatch(apiThunk('_dash-dependencies', 'GET', 'dependenciesRequest'));
+        if (
+            !dispatchInlined(
+                dispatch,
+                config,
+                '_dash-dependencies',
+                'dependenciesRequest'
+            )
+        ) {
+            dispatch(
+                apiThunk('_dash-dependencies', 'GET', 'dependenciesRequest')
+            );
+        }
     } else if (dependenciesRequest.status === STATUS.OK && isEmpty(graphs)) {
         dispatch(
             setGraphs(
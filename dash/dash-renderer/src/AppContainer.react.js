@@ -5,6 +5,7 @@ import APIController from './APIController.react';
 import Loading from './components/core/Loading.react';
 import Toolbar from './components/core/Toolbar.react';
 import Reloader from './components/core/Reloader.react';
+import Placeholder from './components/core/Placeholder.react';
 import {setHooks, setConfig} from './actions/index';
 import {type} from 'ramda';
 
@@ -40,7 +41,7 @@ class UnconnectedAppContainer extends React.Component {
     render() {
         const {config} = this.props;
         if (type(config) === 'Null') {
-            return <div className='_dash-loading'>Loading...</div>;
+            return <Placeholder />;
         }
         const {show_undo_redo} = config;
         return (
@@ -1,14 +1,14 @@
 import React from 'react';
 import ReactDOM from 'react-dom';
 import AppProvider from './AppProvider.react';
+import {capturePrerendered} from './components/core/Placeholder.react';
 
 class DashRenderer {
     constructor(hooks) {
+        const entry = document.getElementById('react-entry-point');
+        capturePrerendered(entry);
         // render Dash Renderer upon initialising!
-        ReactDOM.render(
-            <AppProvider hooks={hooks} />,
-            document.getElementById('react-entry-point')
-        );
+        ReactDOM.render(<AppProvider hooks={hooks} />, entry);
     }
 }
 
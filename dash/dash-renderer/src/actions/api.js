@@ -1,6 +1,8 @@
 import {mergeDeepRight, once} from 'ramda';
 import {handleAsyncError, getCSRFHeader} from '../actions';
 import {urlBase} from './utils';
+import {loadComponentSuites} from '../utils/componentSuites';
+import {STATUS} from '../constants/constants';
 
 /* eslint-disable-next-line no-console */
 const logWarningOnce = once(console.warn);
@@ -55,17 +57,21 @@ export default function apiThunk(endpoint, method, store, id, body) {
                         contentType &&
                         contentType.indexOf('application/json') !== -1
                     ) {
-                        return res.json().then(json => {
-                            dispatch({
-                                type: store,
-                                payload: {
-                                    status: res.status,
-                                    content: json,
-                                    id
-                                }
-                            });
-                            return json;
-                        });
+                        return res
+                            .json()
+                            .then(json =>
+                                loadComponentSuites(json, config).then(() => {
+                                    dispatch({
+                                        type: store,
+                                        payload: {
+                                            status: res.status,
+                                            content: json,
+                                            id
+                                        }
+                                    });
+                                    return json;
+                                })
+                            );
                     }
                     logWarningOnce(
                         'Response is missing header: content-type: application/json'
@@ -91,3 +97,30 @@ export default function apiThunk(endpoint, method, store, id, body) {
             });
     };
 }
+
+/**
+ * Dispatch the content of an API request embedded in the index page
+ * (`inline_bootstrap`, `prerender_layout`) instead of fetching it, once the
+ * component suites it needs are loaded, as for a response
+ * @param {*} dispatch dispatch
+ * @param {*} config config
+ * @param {string} id id of the JSON script element
+ * @param {string} store store of the API request
+ * @returns {boolean} whether the content was embedded
+ */
+export function dispatchInlined(dispatch, config, id, store) {
+    const element = document.getElementById(id);
+    if (!element) {
+        return false;
+    }
+    const content = JSON.parse(element.textContent);
+    dispatch({type: store, payload: {status: 'loading'}});
+    loadComponentSuites(content, config)
+        .then(() =>
+            dispatch({type: store, payload: {status: STATUS.OK, content}})
+        )
+        .catch(err =>
+            handleAsyncError(err, 'Error loading the suites of ' + id, dispatch)
+        );
+    return true;
+}
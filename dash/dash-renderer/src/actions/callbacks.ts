@@ -27,6 +27,8 @@ import {
 } from '../types/callbacks';
 import {isMultiValued, stringifyId, isMultiOutputProp} from './dependencies';
 import {urlBase} from './utils';
+import {loadComponentSuites} from '../utils/componentSuites';
+import {fetchCallback} from '../utils/staticCallbacks';
 import {getCSRFHeader} from '.';
 import {createAction, Action} from 'redux-actions';
 
@@ -313,13 +315,15 @@ function handleServerside(
     const requestTime = Date.now();
     const body = JSON.stringify(payload);
 
-    return fetch(
+    return fetchCallback(
         `${urlBase(config)}_dash-update-component`,
         mergeDeepRight(config.fetch, {
             method: 'POST',
             headers: getCSRFHeader() as any,
             body
-        })
+        }),
+        config,
+        payload
     ).then(
         (res: any) => {
             const {status} = res;
@@ -378,7 +382,9 @@ function handleServerside(
                     }
 
                     recordProfile(result);
-                    return result;
+                    return loadComponentSuites(result, config).then(
+                        () => result
+                    );
                 });
             }
             if (status === STATUS.PREVENT_UPDATE) {
@@ -0,0 +1,27 @@
+import React from 'react';
+
+let prerendered = null;
+
+/**
+ * Keep the layout pre-rendered by the server (`prerender_layout`) in the
+ * entry point, to show it in place of "Loading..." until the app renders
+ * @param {HTMLElement} entry the react entry point
+ * @returns {void}
+ */
+export function capturePrerendered(entry) {
+    const element = entry.firstElementChild;
+    if (element && element.className === '_dash-prerendered') {
+        prerendered = element.innerHTML;
+    }
+}
+
+export default function Placeholder() {
+    return prerendered === null ? (
+        <div className='_dash-loading'>Loading...</div>
+    ) : (
+        <div
+            className='_dash-prerendered'
+            dangerouslySetInnerHTML={{__html: prerendered}}
+        />
+    );
+}
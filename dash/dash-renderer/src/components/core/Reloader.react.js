@@ -14,13 +14,18 @@ import PropTypes from 'prop-types';
 import {connect} from 'react-redux';
 import apiThunk from '../../actions/api';
 
+// Assets are served with a content fingerprint: name.v<version>m<hash>.ext
+const fingerprint = /\.v[\w-]+m[0-9a-fA-F]+(?=\.)/;
+const unfingerprint = href => (href || '').replace(fingerprint, '');
+
 class Reloader extends React.Component {
     constructor(props) {
         super(props);
         if (props.config.hot_reload) {
-            const {interval, max_retry} = props.config.hot_reload;
+            const {interval, max_retry, long_poll} = props.config.hot_reload;
             this.state = {
                 interval,
+                long_poll,
                 disabled: false,
                 intervalId: null,
                 packages: null,
@@ -32,15 +37,41 @@ class Reloader extends React.Component {
             };
         }
         this._retry = 0;
+        this._polling = false;
         this._head = document.querySelector('head');
         this.clearInterval = this.clearInterval.bind(this);
+        this.longPoll = this.longPoll.bind(this);
     }
 
     clearInterval() {
+        this._polling = false;
         window.clearInterval(this.state.intervalId);
         this.setState({intervalId: null});
     }
 
+    longPoll(hash) {
+        if (!this._polling) {
+            return;
+        }
+        // the server answers once the hash differs from the one we know
+        const endpoint = hash
+            ? `_reload-hash?wait=${encodeURIComponent(hash)}`
+            : '_reload-hash';
+        this.props
+            .dispatch(apiThunk(endpoint, 'GET', 'reloadRequest'))
+            .then(content => {
+                if (content && content.reloadHash) {
+                    this.longPoll(content.reloadHash);
+                } else {
+                    // the server is restarting or failing, retry later
+                    window.setTimeout(
+                        () => this.longPoll(hash),
+                        this.state.interval
+                    );
+                }
+            });
+    }
+
     static getDerivedStateFromProps(props) {
         /*
          * Save the non-loading requests in the state in order to compare
@@ -111,19 +142,15 @@ class Reloader extends React.Component {
                 for (let a of reloadRequest.content.files) {
                     if (a.is_css) {
                         was_css = true;
-                        const nodesToDisable = [];
 
-                        // Search for the old file by xpath.
-                        const it = document.evaluate(
-                            `//link[contains(@href, "${a.url}")]`,
-                            this._head
+                        // Search for the old file, fingerprinted or not.
+                        const nodesToDisable = Array.from(
+                            document.getElementsByTagName('link')
+                        ).filter(node =>
+                            unfingerprint(node.getAttribute('href')).includes(
+                                a.url
+                            )
                         );
-                        let node = it.iterateNext();
-
-                        while (node) {
-                            nodesToDisable.push(node);
-                            node = it.iterateNext();
-                        }
 
                         forEach(
                             n => n.setAttribute('disabled', 'disabled'),
@@ -171,8 +198,11 @@ class Reloader extends React.Component {
 
     componentDidMount() {
         const {dispatch, reloadRequest} = this.props;
-        const {disabled, interval} = this.state;
-        if (!disabled && !this.state.intervalId) {
+        const {disabled, interval, long_poll} = this.state;
+        if (!disabled && long_poll) {
+            this._polling = true;
+            this.longPoll(null);
+        } else if (!disabled && !this.state.intervalId) {
             const intervalId = window.setInterval(() => {
                 // Prevent requests from piling up - reloading can take
                 // many seconds (10-30) and the interval is 3s by default
@@ -185,6 +215,7 @@ class Reloader extends React.Component {
     }
 
     componentWillUnmount() {
+        this._polling = false;
         if (!this.state.disabled && this.state.intervalId) {
             this.clearInterval();
         }
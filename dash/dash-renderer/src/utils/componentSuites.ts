@@ -0,0 +1,83 @@
+import {forEach, has, is, isNil, keys, reduce, values} from 'ramda';
+
+// the URLs, or the attributes of the tags for the files with an integrity
+type Resource = string | {[attribute: string]: string};
+type Suite = {scripts: Resource[]; css: Resource[]};
+
+const loading: {[namespace: string]: Promise<any>} = {};
+
+function collectNamespaces(value: any, namespaces: Set<string>) {
+    if (is(Array, value)) {
+        forEach(v => collectNamespaces(v, namespaces), value);
+    } else if (is(Object, value)) {
+        if (
+            is(String, value.namespace) &&
+            has('type', value) &&
+            has('props', value)
+        ) {
+            namespaces.add(value.namespace);
+        }
+        forEach(v => collectNamespaces(v, namespaces), values(value));
+    }
+}
+
+function appendElement(tag: string, attributes: {[key: string]: string}) {
+    return new Promise((resolve, reject) => {
+        const element: any = document.createElement(tag);
+        forEach(key => {
+            element.setAttribute(key, attributes[key]);
+        }, keys(attributes));
+        element.onload = resolve;
+        element.onerror = () =>
+            reject(
+                new Error(`Failed to load ${attributes.src || attributes.href}`)
+            );
+        document.head.appendChild(element);
+    });
+}
+
+function loadSuite(suite: Suite) {
+    forEach(
+        href =>
+            appendElement(
+                'link',
+                typeof href === 'string' ? {rel: 'stylesheet', href} : href
+            ),
+        suite.css
+    );
+    // the scripts of a library depend on each other, load them in order
+    return reduce(
+        (previous: Promise<any>, src: Resource) =>
+            previous.then(() =>
+                appendElement('script', typeof src === 'string' ? {src} : src)
+            ),
+        Promise.resolve(),
+        suite.scripts
+    );
+}
+
+/**
+ * Load the component libraries left out of the index page
+ * (`lazy_component_suites`) that `value` has components of.
+ */
+export function loadComponentSuites(value: any, config: any): Promise<any> {
+    const suites = config.lazy_component_suites;
+    if (isNil(suites)) {
+        return Promise.resolve();
+    }
+
+    const namespaces = new Set<string>();
+    collectNamespaces(value, namespaces);
+
+    const pending: Promise<any>[] = [];
+    namespaces.forEach(namespace => {
+        if (has(namespace, suites) && !has(namespace, window)) {
+            if (!has(namespace, loading)) {
+                loading[namespace] = loadSuite(suites[namespace]);
+            }
+            pending.push(loading[namespace]);
+        }
+    });
+
+    return Promise.all(pending);
+}
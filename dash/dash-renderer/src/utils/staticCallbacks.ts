@@ -0,0 +1,47 @@
+import {equals, find, pluck, propOr} from 'ramda';
+
+let table: Promise<any> | null = null;
+
+function loadTable(url: string): Promise<any> {
+    if (table === null) {
+        table = fetch(url).then(
+            res => (res.ok ? res.json() : {}),
+            () => ({})
+        );
+    }
+    return table;
+}
+
+/**
+ * Fetch a callback response, from the results precomputed by
+ * `export_static` when they include the callback's input and state values.
+ */
+export function fetchCallback(
+    url: string,
+    init: any,
+    config: any,
+    payload: any
+): Promise<any> {
+    if (!config.static_callbacks) {
+        return fetch(url, init);
+    }
+
+    return loadTable(config.static_callbacks).then(results => {
+        const inputs = pluck('value', payload.inputs);
+        const state = pluck('value', propOr([], 'state', payload));
+        const entry: any = find(
+            (e: any) => equals(e.inputs, inputs) && equals(e.state, state),
+            propOr([], payload.output, results)
+        );
+        if (!entry) {
+            return fetch(url, init);
+        }
+        // a null response is a PreventUpdate
+        return entry.response === null
+            ? new Response(null, {status: 204})
+            : new Response(JSON.stringify(entry.response), {
+                  status: 200,
+                  headers: {'Content-Type': 'application/json'}
+              });
+    });
+}
@@ -0,0 +1,65 @@
+import {expect} from 'chai';
+import {afterEach, describe, it} from 'mocha';
+import {dispatchInlined} from '../src/actions/api';
+
+const WAIT = 500;
+
+describe('dispatchInlined', () => {
+    const layout = {
+        namespace: 'lazy_inlined_lib',
+        type: 'Lazy',
+        props: {id: 'lazy'}
+    };
+
+    function inline(id, content) {
+        const element = document.createElement('script');
+        element.id = id;
+        element.type = 'application/json';
+        element.textContent = JSON.stringify(content);
+        document.body.appendChild(element);
+    }
+
+    afterEach(() => {
+        const element = document.getElementById('_test-layout');
+        if (element) {
+            element.remove();
+        }
+        delete window.lazy_inlined_lib;
+    });
+
+    it('is false without the inlined content', () => {
+        const found = dispatchInlined(() => {}, {}, '_test-layout', 'layout');
+        expect(found).to.equal(false);
+    });
+
+    it('loads the lazy component suites first', async () => {
+        inline('_test-layout', layout);
+        const config = {
+            lazy_component_suites: {
+                lazy_inlined_lib: {
+                    scripts: [
+                        'data:text/javascript,window.lazy_inlined_lib = {};'
+                    ],
+                    css: []
+                }
+            }
+        };
+        const actions = [];
+        const dispatch = action => {
+            actions.push([action, Boolean(window.lazy_inlined_lib)]);
+        };
+
+        expect(
+            dispatchInlined(dispatch, config, '_test-layout', 'layoutRequest')
+        ).to.equal(true);
+        expect(actions).to.deep.equal([
+            [{type: 'layoutRequest', payload: {status: 'loading'}}, false]
+        ]);
+
+        await new Promise(r => setTimeout(r, WAIT));
+        expect(actions[1]).to.deep.equal([
+            {type: 'layoutRequest', payload: {status: 200, content: layout}},
+            true
+        ]);
+    });
+});
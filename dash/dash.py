@@ -4,7 +4,6 @@ import os
 import sys
 import collections
 import importlib
-import json
 import pkgutil
 import threading
 import re
@@ -13,26 +12,31 @@ import time
 import mimetypes
 import hashlib
 import base64
+import gc
+import itertools
 
 from functools import wraps
-from future.moves.urllib.parse import urlparse
+from urllib.parse import urlparse
 
 import flask
-from flask_compress import Compress
-from werkzeug.debug.tbtools import get_current_traceback
-from pkg_resources import get_distribution, parse_version
+import werkzeug
 
-import plotly
-
-from .fingerprint import build_fingerprint, check_fingerprint
+from .fingerprint import build_fingerprint, check_fingerprint, content_hash
+from ._component_suites import ComponentSuiteFile, get_encodings
+from ._assets_bundle import AssetsBundle
 from .resources import Scripts, Css
 from .dependencies import (
     handle_callback_args,
     handle_grouped_callback_args,
     Output,
 )
-from .development.base_component import ComponentRegistry
-from .exceptions import PreventUpdate, InvalidResourceError, ProxyError
+from .development.base_component import ComponentRegistry, Component
+from .exceptions import (
+    PreventUpdate,
+    InvalidConfig,
+    InvalidResourceError,
+    ProxyError,
+)
 from .version import __version__
 from ._configs import get_combined_config, pathname_configs
 from ._utils import (
@@ -49,8 +53,12 @@ from ._utils import (
     split_callback_id,
     stringify_id,
     strip_relative_path,
+    to_json,
 )
 from . import _dash_renderer
+from . import _hot_swap
+from . import prerender
+from . import _static_export
 from . import _validate
 from . import _watch
 from ._grouping import (
@@ -60,7 +68,22 @@ from ._grouping import (
     grouping_len,
 )
 
-_flask_compress_version = parse_version(get_distribution("flask-compress").version)
+
+def _flask_compress_version():
+    # rather than pkg_resources, slow to import
+    # pylint: disable=import-outside-toplevel
+    try:
+        from importlib.metadata import version
+    except ImportError:  # Python < 3.8
+        from pkg_resources import get_distribution
+
+        def version(name):
+            return get_distribution(name).version
+
+    return tuple(
+        int(part) for part in re.findall(r"\d+", version("flask-compress"))[:3]
+    )
+
 
 # Add explicit mapping for map files
 mimetypes.add_type("application/json", ".map", True)
@@ -91,6 +114,38 @@ _app_entry = """
 </div>
 """
 
+_app_entry_prerendered = """
+<div id="react-entry-point">
+    <div class="_dash-prerendered">{}</div>
+</div>
+"""
+
+# the pre-rendered HTML of a layout function, set on each view
+_prerendered_placeholder = "<!-- dash prerendered layout -->"
+
+
+def _snapshot(value):
+    # a copy of the lists and dicts in `value`, to compare it later with
+    # what was changed in place since
+    if isinstance(value, (list, tuple)):
+        return tuple(_snapshot(item) for item in value)
+    if isinstance(value, dict):
+        return tuple((key, _snapshot(item)) for key, item in value.items())
+    return value
+
+
+def _json_script(script_id, value):
+    # `</` is escaped so strings in the layout can't close the tag
+    return '<script id="{}" type="application/json">{}</script>'.format(
+        script_id, to_json(value).replace("</", "<\\/")
+    )
+
+
+# a long polling reload hash request is answered after this many seconds
+# without changes, under the usual proxy timeouts
+_long_poll_timeout = 25
+_long_poll_settle_time = 0.1
+
 _re_index_entry = "{%app_entry%}", "{%app_entry%}"
 _re_index_config = "{%config%}", "{%config%}"
 _re_index_scripts = "{%scripts%}", "{%scripts%}"
@@ -117,6 +172,21 @@ ns["{function_name}"] = {clientside_function};
 """
 
 
+class _AssetsBlueprint(flask.Blueprint):
+    """Serves the assets folder, with fingerprinted paths cached for a year."""
+
+    def send_static_file(self, filename):
+        path, has_fingerprint = check_fingerprint(filename)
+        response = super(_AssetsBlueprint, self).send_static_file(path)
+
+        if has_fingerprint:
+            # The fingerprint is the content hash, so the URL never goes stale
+            response.cache_control.max_age = 31536000  # 1 year
+            response.cache_control.immutable = True
+
+        return response
+
+
 # pylint: disable=too-many-instance-attributes
 # pylint: disable=too-many-arguments, too-many-locals
 class Dash(object):
@@ -175,6 +245,47 @@ class Dash(object):
         to sensitive files. env: ``DASH_INCLUDE_ASSETS_FILES``
     :type include_assets_files: boolean
 
+    :param bundle_assets: Default ``False``, set to ``True`` to concatenate
+        the .js and the .css files loaded from ``assets_folder`` into one
+        fingerprinted bundle each, served with a source map.
+        env: ``DASH_BUNDLE_ASSETS``
+    :type bundle_assets: boolean
+
+    :param preload_headers: Default ``False``, set to ``True`` to also send
+        the preload hints of the index page's scripts and stylesheets as a
+        ``Link`` header, and as a 103 Early Hints response when the server
+        provides a ``wsgi.early_hints`` callable. env: ``DASH_PRELOAD_HEADERS``
+    :type preload_headers: boolean
+
+    :param assets_inline_threshold: With ``bundle_assets``, a bundle smaller
+        than this many characters is inlined into the index page instead of
+        being requested separately. Default ``1024``.
+    :type assets_inline_threshold: int
+
+    :param lazy_component_suites: Default ``False``, set to ``True`` to load
+        with the index page only the component libraries used in the layout
+        and in ``eager_namespaces``. The others are loaded by the renderer
+        when a callback first returns one of their components.
+        env: ``DASH_LAZY_COMPONENT_SUITES``
+    :type lazy_component_suites: boolean
+
+    :param eager_namespaces: With ``lazy_component_suites``, the component
+        libraries to always load with the index page, as package names,
+        component namespaces or component classes.
+    :type eager_namespaces: list of strings or component classes
+
+    :param inline_bootstrap: Default ``False``, set to ``True`` to embed the
+        callback list, and the layout unless it is a function, in the index
+        page so the renderer starts without requesting ``_dash-layout`` and
+        ``_dash-dependencies``. env: ``DASH_INLINE_BOOTSTRAP``
+    :type inline_bootstrap: boolean
+
+    :param prerender_layout: Default ``False``, set to ``True`` to send the
+        layout rendered as static HTML in the index page, shown until the
+        renderer has loaded. See ``dash.prerender`` for the components it
+        covers. env: ``DASH_PRERENDER_LAYOUT``
+    :type prerender_layout: boolean
+
     :param url_base_pathname: A local URL prefix to use app-wide.
         Default ``'/'``. Both `requests_pathname_prefix` and
         `routes_pathname_prefix` default to `url_base_pathname`.
@@ -288,6 +399,13 @@ class Dash(object):
         plugins=None,
         title="Dash",
         update_title="Updating...",
+        bundle_assets=None,
+        assets_inline_threshold=1024,
+        preload_headers=None,
+        lazy_component_suites=None,
+        eager_namespaces=None,
+        inline_bootstrap=None,
+        prerender_layout=None,
         **obsolete,
     ):
         _validate.check_obsolete(obsolete)
@@ -307,7 +425,7 @@ class Dash(object):
         if (
             self.server is not None
             and not hasattr(self.server.config, "COMPRESS_ALGORITHM")
-            and _flask_compress_version >= parse_version("1.6.0")
+            and _flask_compress_version() >= (1, 6, 0)
         ):
             # flask-compress==1.6.0 changed default to ['br', 'gzip']
             # and non-overridable default compression with Brotli is
@@ -348,6 +466,21 @@ class Dash(object):
             extra_hot_reload_paths=extra_hot_reload_paths or [],
             title=title,
             update_title=update_title,
+            bundle_assets=get_combined_config("bundle_assets", bundle_assets, False),
+            assets_inline_threshold=assets_inline_threshold,
+            preload_headers=get_combined_config(
+                "preload_headers", preload_headers, False
+            ),
+            lazy_component_suites=get_combined_config(
+                "lazy_component_suites", lazy_component_suites, False
+            ),
+            eager_namespaces=eager_namespaces or [],
+            inline_bootstrap=get_combined_config(
+                "inline_bootstrap", inline_bootstrap, False
+            ),
+            prerender_layout=get_combined_config(
+                "prerender_layout", prerender_layout, False
+            ),
         )
         self.config.set_read_only(
             [
@@ -376,8 +509,19 @@ class Dash(object):
         # same deps as a list to catch duplicate outputs, and to send to the front end
         self._callback_list = []
 
-        # list of inline scripts
+        # list of inline scripts, served together from `_dash-clientside`
         self._inline_scripts = []
+        # bumped on each change of `_inline_scripts`
+        self._inline_scripts_version = 0
+        # set by `export_static` while it renders the index page
+        self._static_export = None
+        self._clientside_file = None
+
+        # rendered index pages, see `_index_page`
+        self._index_cache = {}
+        # the layout and dependencies responses serialized by `warmup`
+        self._frozen = {}
+        self._server_set_up = False
 
         # index_string has special setter so can't go in config
         self._index_string = ""
@@ -392,6 +536,10 @@ class Dash(object):
         self.scripts = Scripts(serve_locally, eager_loading)
 
         self.registered_paths = collections.defaultdict(set)
+        # files served from memory, see `_serve_file`
+        self._component_suites = {}
+        # concatenated assets, see `serve_assets_bundle`
+        self._assets_bundles = {"js": AssetsBundle("js"), "css": AssetsBundle("css")}
 
         # urls
         self.routes = []
@@ -401,13 +549,19 @@ class Dash(object):
         self.validation_layout = None
 
         self._setup_dev_tools()
+        _reload_lock = threading.RLock()
         self._hot_reload = AttributeDict(
             hash=None,
             hard=False,
-            lock=threading.RLock(),
+            lock=_reload_lock,
+            # notified when the hash changes, for the long polling clients
+            changed=threading.Condition(_reload_lock),
             watch_thread=None,
+            swap_thread=None,
             changed_assets=[],
         )
+        # {filename: module name} of the modules swapped in with hot_swap
+        self._swappable = {}
 
         self._assets_files = []
 
@@ -435,7 +589,7 @@ class Dash(object):
         )
 
         self.server.register_blueprint(
-            flask.Blueprint(
+            _AssetsBlueprint(
                 assets_blueprint_name,
                 config.name,
                 static_folder=self.config.assets_folder,
@@ -447,6 +601,10 @@ class Dash(object):
         )
 
         if config.compress:
+            # imported here, most apps behind a proxy compressing don't use it
+            # pylint: disable=import-outside-toplevel
+            from flask_compress import Compress
+
             # gzip
             Compress(self.server)
 
@@ -469,10 +627,17 @@ class Dash(object):
         self._add_url("_dash-update-component", self.dispatch, ["POST"])
         self._add_url("_reload-hash", self.serve_reload_hash)
         self._add_url("_favicon.ico", self._serve_default_favicon)
-        self._add_url("", self.index)
+        self._add_url(
+            "_dash-assets-bundle/<string:fingerprinted_name>", self.serve_assets_bundle
+        )
+        self._add_url(
+            "_dash-clientside/<string:fingerprinted_name>",
+            self.serve_clientside_scripts,
+        )
+        self._add_url("", self._serve_index)
 
         # catch-all for front-end routes, used by dcc.Location
-        self._add_url("<path:path>", self.index)
+        self._add_url("<path:path>", self._serve_index)
 
     def _add_url(self, name, view_func, methods=("GET",)):
         full_name = self.config.routes_pathname_prefix + name
@@ -497,6 +662,7 @@ class Dash(object):
         _validate.validate_layout_type(value)
         self._layout_is_function = isinstance(value, patch_collections_abc("Callable"))
         self._layout = value
+        self._frozen.pop("layout", None)
 
         # for using flask.has_request_context() to deliver a full layout for
         # validation inside a layout function - track if a user might be doing this.
@@ -541,17 +707,20 @@ class Dash(object):
         checks = (_re_index_entry, _re_index_config, _re_index_scripts)
         _validate.validate_index("index string", checks, value)
         self._index_string = value
+        self._index_cache.clear()
 
     def serve_layout(self):
-        layout = self._layout_value()
+        body = self._frozen.get("layout")
+        if body is None:
+            body = to_json(self._layout_value())
 
         # TODO - Set browser cache limit - pass hash into frontend
         return flask.Response(
-            json.dumps(layout, cls=plotly.utils.PlotlyJSONEncoder),
+            body,
             mimetype="application/json",
         )
 
-    def _config(self):
+    def _config(self, lazy_component_suites=None):
         # pieces of config needed by the front end
         config = {
             "url_base_pathname": self.config.url_base_pathname,
@@ -567,15 +736,34 @@ class Dash(object):
                 # convert from seconds to msec as used by js `setInterval`
                 "interval": int(self._dev_tools.hot_reload_interval * 1000),
                 "max_retry": self._dev_tools.hot_reload_max_retry,
+                "long_poll": self._dev_tools.hot_reload_long_poll,
             }
         if self.validation_layout and not self.config.suppress_callback_exceptions:
             config["validation_layout"] = self.validation_layout
+        if lazy_component_suites:
+            config["lazy_component_suites"] = lazy_component_suites
+        if self._static_export:
+            config.update(self._static_export)
 
         return config
 
     def serve_reload_hash(self):
         _reload = self._hot_reload
+        known_hash = flask.request.args.get("wait")
         with _reload.lock:
+            if known_hash and self._dev_tools.hot_reload_long_poll:
+                timeout = time.time() + _long_poll_timeout
+                bumped = _reload.changed.wait_for(
+                    lambda: _reload.hash != known_hash, _long_poll_timeout
+                )
+                # the files changed together are reported one after the other
+                while (
+                    bumped
+                    and time.time() < timeout
+                    and _reload.changed.wait(_long_poll_settle_time)
+                ):
+                    pass
+
             hard = _reload.hard
             changed = _reload.changed_assets
             _hash = _reload.hash
@@ -591,7 +779,7 @@ class Dash(object):
             }
         )
 
-    def _collect_and_register_resources(self, resources):
+    def _collect_and_register_resources(self, resources, tag="script"):
         # now needs the app context.
         # template in the necessary component suite JS bundles
         # add the version number of the package as a query parameter
@@ -615,6 +803,9 @@ class Dash(object):
             )
 
         srcs = []
+        bundled = []
+        assets_bundle = self._assets_bundles["js" if tag == "script" else "css"]
+        bundling = self._bundles_assets()
         for resource in resources:
             is_dynamic_resource = resource.get("dynamic", False)
 
@@ -634,33 +825,97 @@ class Dash(object):
                         )
             elif "external_url" in resource:
                 if not is_dynamic_resource:
-                    if isinstance(resource["external_url"], str):
-                        srcs.append(resource["external_url"])
-                    else:
-                        srcs += resource["external_url"]
+                    urls = resource["external_url"]
+                    urls = [urls] if isinstance(urls, str) else urls
+                    if "integrity" in resource:
+                        # a tag with the attributes, like `external_scripts`
+                        integrity = resource["integrity"]
+                        integrity = (
+                            [integrity] if isinstance(integrity, str) else integrity
+                        )
+                        attributes = {"rel": "stylesheet"} if tag == "link" else {}
+                        urls = [
+                            dict(
+                                attributes,
+                                **{"href" if tag == "link" else "src": url},
+                                integrity=sri,
+                                crossorigin="anonymous",
+                            )
+                            for url, sri in zip(urls, integrity)
+                        ]
+                    srcs += urls
             elif "absolute_path" in resource:
                 raise Exception("Serving files from absolute_path isn't supported yet")
             elif "asset_path" in resource:
-                static_url = self.get_asset_url(resource["asset_path"])
-                # Add a cache-busting query param
-                static_url += "?m={}".format(resource["ts"])
-                srcs.append(static_url)
+                if bundling and "hash" in resource:
+                    # stop at the first asset left out, to keep their order
+                    bundling = assets_bundle.can_bundle(resource)
+                if bundling and "hash" in resource:
+                    if not bundled:
+                        # the bundle is loaded in place of the first asset
+                        srcs.append(None)
+                        bundle_index = len(srcs) - 1
+                    bundled.append(resource)
+                elif "hash" in resource and not self.config.assets_external_path:
+                    srcs.append(
+                        self.get_asset_url(
+                            build_fingerprint(
+                                resource["asset_path"], __version__, resource["hash"]
+                            )
+                        )
+                    )
+                else:
+                    static_url = self.get_asset_url(resource["asset_path"])
+                    # Add a cache-busting query param, the content hash of
+                    # the assets hashed when registered
+                    static_url += "?m={}".format(resource.get("hash") or resource["ts"])
+                    srcs.append(static_url)
+
+        if bundled:
+            srcs[bundle_index] = self._assets_bundle_src(bundled)
+
         return srcs
 
-    def _generate_css_dist_html(self):
-        external_links = self.config.external_stylesheets
-        links = self._collect_and_register_resources(self.css.get_all_css())
+    def _bundles_assets(self):
+        # external assets are served from their own host
+        return self.config.bundle_assets and not self.config.assets_external_path
+
+    def _assets_bundle_src(self, resources):
+        extension = "js" if resources[0]["asset_path"].endswith("js") else "css"
+        bundle = self._assets_bundles[extension]
+        bundle.update(resources, self.get_asset_url)
+
+        closing_tag = "</script" if extension == "js" else "</style"
+        if (
+            len(bundle.content) < self.config.assets_inline_threshold
+            and closing_tag not in bundle.content.lower()
+        ):
+            return bundle
+
+        return "{}_dash-assets-bundle/{}".format(
+            self.config.requests_pathname_prefix, bundle.filename
+        )
+
+    def _css_links(self, namespaces=None):
+        return self.config.external_stylesheets + self._collect_and_register_resources(
+            self.css.get_all_css(namespaces), tag="link"
+        )
 
+    def _generate_css_dist_html(self, links=None):
+        if links is None:
+            links = self._css_links()
         return "\n".join(
             [
                 format_tag("link", link, opened=True)
                 if isinstance(link, dict)
+                else "<style>{}</style>".format(link.content)
+                if isinstance(link, AssetsBundle)
                 else f'<link rel="stylesheet" href="{link}">'
-                for link in (external_links + links)
+                for link in links
             ]
         )
 
-    def _generate_scripts_html(self):
+    def _script_srcs(self, namespaces=None):
         # Dash renderer has dependencies like React which need to be rendered
         # before every other script. However, the dash renderer bundle
         # itself needs to be rendered after all of the component's
@@ -686,28 +941,144 @@ class Dash(object):
             )
             + self.config.external_scripts
             + self._collect_and_register_resources(
-                self.scripts.get_all_scripts(dev_bundles=dev)
+                self.scripts.get_all_scripts(dev_bundles=dev, namespaces=namespaces)
                 + self.scripts._resources._filter_resources(
                     _dash_renderer._js_dist, dev_bundles=dev
                 )
             )
         )
 
+        if self._inline_scripts:
+            srcs.append(
+                "{}_dash-clientside/{}".format(
+                    self.config.requests_pathname_prefix, self._clientside_scripts()[0]
+                )
+            )
+
+        return srcs
+
+    def _page_namespaces(self):
+        """The component libraries loaded with the index page: those of the
+        layout and of `eager_namespaces`, or None for all of them."""
+        if not self.config.lazy_component_suites:
+            return None
+
+        modules = ComponentRegistry.namespaces()
+        namespaces = set()
+        for namespace in self.config.eager_namespaces:
+            if not isinstance(namespace, str):
+                # a component class
+                namespace = namespace.__module__
+            namespace = modules.get(namespace, namespace)
+            namespaces.add(namespace.split(".")[0])
+
+        layout = self._layout_value()
+        if isinstance(layout, Component):
+            # pylint: disable=protected-access
+            for component in itertools.chain([layout], layout._traverse()):
+                if isinstance(component, Component):
+                    # the registry is keyed by the top module, not `_namespace`
+                    namespaces.add(type(component).__module__.split(".")[0])
+
+        return namespaces
+
+    def _lazy_component_suites(self, namespaces):
+        """The bundles of the libraries left out of the index page, loaded
+        by the renderer when it first receives one of their components."""
+        if namespaces is None:
+            return {}
+
+        # the renderer looks the suites up by the `_namespace` of components
+        names = collections.defaultdict(list)
+        for name, module in ComponentRegistry.namespaces().items():
+            names[module].append(name)
+
+        dev = self._dev_tools.serve_dev_bundles
+        suites = {}
+        for namespace in sorted(ComponentRegistry.registry - namespaces):
+            # pylint: disable=protected-access
+            scripts = self.scripts._resources._filter_resources(
+                ComponentRegistry.get_resources("_js_dist", {namespace}),
+                dev_bundles=dev,
+            )
+            css = self.css._resources._filter_resources(
+                ComponentRegistry.get_resources("_css_dist", {namespace})
+            )
+            # the URLs, or the attributes of the tags for those with integrity
+            suite = {
+                "scripts": [
+                    src
+                    for src in self._collect_and_register_resources(scripts)
+                    if isinstance(src, (str, dict))
+                ],
+                "css": [
+                    href
+                    for href in self._collect_and_register_resources(css, tag="link")
+                    if isinstance(href, (str, dict))
+                ],
+            }
+            if suite["scripts"] or suite["css"]:
+                for name in names[namespace]:
+                    suites[name] = suite
+
+        return suites
+
+    def _generate_scripts_html(self, srcs=None):
+        if srcs is None:
+            srcs = self._script_srcs()
         return "\n".join(
             [
                 format_tag("script", src)
                 if isinstance(src, dict)
+                else "<script>{}</script>".format(src.content)
+                if isinstance(src, AssetsBundle)
                 else '<script src="{}"></script>'.format(src)
                 for src in srcs
             ]
-            + ["<script>{}</script>".format(src) for src in self._inline_scripts]
         )
 
-    def _generate_config_html(self):
+    @staticmethod
+    def _preloads(script_srcs, css_links):
+        # the URLs of the scripts and stylesheets the index loads, without
+        # the ones carrying attributes like `integrity` the hint would miss
+        return [(src, "script") for src in script_srcs if isinstance(src, str)] + [
+            (href, "style") for href in css_links if isinstance(href, str)
+        ]
+
+    @staticmethod
+    def _generate_preload_html(preloads):
+        # stylesheets are already linked from the <head>
+        return "\n".join(
+            '<link rel="preload" href="{}" as="script">'.format(url)
+            for url, kind in preloads
+            if kind == "script"
+        )
+
+    def _generate_config_html(self, lazy_component_suites=None):
         return '<script id="_dash-config" type="application/json">{}</script>'.format(
-            json.dumps(self._config(), cls=plotly.utils.PlotlyJSONEncoder)
+            to_json(self._config(lazy_component_suites))
         )
 
+    def _generate_bootstrap_html(self):
+        if not (self.config.inline_bootstrap or self._static_export):
+            return ""
+
+        blocks = [_json_script("_dash-dependencies", self._callback_list)]
+        # a layout function is evaluated on each page view, so it is still
+        # requested separately and the index page stays cacheable
+        if self._static_export:
+            blocks.append(_json_script("_dash-layout", self._layout_value()))
+        elif not self._layout_is_function:
+            blocks.append(_json_script("_dash-layout", self._layout))
+        return "\n".join(blocks)
+
+    def _generate_app_entry(self):
+        if not self.config.prerender_layout:
+            return _app_entry
+        if self._layout_is_function:
+            return _app_entry_prerendered.format(_prerendered_placeholder)
+        return _app_entry_prerendered.format(prerender.render(self._layout))
+
     def _generate_renderer(self):
         return (
             '<script id="_dash-renderer" type="application/javascript">'
@@ -741,40 +1112,229 @@ class Dash(object):
         extension = "." + path_in_pkg.split(".")[-1]
         mimetype = mimetypes.types_map.get(extension, "application/octet-stream")
 
-        package = sys.modules[package_name]
-        self.logger.debug(
-            "serving -- package: %s[%s] resource: %s => location: %s",
-            package_name,
-            package.__version__,
-            path_in_pkg,
-            package.__path__,
-        )
-
-        response = flask.Response(
-            pkgutil.get_data(package_name, path_in_pkg), mimetype=mimetype
-        )
+        suite_file = self._component_suites.get((package_name, path_in_pkg))
+        if suite_file is None:
+            package = sys.modules[package_name]
+            self.logger.debug(
+                "serving -- package: %s[%s] resource: %s => location: %s",
+                package_name,
+                package.__version__,
+                path_in_pkg,
+                package.__path__,
+            )
+            suite_file = ComponentSuiteFile(pkgutil.get_data(package_name, path_in_pkg))
+            self._component_suites[(package_name, path_in_pkg)] = suite_file
 
+        response = self._serve_file(suite_file, mimetype)
         if has_fingerprint:
             # Fingerprinted resources are good forever (1 year)
-            # No need for ETag as the fingerprint changes with each build
             response.cache_control.max_age = 31536000  # 1 year
-        else:
-            # Non-fingerprinted resources are given an ETag that
-            # will be used / check on future requests
-            response.add_etag()
-            tag = response.get_etag()[0]
 
-            request_etag = flask.request.headers.get("If-None-Match")
+        return response
+
+    def serve_assets_bundle(self, fingerprinted_name):
+        name, has_fingerprint = check_fingerprint(fingerprinted_name)
+        bundle_name, _, extension = name.partition(".")
+        bundle = self._assets_bundles.get(extension.replace(".map", ""))
+
+        if (
+            bundle_name != "bundle"
+            or bundle is None
+            or not bundle.filename
+            or extension not in (bundle.extension, bundle.extension + ".map")
+        ):
+            raise InvalidResourceError(
+                "Assets bundle {} not found.".format(fingerprinted_name)
+            )
+
+        filename = bundle.filename + extension[len(bundle.extension) :]
+        bundle_file = self._component_suites.get(("_dash-assets-bundle", filename))
+        if bundle_file is None:
+            data = bundle.source_map if extension.endswith("map") else bundle.served()
+            bundle_file = ComponentSuiteFile(data.encode("utf-8"))
+            self._component_suites[("_dash-assets-bundle", filename)] = bundle_file
+
+        response = self._serve_file(
+            bundle_file,
+            mimetypes.types_map.get("." + extension.split(".")[-1], "text/plain"),
+        )
+        if has_fingerprint and fingerprinted_name == filename:
+            response.cache_control.max_age = 31536000  # 1 year
+            response.cache_control.immutable = True
+
+        return response
+
+    def _clientside_scripts(self):
+        version = self._inline_scripts_version
+        if self._clientside_file is None or self._clientside_file[0] != version:
+            suite_file = ComponentSuiteFile(
+                "\n".join(self._inline_scripts).encode("utf-8")
+            )
+            filename = build_fingerprint(
+                "clientside.js", __version__, suite_file.etag[:16]
+            )
+            self._clientside_file = (version, filename, suite_file)
+
+        return self._clientside_file[1:]
+
+    def serve_clientside_scripts(self, fingerprinted_name):
+        name, has_fingerprint = check_fingerprint(fingerprinted_name)
+        if name != "clientside.js" or not self._inline_scripts:
+            raise InvalidResourceError(
+                "Clientside scripts {} not found.".format(fingerprinted_name)
+            )
 
-            if '"{}"'.format(tag) == request_etag:
-                response = flask.Response(None, status=304)
+        filename, suite_file = self._clientside_scripts()
+        response = self._serve_file(suite_file, "application/javascript")
+        if has_fingerprint and fingerprinted_name == filename:
+            response.cache_control.max_age = 31536000  # 1 year
+            response.cache_control.immutable = True
 
         return response
 
+    def _serve_file(self, suite_file, mimetype):
+        encoding = None
+        if self.config.compress:
+            encoding = flask.request.accept_encodings.best_match(
+                get_encodings(self.server.config)
+            )
+        body, etag = suite_file.get(encoding, self.server.config)
+
+        response = flask.Response(body, mimetype=mimetype)
+        response.set_etag(etag)
+        if self.config.compress:
+            response.vary.add("Accept-Encoding")
+        if encoding:
+            response.content_encoding = encoding
+
+        # Ranges are not offered on an uncompressed body that flask-compress
+        # may still compress, as it would compress the partial content.
+        return response.make_conditional(
+            flask.request,
+            accept_ranges=bool(encoding) or not self.config.compress,
+            complete_length=len(body),
+        )
+
+    def _index_signature(self):
+        # the inputs of the index page that can be changed directly on the
+        # app, compared on each hit. Events with no such trace (asset files
+        # changing, dev tools, callbacks) clear the cache instead.
+        # pylint: disable=protected-access
+        return (
+            self.title,
+            self.renderer,
+            self.validation_layout,
+            self._favicon,
+            self._layout,
+            _snapshot(list(self.config.values())),
+            self._inline_scripts_version,
+            self.css._resources.version,
+            self.scripts._resources.version,
+            # also changed directly by the generated component packages
+            frozenset(ComponentRegistry.registry),
+        )
+
+    def _index_page(self):
+        if type(self).interpolate_index is not Dash.interpolate_index:
+            # overridden, it may use the request (a CSP nonce for instance):
+            # rendered once per request rather than cached
+            if not flask.has_request_context():
+                return self._build_index_page(None)
+            page = getattr(flask.g, "dash_index_page", None)
+            if page is None:
+                page = self._build_index_page(None)
+                flask.g.dash_index_page = page  # pylint: disable=assigning-non-slot
+            return page
+
+        key = (
+            self.config.requests_pathname_prefix,
+            self._dev_tools.serve_dev_bundles,
+        )
+        signature = self._index_signature()
+
+        page = self._index_cache.get(key)
+        if page is None or page[0] != signature:
+            page = self._index_cache[key] = self._build_index_page(signature)
+
+        return page
+
+    def _build_index_page(self, signature):
+        index, preloads = self._render_index()
+        etag = hashlib.sha1(index.encode("utf-8")).hexdigest()
+        links = ", ".join(
+            "<{}>; rel=preload; as={}".format(url, kind) for url, kind in preloads
+        )
+        return signature, index, etag, links
+
+    def _serve_index(self, *args, **kwargs):
+        _, cached_index, etag, links = self._index_page()
+
+        if self.config.preload_headers and links:
+            # 103 Early Hints, for servers exposing the `wsgi.early_hints`
+            # callable, sent before an overridden `index` computes its body
+            early_hints = flask.request.environ.get("wsgi.early_hints")
+            if callable(early_hints):
+                early_hints([("Link", links)])
+
+        index = self.index(*args, **kwargs)
+        response = flask.Response(index, mimetype="text/html")
+        if self.config.preload_headers and links:
+            response.headers["Link"] = links
+
+        if index is cached_index:
+            response.set_etag(etag)
+        else:
+            # `index` is overridden, tag whatever it returned
+            response.add_etag()
+
+        return response.make_conditional(flask.request)
+
     def index(self, *args, **kwargs):  # pylint: disable=unused-argument
-        scripts = self._generate_scripts_html()
-        css = self._generate_css_dist_html()
-        config = self._generate_config_html()
+        index = self._index_page()[1]
+        if not (self.config.prerender_layout and self._layout_is_function):
+            return index
+
+        # the layout rendered is also inlined, after the entry point the
+        # renderer replaces, so the view doesn't evaluate it a second time
+        layout = self._layout_value()
+        entry = _app_entry_prerendered.format(prerender.render(layout))
+        if not self._static_export:
+            entry += _json_script("_dash-layout", layout)
+        return index.replace(
+            _app_entry_prerendered.format(_prerendered_placeholder), entry, 1
+        )
+
+    def _generate_html(self, name, resources):
+        # subclasses may override the generators with their `(self)`
+        # signature, those collect the resources again
+        if getattr(type(self), name) is not getattr(Dash, name):
+            return getattr(self, name)()
+        return getattr(self, name)(resources)
+
+    def _render_index(self):
+        namespaces = self._page_namespaces()
+        script_srcs = self._script_srcs(namespaces)
+        css_links = self._css_links(namespaces)
+        preloads = self._preloads(script_srcs, css_links)
+
+        scripts = self._generate_html("_generate_scripts_html", script_srcs)
+        # the preload hints go to the <head> so the scripts in the
+        # footer are discovered as early as the stylesheets
+        css = "\n".join(
+            [
+                self._generate_preload_html(preloads),
+                self._generate_html("_generate_css_dist_html", css_links),
+            ]
+        )
+        config = "\n".join(
+            filter(
+                None,
+                [
+                    self._generate_config_html(self._lazy_component_suites(namespaces)),
+                    self._generate_bootstrap_html(),
+                ],
+            )
+        )
         metas = self._generate_meta_html()
         renderer = self._generate_renderer()
 
@@ -805,7 +1365,7 @@ class Dash(object):
             css=css,
             config=config,
             scripts=scripts,
-            app_entry=_app_entry,
+            app_entry=self._generate_app_entry(),
             favicon=favicon,
             renderer=renderer,
         )
@@ -817,7 +1377,7 @@ class Dash(object):
             _re_renderer_scripts_id,
         )
         _validate.validate_index("index", checks, index)
-        return index
+        return index, preloads
 
     def interpolate_index(
         self,
@@ -878,6 +1438,9 @@ class Dash(object):
         )
 
     def dependencies(self):
+        body = self._frozen.get("dependencies")
+        if body is not None:
+            return flask.Response(body, mimetype="application/json")
         return flask.jsonify(self._callback_list)
 
     def _insert_callback(
@@ -907,6 +1470,8 @@ class Dash(object):
             "inputs_state_indices": inputs_state_indices,
         }
         self._callback_list.append(callback_spec)
+        self._index_cache.clear()
+        self._frozen.pop("dependencies", None)
 
         return callback_id
 
@@ -996,6 +1561,7 @@ class Dash(object):
                     clientside_function=clientside_function,
                 )
             )
+            self._inline_scripts_version += 1
 
         # Callback is stored in an external asset.
         else:
@@ -1100,9 +1666,7 @@ class Dash(object):
                 response = {"response": component_ids, "multi": True}
 
                 try:
-                    jsonResponse = json.dumps(
-                        response, cls=plotly.utils.PlotlyJSONEncoder
-                    )
+                    jsonResponse = to_json(response)
                 except TypeError:
                     _validate.fail_callback_output(output_value, output)
 
@@ -1187,6 +1751,14 @@ class Dash(object):
         return response
 
     def _setup_server(self):
+        if self._server_set_up:
+            # done ahead by `warmup`
+            return
+
+        # first, as a layout raising (a database still starting...) makes
+        # flask run the setup again on the next request
+        _validate.validate_layout(self.layout, self._layout_value())
+
         # Apply _force_eager_loading overrides from modules
         eager_loading = self.config.eager_loading
         for module_name in ComponentRegistry.registry:
@@ -1200,13 +1772,62 @@ class Dash(object):
         if self.config.include_assets_files:
             self._walk_assets_directory()
 
-        _validate.validate_layout(self.layout, self._layout_value())
+        self._script_srcs()
+        self._css_links()
+        # only once it succeeded
+        self._server_set_up = True
+
+    def warmup(self, freeze=True):
+        """Do the work of the first request ahead, in the process creating
+        the app, so the workers forked from it share the results rather than
+        each doing it again: with gunicorn ``--preload``, call it from the
+        module serving ``app.server``, or from a ``when_ready`` hook.
+
+        The assets are walked and the layout validated, the index page
+        rendered, the component suites read and compressed, and the static
+        layout and the callback dependencies serialized. Changing the layout
+        or adding callbacks afterwards discards what was serialized for
+        them.
+
+        :param freeze: Default ``True``. Move the objects of the process out
+            of the garbage collector's reach with ``gc.freeze`` (Python 3.7+),
+            so collections in the workers don't write to the pages they share
+            with it.
+        :type freeze: boolean
+        """
+        self._setup_server()
+
+        with self.server.test_request_context(self.config.routes_pathname_prefix):
+            self._index_page()
+
+        encodings = get_encodings(self.server.config) if self.config.compress else []
+        for package_name, paths in self.registered_paths.items():
+            for path_in_pkg in paths:
+                key = (package_name, path_in_pkg)
+                if key not in self._component_suites:
+                    try:
+                        data = pkgutil.get_data(package_name, path_in_pkg)
+                    except OSError:
+                        # served as a 404 anyway
+                        continue
+                    self._component_suites[key] = ComponentSuiteFile(data)
+                for encoding in encodings:
+                    self._component_suites[key].get(encoding, self.server.config)
 
-        self._generate_scripts_html()
-        self._generate_css_dist_html()
+        if not self._layout_is_function:
+            self._frozen["layout"] = to_json(self._layout_value())
+        self._frozen["dependencies"] = flask.json.dumps(self._callback_list)
+
+        if freeze and hasattr(gc, "freeze"):
+            gc.collect()
+            gc.freeze()
 
     def _add_assets_resource(self, url_path, file_path):
-        res = {"asset_path": url_path, "filepath": file_path}
+        res = {
+            "asset_path": url_path,
+            "filepath": file_path,
+            "hash": content_hash(file_path),
+        }
         if self.config.assets_external_path:
             res["external_url"] = self.get_asset_url(url_path.lstrip("/"))
         self._assets_files.append(file_path)
@@ -1259,11 +1880,12 @@ class Dash(object):
     def csp_hashes(self, hash_algorithm="sha256"):
         """Calculates CSP hashes (sha + base64) of all inline scripts, such that
         one of the biggest benefits of CSP (disallowing general inline scripts)
-        can be utilized together with Dash clientside callbacks (inline scripts).
+        can be utilized together with Dash. The only inline script is the one
+        instantiating the renderer: the JS source of clientside callbacks is
+        served from a separate script, allowed by ``'self'``.
 
-        Calculate these hashes after all inline callbacks are defined,
-        and add them to your CSP headers before starting the server, for example
-        with the flask-talisman package from PyPI:
+        Add these hashes to your CSP headers before starting the server,
+        for example with the flask-talisman package from PyPI:
 
         flask_talisman.Talisman(app.server, content_security_policy={
             "default-src": "'self'",
@@ -1289,7 +1911,7 @@ class Dash(object):
                     method(script.encode("utf-8")).digest()
                 ).decode("utf-8"),
             )
-            for script in self._inline_scripts + [self.renderer]
+            for script in [self.renderer]
         ]
 
     def get_asset_url(self, path):
@@ -1417,6 +2039,13 @@ class Dash(object):
                 get_combined_config(attr, kwargs.get(attr, None), default=default)
             )
 
+        dev_tools.hot_reload_long_poll = get_combined_config(
+            "hot_reload_long_poll", kwargs.get("hot_reload_long_poll", None), False
+        )
+        dev_tools.hot_swap = get_combined_config(
+            "hot_swap", kwargs.get("hot_swap", None), False
+        )
+
         return dev_tools
 
     def enable_dev_tools(
@@ -1431,6 +2060,8 @@ class Dash(object):
         dev_tools_hot_reload_max_retry=None,
         dev_tools_silence_routes_logging=None,
         dev_tools_prune_errors=None,
+        dev_tools_hot_reload_long_poll=None,
+        dev_tools_hot_swap=None,
     ):
         """Activate the dev tools, called by `run_server`. If your application
         is served by wsgi and you want to activate the dev tools, you can call
@@ -1451,6 +2082,8 @@ class Dash(object):
             - DASH_HOT_RELOAD_MAX_RETRY
             - DASH_SILENCE_ROUTES_LOGGING
             - DASH_PRUNE_ERRORS
+            - DASH_HOT_RELOAD_LONG_POLL
+            - DASH_HOT_SWAP
 
         :param debug: Enable/disable all the dev tools unless overridden by the
             arguments or environment variables. Default is ``True`` when
@@ -1501,6 +2134,21 @@ class Dash(object):
             env: ``DASH_PRUNE_ERRORS``
         :type dev_tools_prune_errors: bool
 
+        :param dev_tools_hot_reload_long_poll: Have the client wait on each
+            reload hash request until the hash changes, so reloads start as
+            soon as a change is seen rather than on the next request. Needs
+            a threaded server, as each open page holds a request.
+            Default ``False``. env: ``DASH_HOT_RELOAD_LONG_POLL``
+        :type dev_tools_hot_reload_long_poll: bool
+
+        :param dev_tools_hot_swap: With hot reloading, reload the changed
+            modules of the app in the server process and rebind their
+            callbacks, rather than restarting the server. The server still
+            restarts for the module creating the app, and when the outputs,
+            inputs or state of a callback change. Default ``False``.
+            env: ``DASH_HOT_SWAP``
+        :type dev_tools_hot_swap: bool
+
         :return: debug
         """
         if debug is None:
@@ -1517,6 +2165,8 @@ class Dash(object):
             hot_reload_max_retry=dev_tools_hot_reload_max_retry,
             silence_routes_logging=dev_tools_silence_routes_logging,
             prune_errors=dev_tools_prune_errors,
+            hot_reload_long_poll=dev_tools_hot_reload_long_poll,
+            hot_swap=dev_tools_hot_swap,
         )
 
         if dev_tools.silence_routes_logging:
@@ -1541,17 +2191,56 @@ class Dash(object):
                 for package in packages
             ]
 
+            assets_ignore = self.config.assets_ignore and re.compile(
+                self.config.assets_ignore
+            )
+
+            def on_change(filename, modified, deleted):
+                # `assets_ignore` is for the assets, not the package bundles
+                if (
+                    assets_ignore
+                    and filename.startswith(self.config.assets_folder + os.sep)
+                    and assets_ignore.search(os.path.basename(filename))
+                ):
+                    return
+                self._on_assets_change(filename, modified, deleted)
+
             _reload.watch_thread = threading.Thread(
                 target=lambda: _watch.watch(
                     [self.config.assets_folder] + component_packages_dist,
-                    self._on_assets_change,
+                    on_change,
                     sleep_time=dev_tools.hot_reload_watch_interval,
                 )
             )
             _reload.watch_thread.daemon = True
             _reload.watch_thread.start()
 
+        if dev_tools.hot_reload and dev_tools.hot_swap:
+            self._swappable = _hot_swap.swappable_modules(
+                self, os.path.realpath(flask.helpers.get_root_path(self.config.name))
+            )
+            # only in the process serving the app, not in the reloader
+            if os.getenv("WERKZEUG_RUN_MAIN") == "true":
+                folders = sorted({os.path.dirname(f) for f in self._swappable})
+                _reload = self._hot_reload
+                _reload.swap_thread = threading.Thread(
+                    target=lambda: _watch.watch(
+                        [
+                            folder
+                            for folder in folders
+                            if not any(folder.startswith(f + os.sep) for f in folders)
+                        ],
+                        self._on_module_change,
+                        pattern=r"\.py$",
+                        sleep_time=dev_tools.hot_reload_watch_interval,
+                    )
+                )
+                _reload.swap_thread.daemon = True
+                _reload.swap_thread.start()
+
         if debug and dev_tools.prune_errors:
+            # pylint: disable=import-outside-toplevel
+            from werkzeug.debug.tbtools import get_current_traceback
 
             @self.server.errorhandler(Exception)
             def _wrap_errors(_):
@@ -1612,14 +2301,44 @@ class Dash(object):
                 "This is not supported, switching to serve_locally=True"
             )
 
+        self._index_cache.clear()
+
         return debug
 
+    def _on_module_change(self, filename, modified, deleted):
+        name = self._swappable.get(filename)
+        if name is None:
+            return
+        _reload = self._hot_reload
+        with _reload.lock:
+            try:
+                if deleted:
+                    raise _hot_swap.RestartRequired("{} was deleted".format(filename))
+                hard = _hot_swap.swap(
+                    self, _hot_swap.dependents([name], self._swappable)
+                )
+            except _hot_swap.RestartRequired as e:
+                self.logger.info(" * Restarting, %s", e)
+                # the werkzeug reloader starts a new server on this exit code
+                os._exit(3)  # pylint: disable=protected-access
+
+            if hard is None:
+                return
+            self.logger.info(" * Swapped in %s", filename)
+            _reload.hard = _reload.hard or hard
+            _reload.hash = generate_hash()
+            _reload.changed.notify_all()
+            self._index_cache.clear()
+
     # noinspection PyProtectedMember
     def _on_assets_change(self, filename, modified, deleted):
         _reload = self._hot_reload
         with _reload.lock:
             _reload.hard = True
             _reload.hash = generate_hash()
+            _reload.changed.notify_all()
+            self._index_cache.clear()
+            self._component_suites.clear()
 
             if self.config.assets_folder in filename:
                 asset_path = (
@@ -1639,32 +2358,60 @@ class Dash(object):
                     }
                 )
 
-                if filename not in self._assets_files and not deleted:
+                ignore_str = self.config.assets_ignore
+                ignored = ignore_str and re.search(
+                    ignore_str, os.path.basename(filename)
+                )
+
+                if filename not in self._assets_files and not deleted and not ignored:
                     res = self._add_assets_resource(asset_path, filename)
                     if filename.endswith("js"):
                         self.scripts.append_script(res)
                     elif filename.endswith("css"):
                         self.css.append_css(res)
+                elif not deleted:
+                    # pylint: disable=protected-access
+                    for resources in (self.scripts._resources, self.css._resources):
+                        for r in resources._resources:
+                            if r.get("filepath") == filename:
+                                r["hash"] = content_hash(filename)
+                                resources.version += 1
 
                 if deleted:
                     if filename in self._assets_files:
                         self._assets_files.remove(filename)
 
                     def delete_resource(resources):
-                        to_delete = None
-                        for r in resources:
+                        # pylint: disable=protected-access
+                        for r in resources._resources:
                             if r.get("asset_path") == asset_path:
-                                to_delete = r
+                                resources.remove_resource(r)
                                 break
-                        if to_delete:
-                            resources.remove(to_delete)
 
                     if filename.endswith("js"):
                         # pylint: disable=protected-access
-                        delete_resource(self.scripts._resources._resources)
+                        delete_resource(self.scripts._resources)
                     elif filename.endswith("css"):
                         # pylint: disable=protected-access
-                        delete_resource(self.css._resources._resources)
+                        delete_resource(self.css._resources)
+
+    def export_static(self, path, input_values=None):
+        """Write the app to the directory ``path``, for a static web server
+        to host it at ``requests_pathname_prefix``: the index page with the
+        layout and callback list, the component suites, the assets, and the
+        precomputed results of the server callbacks.
+
+        :param path: The directory to write the app to.
+        :type path: string
+        :param input_values: Maps ``"<id>.<property>"`` to the values that
+            callback input or state can take besides its value in the layout.
+            Each server callback is computed for every combination of the
+            values of its inputs and state, when they are all known, and the
+            renderer resolves the callbacks from these results. The other
+            callbacks fail without a server.
+        :type input_values: dict
+        """
+        _static_export.export_static(self, path, input_values)
 
     def run_server(
         self,
@@ -1681,10 +2428,20 @@ class Dash(object):
         dev_tools_hot_reload_max_retry=None,
         dev_tools_silence_routes_logging=None,
         dev_tools_prune_errors=None,
+        dev_tools_hot_reload_long_poll=None,
+        dev_tools_hot_swap=None,
+        workers=None,
+        threads=None,
+        max_requests=None,
+        max_rss_growth=None,
         **flask_run_options,
     ):
-        """Start the flask server in local mode, you should not run this on a
-        production server, use gunicorn/waitress instead.
+        """Start the flask server in local mode, or with ``workers`` or
+        ``threads`` in production mode: the app is warmed up (see ``warmup``)
+        and served by worker processes forked from this one, sharing its
+        listening socket. SIGHUP replaces the workers without dropping
+        requests, SIGINT and SIGTERM stop them once their requests are done.
+        Production mode needs ``os.fork``, so it isn't available on Windows.
 
         If a parameter can be set by an environment variable, that is listed
         too. Values provided here take precedence over environment variables.
@@ -1758,7 +2515,42 @@ class Dash(object):
             env: ``DASH_PRUNE_ERRORS``
         :type dev_tools_prune_errors: bool
 
-        :param flask_run_options: Given to `Flask.run`
+        :param dev_tools_hot_reload_long_poll: Have the client wait on each
+            reload hash request until the hash changes, so reloads start as
+            soon as a change is seen rather than on the next request. Needs
+            a threaded server, as each open page holds a request.
+            Default ``False``. env: ``DASH_HOT_RELOAD_LONG_POLL``
+        :type dev_tools_hot_reload_long_poll: bool
+
+        :param dev_tools_hot_swap: With hot reloading, reload the changed
+            modules of the app in the server process and rebind their
+            callbacks, rather than restarting the server. The server still
+            restarts for the module creating the app, and when the outputs,
+            inputs or state of a callback change. Default ``False``.
+            env: ``DASH_HOT_SWAP``
+        :type dev_tools_hot_swap: bool
+
+        :param workers: The number of worker processes serving the app in
+            production mode. Default 1 with ``threads``. env: ``DASH_WORKERS``
+        :type workers: int
+
+        :param threads: The number of requests each worker handles at a time
+            in production mode. Default 1 with ``workers``.
+            env: ``DASH_THREADS``
+        :type threads: int
+
+        :param max_requests: Replace each worker after it has served this
+            many requests, to bound the memory it leaks. Default ``None``,
+            keeping the workers. env: ``DASH_MAX_REQUESTS``
+        :type max_requests: int
+
+        :param max_rss_growth: Replace each worker once its resident memory
+            has grown by this many megabytes since it started.
+            Default ``None``. env: ``DASH_MAX_RSS_GROWTH``
+        :type max_rss_growth: float
+
+        :param flask_run_options: Given to `Flask.run`, only ``ssl_context``
+            is supported in production mode.
 
         :return:
         """
@@ -1773,8 +2565,24 @@ class Dash(object):
             dev_tools_hot_reload_max_retry,
             dev_tools_silence_routes_logging,
             dev_tools_prune_errors,
+            dev_tools_hot_reload_long_poll,
+            dev_tools_hot_swap,
         )
 
+        workers = get_combined_config("workers", workers)
+        threads = get_combined_config("threads", threads)
+        production = workers is not None or threads is not None
+        if production:
+            if debug:
+                raise InvalidConfig("Production mode can't be used with debug")
+            unsupported = set(flask_run_options) - {"ssl_context"}
+            if unsupported:
+                raise InvalidConfig(
+                    "Production mode doesn't support {}".format(
+                        ", ".join(sorted(unsupported))
+                    )
+                )
+
         # Verify port value
         try:
             port = int(port)
@@ -1827,6 +2635,28 @@ class Dash(object):
 
             self.logger.info("Dash is running on %s://%s%s%s\n", *display_url)
 
+        if production:
+            # pylint: disable=import-outside-toplevel
+            from . import _prefork
+
+            max_requests = get_combined_config("max_requests", max_requests)
+            max_rss_growth = get_combined_config("max_rss_growth", max_rss_growth)
+            self.warmup()
+            _prefork.serve(
+                self.server,
+                host,
+                port,
+                int(workers or 1),
+                int(threads or 1),
+                max_requests=int(max_requests) if max_requests else None,
+                max_rss_growth=(
+                    int(float(max_rss_growth) * 1024 * 1024) if max_rss_growth else None
+                ),
+                ssl_context=flask_run_options.get("ssl_context"),
+                logger=self.logger,
+            )
+            return
+
         if self.config.extra_hot_reload_paths:
             extra_files = flask_run_options["extra_files"] = []
             for path in self.config.extra_hot_reload_paths:
@@ -1837,4 +2667,12 @@ class Dash(object):
                 elif os.path.isfile(path):
                     extra_files.append(path)
 
+        if (
+            self._swappable
+            and int(getattr(werkzeug, "__version__", "2").split(".")[0]) >= 2
+        ):
+            # their changes are swapped in without restarting the server,
+            # before Werkzeug 2.0 the reloader restarts it anyway
+            flask_run_options.setdefault("exclude_patterns", list(self._swappable))
+
         self.server.run(host=host, port=port, debug=debug, **flask_run_options)
@@ -0,0 +1,285 @@
+"""Datasets shared by the worker processes of an app.
+
+Each version of a dataset is written once to a file of the registry folder,
+and the workers memory-map it read-only, so they all use the same pages
+rather than a copy each. On a ``tmpfs`` folder (like ``/dev/shm``) the pages
+are shared memory, otherwise they are the page cache of the file::
+
+    from dash.datasets import Registry
+
+    datasets = Registry("/dev/shm/my-app")
+    datasets.register("prices", lambda: pandas.read_parquet("prices.parquet"))
+
+    @app.callback(...)
+    def update(...):
+        prices = datasets["prices"]
+
+A dataset can be ``bytes``, a NumPy array, a mapping of names to arrays or a
+pandas DataFrame (both read back as a dict of arrays), or a pyarrow Table or
+RecordBatch (read back as a Table).
+"""
+import collections.abc
+import contextlib
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+import threading
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+_MAGIC = b"DASHDATA"
+_header_length = struct.Struct("<Q")
+# the buffers start on cache line boundaries
+_ALIGN = 64
+_NAME = re.compile(r"^[A-Za-z0-9_-]+$")
+
+
+def _check_name(name):
+    if not _NAME.match(name):
+        raise ValueError(
+            "Dataset names can only have letters, digits, _ and -, "
+            "not {}.".format(repr(name))
+        )
+
+
+def _aligned(offset):
+    return -(-offset // _ALIGN) * _ALIGN
+
+
+def _array_buffer(numpy, array):
+    if array.dtype.hasobject or numpy.dtype(array.dtype.str) != array.dtype:
+        raise ValueError(
+            "Arrays of {} can't be shared, use a pyarrow Table for them.".format(
+                array.dtype
+            )
+        )
+    meta = {"dtype": array.dtype.str, "shape": list(array.shape)}
+    array = numpy.ascontiguousarray(array).reshape(-1)
+    return meta, memoryview(array.view(numpy.uint8))
+
+
+def _buffers(data):
+    """The kind of `data` and its buffers, as [(meta, memoryview)]. The
+    libraries it may come from are only used if the app imported them."""
+    numpy = sys.modules.get("numpy")
+    pandas = sys.modules.get("pandas")
+    pyarrow = sys.modules.get("pyarrow")
+
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return "bytes", [({}, memoryview(data).cast("B"))]
+
+    if numpy is not None and isinstance(data, numpy.ndarray):
+        return "array", [_array_buffer(numpy, data)]
+
+    if pyarrow is not None and isinstance(data, (pyarrow.Table, pyarrow.RecordBatch)):
+        sink = pyarrow.BufferOutputStream()
+        with pyarrow.ipc.new_file(sink, data.schema) as writer:
+            writer.write(data)
+        return "arrow", [({}, memoryview(sink.getvalue()))]
+
+    if pandas is not None and isinstance(data, pandas.DataFrame):
+        data = {name: data[name].to_numpy() for name in data.columns}
+
+    if numpy is not None and isinstance(data, collections.abc.Mapping):
+        buffers = []
+        for name, column in data.items():
+            meta, buffer = _array_buffer(numpy, numpy.asarray(column))
+            meta["name"] = str(name)
+            buffers.append((meta, buffer))
+        return "columns", buffers
+
+    raise TypeError(
+        "A dataset can be bytes, a NumPy array, a mapping of arrays, "
+        "a pandas DataFrame or a pyarrow Table, not {}.".format(type(data).__name__)
+    )
+
+
+def _write(path, kind, buffers):
+    metas = []
+    end = 0
+    for meta, buffer in buffers:
+        metas.append(dict(meta, offset=end, nbytes=buffer.nbytes))
+        end = _aligned(end + buffer.nbytes)
+
+    header = json.dumps({"kind": kind, "buffers": metas}).encode("utf-8")
+    start = _aligned(len(_MAGIC) + _header_length.size + len(header))
+    with open(path, "wb") as f:
+        f.write(_MAGIC + _header_length.pack(len(header)) + header)
+        for meta, (_, buffer) in zip(metas, buffers):
+            f.seek(start + meta["offset"])
+            f.write(buffer)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _attach(path):
+    with open(path, "rb") as f:
+        view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    if view[: len(_MAGIC)] != _MAGIC:
+        raise ValueError("{} is not a dataset file.".format(path))
+    header_start = len(_MAGIC) + _header_length.size
+    (length,) = _header_length.unpack_from(view, len(_MAGIC))
+    header = json.loads(bytes(view[header_start : header_start + length]))
+    start = _aligned(header_start + length)
+    buffers = [
+        (meta, view[start + meta["offset"] : start + meta["offset"] + meta["nbytes"]])
+        for meta in header["buffers"]
+    ]
+
+    kind = header["kind"]
+    if kind == "bytes":
+        return buffers[0][1]
+
+    # pylint: disable=import-outside-toplevel
+    if kind == "arrow":
+        import pyarrow
+
+        return pyarrow.ipc.open_file(pyarrow.py_buffer(buffers[0][1])).read_all()
+
+    import numpy
+
+    arrays = [
+        numpy.frombuffer(buffer, dtype=meta["dtype"]).reshape(meta["shape"])
+        for meta, buffer in buffers
+    ]
+    if kind == "array":
+        return arrays[0]
+    return {meta["name"]: array for (meta, _), array in zip(buffers, arrays)}
+
+
+class Registry:
+    """The datasets published in the folder `path`, shared by the processes
+    using it.
+
+    A dataset is published once, by the first process asking for it or by
+    ``publish``, and each process then maps the current version of it
+    read-only, without copying it. Publishing a new version replaces the
+    file of the previous one atomically: each process switches to it the
+    next time it asks for the dataset, and the previous version is freed
+    once the processes still using it let it go, so a refresh doesn't keep
+    a copy per worker. A process that doesn't ask for the dataset again
+    keeps the previous version mapped until it calls ``release``, from a
+    ``before_request`` hook or a periodic job for instance. Without ``fcntl`` (on Windows) concurrent processes
+    may each load a missing dataset, the last one published being kept.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        self._loaders = {}
+        # {name: (pointer stat, version, value)}
+        self._attached = {}
+        self._lock = threading.Lock()
+
+    def _file(self, name, version=None):
+        _check_name(name)
+        if version is None:
+            return os.path.join(self.path, name + ".current")
+        return os.path.join(self.path, "{}.{}.dash-dataset".format(name, version))
+
+    @contextlib.contextmanager
+    def _locked(self, name):
+        _check_name(name)
+        with open(os.path.join(self.path, name + ".lock"), "a") as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            yield
+
+    def register(self, name, loader):
+        """Have `loader()` load the dataset `name` when no process published
+        it yet, or when it is refreshed."""
+        _check_name(name)
+        self._loaders[name] = loader
+
+    def version(self, name):
+        """The version of the dataset `name` published last, or None."""
+        try:
+            with open(self._file(name)) as f:
+                return int(f.read())
+        except FileNotFoundError:
+            return None
+
+    def publish(self, name, data):
+        """Publish `data` as the next version of the dataset `name`, and
+        return that version."""
+        with self._locked(name):
+            return self._publish(name, data)
+
+    def _publish(self, name, data):
+        kind, buffers = _buffers(data)
+        version = (self.version(name) or 0) + 1
+        path = self._file(name, version)
+        temp = "{}.{}.tmp".format(path, os.getpid())
+        _write(temp, kind, buffers)
+        os.replace(temp, path)
+
+        pointer = self._file(name)
+        temp = "{}.{}.tmp".format(pointer, os.getpid())
+        with open(temp, "w") as f:
+            f.write(str(version))
+        os.replace(temp, pointer)
+
+        pattern = re.compile(r"^{}\.(\d+)\.dash-dataset$".format(re.escape(name)))
+        for filename in os.listdir(self.path):
+            match = pattern.match(filename)
+            if match and int(match.group(1)) < version:
+                try:
+                    # the processes still mapping it keep it until they let go
+                    os.remove(os.path.join(self.path, filename))
+                except OSError:
+                    pass
+        return version
+
+    def refresh(self, name):
+        """Load and publish a new version of the dataset `name`, and return
+        that version."""
+        data = self._loaders[name]()
+        return self.publish(name, data)
+
+    def get(self, name):
+        """The current version of the dataset `name`, read-only. It is
+        loaded and published first if no process did it yet."""
+        while True:
+            try:
+                stat = os.stat(self._file(name))
+            except FileNotFoundError:
+                if name not in self._loaders:
+                    raise KeyError(name) from None
+                with self._locked(name):
+                    if self.version(name) is None:
+                        self._publish(name, self._loaders[name]())
+                continue
+
+            key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+            with self._lock:
+                attached = self._attached.get(name)
+                if attached is not None and attached[0] == key:
+                    return attached[2]
+                version = self.version(name)
+                try:
+                    value = _attach(self._file(name, version))
+                except FileNotFoundError:
+                    # replaced in between, by a newer version
+                    continue
+                self._attached[name] = (key, version, value)
+                return value
+
+    __getitem__ = get
+
+    def release(self, name=None):
+        """Let go of the versions mapped by this process that were replaced
+        since, of the dataset `name` or of all of them. Their memory is freed
+        once nothing else in the process uses them."""
+        with self._lock:
+            names = list(self._attached) if name is None else [name]
+            for attached in names:
+                entry = self._attached.get(attached)
+                if entry is not None and entry[1] != self.version(attached):
+                    del self._attached[attached]
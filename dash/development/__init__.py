@@ -1,2 +1,16 @@
+import importlib as _importlib
+import sys as _sys
+
 from . import base_component  # noqa:F401
-from . import component_loader  # noqa:F401
+
+
+def __getattr__(name):
+    # imported when first used rather than with dash, most apps never do
+    if name == "component_loader":
+        return _importlib.import_module(__name__ + "." + name)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+if _sys.version_info < (3, 7):
+    # no module __getattr__
+    from . import component_loader  # noqa:F401,E402
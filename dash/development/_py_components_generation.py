@@ -1,5 +1,8 @@
 from collections import OrderedDict
 import copy
+import functools
+import hashlib
+import json
 import os
 from textwrap import fill
 
@@ -7,6 +10,7 @@ from dash.development.base_component import _explicitize_args
 from dash.exceptions import NonExistentEventException
 from ._all_keywords import python_keywords
 from .base_component import Component
+from ..version import __version__
 
 
 # pylint: disable=unused-argument
@@ -41,16 +45,17 @@ def generate_class_string(typename, props, description, namespace):
     # not all component authors will supply those.
     c = '''class {typename}(Component):
     """{docstring}"""
+    _prop_names = {list_of_valid_keys}
+    _type = '{typename}'
+    _namespace = '{namespace}'
+    _valid_wildcard_attributes =\
+        {list_of_valid_wildcard_attr_prefixes}
+    available_properties = {list_of_valid_keys}
+    available_wildcard_properties =\
+        {list_of_valid_wildcard_attr_prefixes}
+
     @_explicitize_args
     def __init__(self, {default_argtext}):
-        self._prop_names = {list_of_valid_keys}
-        self._type = '{typename}'
-        self._namespace = '{namespace}'
-        self._valid_wildcard_attributes =\
-            {list_of_valid_wildcard_attr_prefixes}
-        self.available_properties = {list_of_valid_keys}
-        self.available_wildcard_properties =\
-            {list_of_valid_wildcard_attr_prefixes}
         _explicit_args = kwargs.pop('_explicit_args')
         _locals = locals()
         _locals.update(kwargs)  # For wildcard attrs
@@ -133,30 +138,152 @@ def generate_class_file(typename, props, description, namespace):
     print("Generated {}".format(file_name))
 
 
-def generate_imports(project_shortname, components):
-    with open(os.path.join(project_shortname, "_imports_.py"), "w") as f:
-        imports_string = "{}\n\n{}".format(
-            "\n".join("from .{0} import {0}".format(x) for x in components),
-            "__all__ = [\n{}\n]".format(
-                ",\n".join('    "{}"'.format(x) for x in components)
-            ),
+_lazy_imports_template = """# AUTO GENERATED FILE - DO NOT EDIT
+
+import importlib as _importlib
+import sys as _sys
+
+from dash.development.base_component import ComponentRegistry as _ComponentRegistry
+
+__all__ = [
+{all}
+]
+
+_package = __name__.rpartition(".")[0]
+
+# the component modules are imported when first used, the package's
+# resources are served whatever the components used
+_ComponentRegistry.registry.add(_package.split(".")[0])
+
+
+def __getattr__(name):
+    if name not in __all__:
+        raise AttributeError(
+            "module {{!r}} has no attribute {{!r}}".format(_package, name)
         )
+    component = getattr(_importlib.import_module("." + name, _package), name)
+    # importing the module set it as the package attribute
+    setattr(_sys.modules[_package], name, component)
+    return component
+
+
+def __dir__():
+    return sorted(set(vars(_sys.modules[_package])) | set(__all__))
+
+
+if _sys.version_info < (3, 7):
+    # no module __getattr__, import them all
+    for _name in __all__:
+        __getattr__(_name)
+"""
+
+
+def generate_imports(project_shortname, components, lazy=False):
+    """Write the `_imports_.py` of the package, importing all the components.
+
+    With `lazy`, it defines `__getattr__` and `__dir__` for the package,
+    which imports them from `_imports_` along with `__all__`, rather than
+    with `*`, so each component module is imported when first used.
+    """
+    with open(os.path.join(project_shortname, "_imports_.py"), "w") as f:
+        if lazy:
+            imports_string = _lazy_imports_template.format(
+                all=",\n".join('    "{}"'.format(x) for x in components)
+            )
+        else:
+            imports_string = "{}\n\n{}".format(
+                "\n".join("from .{0} import {0}".format(x) for x in components),
+                "__all__ = [\n{}\n]".format(
+                    ",\n".join('    "{}"'.format(x) for x in components)
+                ),
+            )
 
         f.write(imports_string)
 
 
-def generate_classes_files(project_shortname, metadata, *component_generators):
+def _generator_key(generator):
+    # what a generator writes depends on its function and arguments
+    if isinstance(generator, functools.partial):
+        return [
+            _generator_key(generator.func),
+            [repr(arg) for arg in generator.args],
+            {k: repr(v) for k, v in generator.keywords.items()},
+        ]
+    return "{}.{}".format(generator.__module__, generator.__qualname__)
+
+
+def component_hash(component_data, component_generators):
+    """Hash of the metadata of a component and of the generators writing it,
+    for `generate_classes_files` to skip the components already written."""
+    key = [
+        __version__,
+        component_data,
+        [_generator_key(generator) for generator in component_generators],
+    ]
+    # not sorted, the order of the props is the order of the arguments
+    return hashlib.sha1(json.dumps(key).encode("utf-8")).hexdigest()
+
+
+def _generate_component(
+    component_name, component_data, project_shortname, component_generators
+):
+    for generator in component_generators:
+        generator(
+            component_name,
+            component_data["props"],
+            component_data["description"],
+            project_shortname,
+        )
+
+
+def generate_classes_files(
+    project_shortname, metadata, *component_generators, cache=None, jobs=1
+):
+    """Run the generators for each component of `metadata`.
+
+    `cache` maps component paths to their `component_hash` when they were
+    last generated, the components whose hash didn't change are skipped.
+    It is updated with the new hashes.
+
+    With `jobs` > 1 the components are generated in that many processes.
+
+    Returns the names of all the components.
+    """
     components = []
+    pending = []
     for component_path, component_data in metadata.items():
         component_name = component_path.split("/")[-1].split(".")[0]
         components.append(component_name)
 
-        for generator in component_generators:
-            generator(
-                component_name,
-                component_data["props"],
-                component_data["description"],
-                project_shortname,
+        if cache is not None:
+            key = component_hash(component_data, component_generators)
+            if cache.get(component_path) == key:
+                continue
+            cache[component_path] = key
+        pending.append((component_name, component_data))
+
+    if jobs > 1 and len(pending) > 1:
+        # multiprocessing is slow to import, dash imports this module
+        # pylint: disable=import-outside-toplevel
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(min(jobs, len(pending))) as pool:
+            futures = [
+                pool.submit(
+                    _generate_component,
+                    component_name,
+                    component_data,
+                    project_shortname,
+                    component_generators,
+                )
+                for component_name, component_data in pending
+            ]
+            for future in futures:
+                future.result()
+    else:
+        for component_name, component_data in pending:
+            _generate_component(
+                component_name, component_data, project_shortname, component_generators
             )
 
     return components
@@ -173,10 +300,22 @@ def generate_class(typename, props, description, namespace):
     Returns
     -------
     """
+    return class_from_code(
+        typename, generate_class_code(typename, props, description, namespace)
+    )
+
+
+def generate_class_code(typename, props, description, namespace):
+    """The compiled code of the class string, for `class_from_code`."""
     string = generate_class_string(typename, props, description, namespace)
+    return compile(string, "<string>", "exec")
+
+
+def class_from_code(typename, code):
+    """The class `typename` defined by `code`."""
     scope = {"Component": Component, "_explicitize_args": _explicitize_args}
     # pylint: disable=exec-used
-    exec(string, scope)
+    exec(code, scope)
     result = scope[typename]
     return result
 
@@ -1,7 +1,6 @@
 import abc
 import inspect
 import sys
-from future.utils import with_metaclass
 
 from .._utils import patch_collections_abc, _strings, stringify_id
 
@@ -15,15 +14,37 @@ class ComponentRegistry:
     registry = set()
 
     @classmethod
-    def get_resources(cls, resource_name):
+    def get_resources(cls, resource_name, namespaces=None):
         resources = []
 
         for module_name in cls.registry:
+            if namespaces is not None and module_name not in namespaces:
+                continue
             module = sys.modules[module_name]
             resources.extend(getattr(module, resource_name, []))
 
         return resources
 
+    @classmethod
+    def namespaces(cls):
+        """Map the `_namespace` of each component class, which the renderer
+        knows the components by, to the module of the registry holding its
+        resources. The name of each package maps to itself too, for the
+        classes generated before `_namespace` was a class attribute: they
+        set it in `__init__`, to the name of their package."""
+        namespaces = {}
+        classes = list(Component.__subclasses__())
+        while classes:
+            component = classes.pop()
+            classes.extend(component.__subclasses__())
+            module = component.__module__.split(".")[0]
+            namespace = getattr(component, "_namespace", None)
+            if module in cls.registry and isinstance(namespace, str):
+                namespaces.setdefault(namespace, module)
+        for module in cls.registry:
+            namespaces[module] = module
+        return namespaces
+
 
 class ComponentMeta(abc.ABCMeta):
 
@@ -50,16 +71,132 @@ def is_number(s):
         return False
 
 
-def _check_if_has_indexable_children(item):
-    if not hasattr(item, "children") or (
-        not isinstance(item.children, Component)
-        and not isinstance(item.children, (tuple, MutableSequence))
-    ):
+def _child_items(component):
+    children = getattr(component, "children", None)
+    if isinstance(children, Component):
+        return (children,)
+    if isinstance(children, (tuple, MutableSequence)):
+        return children
+    return ()
+
+
+def _child_at(parent, position):
+    children = getattr(parent, "children", None)
+    if position is None:
+        return children
+    if isinstance(children, (tuple, MutableSequence)) and position < len(children):
+        return children[position]
+    return None
+
+
+class _IdIndex(object):
+    """Index of the components with an ID in the tree of children of `root`.
+
+    `ids` maps each stringified ID to the first component carrying it in
+    depth-first order. `locations` maps every component in the tree
+    (by object identity) to its parent and its position in the parent's
+    children, `None` if the parent's children is a single component.
+
+    Before an entry is used, the path from its component up to the root is
+    checked against the tree. A component moved or removed without going
+    through the mapping interface of the root is detected that way and the
+    index is rebuilt. Components added that way are not: if one of them
+    repeats an ID earlier in the tree, the component found is the indexed
+    one rather than the first in traversal order. IDs are unique in a valid
+    layout, so that only matters for layouts `validate_layout` rejects.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.ids = {}
+        self.locations = {}
+        self._add_children(root)
+
+    def _add(self, component, parent, position):
+        self.locations[id(component)] = (component, parent, position)
+        key = stringify_id(getattr(component, "id", None))
+        if isinstance(key, _strings):
+            self.ids.setdefault(key, component)
+
+    @staticmethod
+    def _children_of(parent):
+        children = getattr(parent, "children", None)
+        if isinstance(children, Component):
+            return [(children, parent, None)]
+        if isinstance(children, (tuple, MutableSequence)):
+            return [
+                (c, parent, i)
+                for i, c in enumerate(children)
+                if isinstance(c, Component)
+            ]
+        return []
+
+    def _add_children(self, component):
+        # depth-first, in the same order as `Component._traverse`
+        stack = self._children_of(component)[::-1]
+        while stack:
+            child, parent, position = stack.pop()
+            self._add(child, parent, position)
+            stack.extend(self._children_of(child)[::-1])
+
+    def add(self, component, parent, position):
+        if isinstance(component, Component):
+            self._add(component, parent, position)
+            self._add_children(component)
+
+    def remove(self, component):
+        stack = [component]
+        while stack:
+            item = stack.pop()
+            if not isinstance(item, Component):
+                continue
+            self.locations.pop(id(item), None)
+            key = stringify_id(getattr(item, "id", None))
+            if isinstance(key, _strings) and self.ids.get(key) is item:
+                del self.ids[key]
+            children = getattr(item, "children", None)
+            if isinstance(children, (tuple, MutableSequence)):
+                stack.extend(children)
+            else:
+                stack.append(children)
+
+    def shift(self, parent, start):
+        """Update the positions of the children of `parent` from `start` on,
+        after an item was removed before them."""
+        for position, child in enumerate(parent.children[start:], start):
+            location = self.locations.get(id(child))
+            if location and location[0] is child and location[1] is parent:
+                self.locations[id(child)] = (child, parent, position)
+
+    def parent(self, component):
+        """Return the parent of an indexed component and its position."""
+        _, parent, position = self.locations[id(component)]
+        return parent, position
+
+    def find(self, id_):
+        key = stringify_id(id_)
+        try:
+            component = self.ids.get(key)
+        except TypeError:
+            # unhashable, can't be an ID
+            return None
+        if component is None or stringify_id(getattr(component, "id", None)) != key:
+            return None
+
+        item = component
+        while item is not self.root:
+            location = self.locations.get(id(item))
+            if location is None or location[0] is not item:
+                return None
+            _, parent, position = location
+            if _child_at(parent, position) is not item:
+                return None
+            item = parent
 
-        raise KeyError
+        return component
 
 
-class Component(with_metaclass(ComponentMeta, object)):
+class Component(metaclass=ComponentMeta):
     class _UNDEFINED(object):
         def __repr__(self):
             return "undefined"
@@ -168,82 +305,68 @@ class Component(with_metaclass(ComponentMeta, object)):
 
         return as_json
 
-    # pylint: disable=too-many-branches, too-many-return-statements
+    # ID index of the tree of children, built on the first lookup by ID
+    _id_index = None
+
+    def __getstate__(self):
+        # The ID index is derived data, don't copy or pickle it
+        state = self.__dict__.copy()
+        state.pop("_id_index", None)
+        return state
+
+    # pylint: disable=redefined-builtin
+    def _find_in_index(self, id):
+        index = self._id_index
+        component = index.find(id) if index is not None else None
+        if component is None:
+            # Not indexed yet, or the tree was changed outside of the
+            # mapping interface: (re)build the index
+            # pylint: disable=attribute-defined-outside-init
+            index = self._id_index = _IdIndex(self)
+            component = index.find(id)
+            if component is None:
+                raise KeyError(id)
+        return index, component
+
     # pylint: disable=redefined-builtin, inconsistent-return-statements
     def _get_set_or_delete(self, id, operation, new_item=None):
-        _check_if_has_indexable_children(self)
-
-        # pylint: disable=access-member-before-definition,
-        # pylint: disable=attribute-defined-outside-init
-        if isinstance(self.children, Component):
-            if getattr(self.children, "id", None) is not None:
-                # Woohoo! It's the item that we're looking for
-                if self.children.id == id:
-                    if operation == "get":
-                        return self.children
-                    elif operation == "set":
-                        self.children = new_item
-                        return
-                    elif operation == "delete":
-                        self.children = None
-                        return
-
-            # Recursively dig into its subtree
-            try:
-                if operation == "get":
-                    return self.children.__getitem__(id)
-                elif operation == "set":
-                    self.children.__setitem__(id, new_item)
-                    return
-                elif operation == "delete":
-                    self.children.__delitem__(id)
-                    return
-            except KeyError:
-                pass
-
-        # if children is like a list
-        if isinstance(self.children, (tuple, MutableSequence)):
-            for i, item in enumerate(self.children):
-                # If the item itself is the one we're looking for
-                if getattr(item, "id", None) == id:
-                    if operation == "get":
-                        return item
-                    elif operation == "set":
-                        self.children[i] = new_item
-                        return
-                    elif operation == "delete":
-                        del self.children[i]
-                        return
-
-                # Otherwise, recursively dig into that item's subtree
-                # Make sure it's not like a string
-                elif isinstance(item, Component):
-                    try:
-                        if operation == "get":
-                            return item.__getitem__(id)
-                        elif operation == "set":
-                            item.__setitem__(id, new_item)
-                            return
-                        elif operation == "delete":
-                            item.__delitem__(id)
-                            return
-                    except KeyError:
-                        pass
-
-        # The end of our branch
-        # If we were in a list, then this exception will get caught
-        raise KeyError(id)
+        index, component = self._find_in_index(id)
+
+        if operation == "get":
+            return component
+
+        parent, position = index.parent(component)
+        if operation == "set":
+            if position is None:
+                parent.children = new_item
+            else:
+                parent.children[position] = new_item
+            index.remove(component)
+            index.add(new_item, parent, position)
+        elif operation == "delete":
+            if position is None:
+                parent.children = None
+            else:
+                del parent.children[position]
+                index.shift(parent, position)
+            index.remove(component)
 
     # Magic methods for a mapping interface:
     # - __getitem__
     # - __setitem__
     # - __delitem__
+    # - __contains__
     # - __iter__
     # - __len__
 
     def __getitem__(self, id):  # pylint: disable=redefined-builtin
         """Recursively find the element with the given ID through the tree of
-        children."""
+        children.
+
+        IDs are looked up in an index of the tree, built on the first lookup
+        and kept up to date by `__setitem__`, `__delitem__` and `update_many`.
+        Dict IDs can also be given in their string form, see `stringify_id`.
+        """
 
         # A component's children can be undefined, a string, another component,
         # or a list of components.
@@ -257,41 +380,84 @@ class Component(with_metaclass(ComponentMeta, object)):
         """Delete items by ID in the tree of children."""
         return self._get_set_or_delete(id, "delete")
 
+    def __contains__(self, id):  # pylint: disable=redefined-builtin
+        """Check if an element with the given ID is in the tree of children."""
+        try:
+            self._find_in_index(id)
+        except KeyError:
+            return False
+        return True
+
+    def update_many(self, items):
+        """Set many elements by their IDs with a single search of the tree.
+
+        All the IDs must be in the tree before the update: if any of them is
+        missing, `KeyError` is raised and nothing is changed. Items are then
+        set in order, as with `__setitem__`.
+
+        :param items: A dict of `{id: new_item}`, or an iterable of
+            `(id, new_item)` pairs.
+        """
+        items = list(items.items() if isinstance(items, dict) else items)
+        for id_, _ in items:
+            self._find_in_index(id_)
+        for id_, item in items:
+            self._get_set_or_delete(id_, "set", item)
+
     def _traverse(self):
-        """Yield each item in the tree."""
-        for t in self._traverse_with_paths():
-            yield t[1]
+        """Yield each item in the tree, depth first."""
+        stack = [iter(_child_items(self))]
+        while stack:
+            for item in stack[-1]:
+                yield item
+                if isinstance(item, Component):
+                    stack.append(iter(_child_items(item)))
+                    break
+            else:
+                stack.pop()
 
     @staticmethod
     def _id_str(component):
         id_ = stringify_id(getattr(component, "id", ""))
         return id_ and " (id={:s})".format(id_)
 
-    def _traverse_with_paths(self):
-        """Yield each item with its path in the tree."""
-        children = getattr(self, "children", None)
-        children_type = type(children).__name__
-        children_string = children_type + self._id_str(children)
+    @classmethod
+    def _child_paths(cls, component, prefix):
+        children = getattr(component, "children", None)
 
         # children is just a component
         if isinstance(children, Component):
-            yield "[*] " + children_string, children
-            # pylint: disable=protected-access
-            for p, t in children._traverse_with_paths():
-                yield "\n".join(["[*] " + children_string, p]), t
+            path = "[*] " + type(children).__name__ + cls._id_str(children)
+            yield prefix + path, children
 
         # children is a list of components
         elif isinstance(children, (tuple, MutableSequence)):
             for idx, i in enumerate(children):
-                list_path = "[{:d}] {:s}{}".format(
-                    idx, type(i).__name__, self._id_str(i)
-                )
-                yield list_path, i
+                path = "[{:d}] {:s}{}".format(idx, type(i).__name__, cls._id_str(i))
+                yield prefix + path, i
 
-                if isinstance(i, Component):
-                    # pylint: disable=protected-access
-                    for p, t in i._traverse_with_paths():
-                        yield "\n".join([list_path, p]), t
+    def _traverse_with_paths(self):
+        """Yield each item with its path in the tree.
+
+        Paths are only needed to report errors: use `_traverse` to walk the
+        tree, then `_get_path` to find the path of the offending item.
+        """
+        stack = [self._child_paths(self, "")]
+        while stack:
+            for path, item in stack[-1]:
+                yield path, item
+                if isinstance(item, Component):
+                    stack.append(self._child_paths(item, path + "\n"))
+                    break
+            else:
+                stack.pop()
+
+    def _get_path(self, item):
+        """Return the path of `item` in the tree, as in `_traverse_with_paths`."""
+        for path, t in self._traverse_with_paths():
+            if t is item:
+                return path
+        raise KeyError(item)
 
     def _traverse_ids(self):
         """Yield components with IDs in the tree of children."""
@@ -6,10 +6,12 @@ import json
 import string
 import shutil
 import logging
+from concurrent.futures import ThreadPoolExecutor
+
 import coloredlogs
 import fire
 
-from .._utils import run_command_with_process, compute_md5, job
+from .._utils import run_command_with_process, compute_digests, compute_sri, job
 
 logger = logging.getLogger(__name__)
 coloredlogs.install(
@@ -89,18 +91,23 @@ class BuildProcess(object):
 
         payload = {self.name: self.version}
 
+        copies = []
         for folder in (self.deps_folder, self.build_folder):
-            copies = tuple(
+            in_folder = tuple(
                 _
                 for _ in os.listdir(folder)
                 if os.path.splitext(_)[-1] in {".js", ".map"}
             )
-            logger.info("bundles in %s %s", folder, copies)
+            logger.info("bundles in %s %s", folder, in_folder)
+            copies.extend((copy, self._concat(folder, copy)) for copy in in_folder)
 
-            for copy in copies:
-                payload["MD5 ({})".format(copy)] = compute_md5(
-                    self._concat(folder, copy)
-                )
+        # hashlib releases the GIL on large updates, the files are hashed
+        # in parallel
+        with ThreadPoolExecutor() as pool:
+            digests = pool.map(compute_digests, [path for _, path in copies])
+            for (copy, _), (md5, sri) in zip(copies, digests):
+                payload["MD5 ({})".format(copy)] = md5
+                payload["SHA384 ({})".format(copy)] = sri
 
         with open(self._concat(self.main, "digest.json"), "w") as fp:
             json.dump(payload, fp, sort_keys=True, indent=4, separators=(",", ":"))
@@ -129,7 +136,8 @@ class BuildProcess(object):
 
         for scope, name, subfolder, filename, target in self.deps_info:
             version = self.deps["/".join(filter(None, [scope, name]))]["version"]
-            versions[name.replace("-", "").replace(".", "")] = version
+            key = name.replace("-", "").replace(".", "")
+            versions[key] = version
 
             logger.info("copy npm dependency => %s", filename)
             ext = "min.js" if "min" in filename.split(".") else "js"
@@ -143,12 +151,18 @@ class BuildProcess(object):
                 self._concat(self.npm_modules, scope, name, subfolder, filename),
                 self._concat(self.deps_folder, target),
             )
+            # the same file as the one on unpkg, for its integrity attribute
+            versions[
+                "sri_{}{}".format(key, "_min" if ext == "min.js" else "")
+            ] = compute_sri(self._concat(self.deps_folder, target))
 
         _script = "build:dev" if build == "local" else "build:js"
         logger.info("run `npm run %s`", _script)
         os.chdir(self.main)
         run_command_with_process("npm run {}".format(_script))
 
+        getattr(self, "_bundles_integrity", lambda _: None)(versions)
+
         logger.info("generate the `__init__.py` from template and versions")
         with open(self._concat(self.main, "init.template")) as fp:
             t = string.Template(fp.read())
@@ -175,6 +189,11 @@ class Renderer(BuildProcess):
             ),
         )
 
+    def _bundles_integrity(self, versions):
+        versions["sri_renderer_min"] = compute_sri(
+            self._concat(self.build_folder, "dash_renderer.min.js")
+        )
+
 
 def renderer():
     fire.Fire(Renderer)
@@ -1,7 +1,9 @@
 from __future__ import print_function
 from collections import OrderedDict
 
+import hashlib
 import json
+import re
 import sys
 import subprocess
 import shlex
@@ -9,10 +11,14 @@ import os
 import argparse
 import shutil
 import functools
+import time
+from contextlib import contextmanager
 
 import pkg_resources
 import yaml
 
+from ..version import __version__
+
 from ._r_components_generation import write_class_file
 from ._r_components_generation import generate_exports
 from ._py_components_generation import generate_class_file
@@ -26,11 +32,20 @@ reserved_words = [
     "UNDEFINED",
     "REQUIRED",
     "to_plotly_json",
+    "update_many",
     "available_properties",
     "available_wildcard_properties",
     "_.*",
 ]
 
+# the metadata hashes of the generated components, next to package.json
+cache_filename = ".dash-components-cache.json"
+# the metadata of the component source files, by file hash
+metadata_cache_filename = ".dash-metadata-cache.json"
+# the length of the file paths passed to a node process, under the 8191
+# characters of a cmd.exe command line on Windows
+_command_line_limit = 6000 if sys.platform == "win32" else 100000
+
 
 class _CombinedFormatter(
     argparse.ArgumentDefaultsHelpFormatter, argparse.RawDescriptionHelpFormatter
@@ -38,6 +53,30 @@ class _CombinedFormatter(
     pass
 
 
+@contextmanager
+def _timed(phase):
+    start = time.perf_counter()
+    yield
+    print("{} in {:.2f}s".format(phase, time.perf_counter() - start))
+
+
+def _load_cache(project_shortname, metadata):
+    try:
+        with open(cache_filename) as f:
+            cache = json.load(f)
+    except (IOError, ValueError):
+        return {}
+    # regenerate the components whose class file is gone
+    return {
+        path: key
+        for path, key in cache.items()
+        if path in metadata
+        and os.path.isfile(
+            os.path.join(project_shortname, path.split("/")[-1].split(".")[0] + ".py")
+        )
+    }
+
+
 # pylint: disable=too-many-locals, too-many-arguments
 def generate_components(
     components_source,
@@ -50,14 +89,13 @@ def generate_components(
     rsuggests="",
     jlprefix=None,
     metadata=None,
+    cache=False,
+    jobs=1,
+    lazy_imports=False,
 ):
 
     project_shortname = project_shortname.replace("-", "_").rstrip("/\\")
 
-    is_windows = sys.platform == "win32"
-
-    extract_path = pkg_resources.resource_filename("dash", "extract-meta.js")
-
     reserved_patterns = "|".join("^{}$".format(p) for p in reserved_words)
 
     os.environ["NODE_PATH"] = "node_modules"
@@ -67,32 +105,15 @@ def generate_components(
     )
 
     if not metadata:
-        cmd = shlex.split(
-            'node {} "{}" "{}" {}'.format(
-                extract_path, ignore, reserved_patterns, components_source
-            ),
-            posix=not is_windows,
-        )
-
-        proc = subprocess.Popen(
-            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=is_windows
-        )
-        out, err = proc.communicate()
-        status = proc.poll()
-
-        if err:
-            print(err.decode(), file=sys.stderr)
-
-        if not out:
-            print(
-                "Error generating metadata in {} (status={})".format(
-                    project_shortname, status
-                ),
-                file=sys.stderr,
+        with _timed("Extracted the metadata"):
+            metadata = _extract_metadata(
+                components_source,
+                project_shortname,
+                ignore,
+                reserved_patterns,
+                cache,
+                jobs,
             )
-            sys.exit(1)
-
-        metadata = safe_json_loads(out.decode("utf-8"))
 
     generator_methods = [generate_class_file]
 
@@ -119,28 +140,182 @@ def generate_components(
             functools.partial(generate_struct_file, prefix=jlprefix)
         )
 
-    components = generate_classes_files(project_shortname, metadata, *generator_methods)
+    components_cache = _load_cache(project_shortname, metadata) if cache else None
+    with _timed("Generated the components"):
+        components = generate_classes_files(
+            project_shortname,
+            metadata,
+            *generator_methods,
+            cache=components_cache,
+            jobs=jobs,
+        )
+    if cache:
+        with open(cache_filename, "w") as f:
+            json.dump(components_cache, f, indent=2)
 
-    with open(os.path.join(project_shortname, "metadata.json"), "w") as f:
-        json.dump(metadata, f, indent=2)
+    with _timed("Generated the package files"):
+        with open(os.path.join(project_shortname, "metadata.json"), "w") as f:
+            json.dump(metadata, f, indent=2)
 
-    generate_imports(project_shortname, components)
+        generate_imports(project_shortname, components, lazy=lazy_imports)
 
     if rprefix is not None:
-        generate_exports(
-            project_shortname,
-            components,
-            metadata,
-            pkg_data,
-            rpkg_data,
-            rprefix,
-            rdepends,
-            rimports,
-            rsuggests,
-        )
+        with _timed("Generated the R package files"):
+            generate_exports(
+                project_shortname,
+                components,
+                metadata,
+                pkg_data,
+                rpkg_data,
+                rprefix,
+                rdepends,
+                rimports,
+                rsuggests,
+            )
 
     if jlprefix is not None:
-        generate_module(project_shortname, components, metadata, pkg_data, jlprefix)
+        with _timed("Generated the Julia package files"):
+            generate_module(project_shortname, components, metadata, pkg_data, jlprefix)
+
+
+def _source_files(path, ignore_pattern):
+    # the files extract-meta.js parses, in the order it does
+    if ignore_pattern.search(path):
+        return []
+    if not os.path.isdir(path):
+        return [path] if os.path.splitext(path)[1] in (".js", ".jsx") else []
+    files = []
+    for filename in sorted(os.listdir(path)):
+        if not ignore_pattern.search(filename):
+            files.extend(_source_files(os.path.join(path, filename), ignore_pattern))
+    return files
+
+
+def _react_docgen_version():
+    # the version extract-meta.js finds, through NODE_PATH
+    try:
+        with open(os.path.join("node_modules", "react-docgen", "package.json")) as f:
+            return json.load(f).get("version")
+    except (IOError, ValueError):
+        return None
+
+
+def _file_hash(filepath, salt):
+    with open(filepath, "rb") as f:
+        return hashlib.sha1(salt + f.read()).hexdigest()
+
+
+def _batches(paths, limit):
+    # `paths` split so the files of each command line stay under `limit`
+    batch, length = [], 0
+    for path in paths:
+        if batch and length + len(path) + 1 > limit:
+            yield batch
+            batch, length = [], 0
+        batch.append(path)
+        length += len(path) + 1
+    if batch:
+        yield batch
+
+
+def _run_extract_meta(paths, reserved_patterns):
+    is_windows = sys.platform == "win32"
+
+    extract_path = pkg_resources.resource_filename("dash", "extract-meta.js")
+
+    # the files are listed, the ignore pattern is already applied
+    cmd = ["node", extract_path, "(?!)", reserved_patterns] + paths
+    return subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=is_windows
+    )
+
+
+def _extract_metadata(
+    components_source, project_shortname, ignore, reserved_patterns, cache, jobs
+):
+    """The react-docgen metadata of the components, by path. Only the files
+    changed since the metadata was cached are parsed, by `jobs` node
+    processes."""
+    ignore_pattern = re.compile(ignore)
+    files = [
+        os.path.normpath(filepath)
+        for path in shlex.split(components_source, posix=sys.platform != "win32")
+        for filepath in _source_files(path, ignore_pattern)
+    ]
+
+    cached = {}
+    if cache:
+        try:
+            with open(metadata_cache_filename) as f:
+                cached = safe_json_loads(f.read())
+        except (IOError, ValueError):
+            pass
+
+    # the metadata also depends on the options and the parser
+    salt = json.dumps(
+        [__version__, _react_docgen_version(), ignore, reserved_patterns]
+    ).encode("utf-8")
+    hashes = {filepath: _file_hash(filepath, salt) for filepath in files}
+    changed = [
+        filepath
+        for filepath in files
+        if cached.get(_url_path(filepath), {}).get("hash") != hashes[filepath]
+    ]
+
+    jobs = max(1, min(jobs, len(changed)))
+    batches = [
+        batch
+        for i in range(jobs)
+        for batch in _batches(changed[i::jobs], _command_line_limit)
+    ]
+    # `jobs` node processes at a time
+    for start in range(0, len(batches), jobs):
+        processes = [
+            (batch, _run_extract_meta(batch, reserved_patterns))
+            for batch in batches[start : start + jobs]
+        ]
+        for batch, proc in processes:
+            out, err = proc.communicate()
+            status = proc.poll()
+
+            if err:
+                print(err.decode(), file=sys.stderr)
+
+            if not out:
+                print(
+                    "Error generating metadata in {} (status={})".format(
+                        project_shortname, status
+                    ),
+                    file=sys.stderr,
+                )
+                sys.exit(1)
+
+            parsed = safe_json_loads(out.decode("utf-8"))
+            for filepath in batch:
+                # null for the files that aren't components
+                cached[_url_path(filepath)] = OrderedDict(
+                    [
+                        ("hash", hashes[filepath]),
+                        ("metadata", parsed.get(_url_path(filepath))),
+                    ]
+                )
+
+    cached = OrderedDict(
+        (_url_path(filepath), cached[_url_path(filepath)]) for filepath in files
+    )
+    if cache:
+        with open(metadata_cache_filename, "w") as f:
+            json.dump(cached, f)
+
+    return OrderedDict(
+        (path, entry["metadata"])
+        for path, entry in cached.items()
+        if entry["metadata"] is not None
+    )
+
+
+def _url_path(filepath):
+    return filepath.replace(os.sep, "/")
 
 
 def safe_json_loads(s):
@@ -201,6 +376,26 @@ def component_build_arg_parser():
         help="Specify a prefix for Dash for R component names, write "
         "components to R dir, create R package.",
     )
+    parser.add_argument(
+        "--lazy-imports",
+        action="store_true",
+        help="Import each component module when the component is first used. "
+        "The package's __init__ must import __all__, __getattr__ and __dir__ "
+        "from _imports_, rather than *.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Parse every source file and regenerate every component, rather "
+        "than only those changed since they were last generated.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="The number of processes parsing the source files and generating "
+        "the components, one per CPU by default.",
+    )
     return parser
 
 
@@ -216,6 +411,11 @@ def cli():
         rimports=args.r_imports,
         rsuggests=args.r_suggests,
         jlprefix=args.jl_prefix,
+        # incremental and parallel from the command line only, the callers
+        # of generate_components opt in
+        cache=not args.no_cache,
+        jobs=args.jobs or os.cpu_count() or 1,
+        lazy_imports=args.lazy_imports,
     )
 
 
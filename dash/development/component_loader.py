@@ -1,14 +1,22 @@
 import collections
+import glob
+import hashlib
+import importlib.util
 import json
+import marshal
 import os
+import sys
+import tempfile
 
 from ._py_components_generation import (
     generate_class_file,
     generate_imports,
     generate_classes_files,
-    generate_class,
+    generate_class_code,
+    class_from_code,
 )
 from .base_component import ComponentRegistry
+from ..version import __version__
 
 
 def _get_metadata(metadata_path):
@@ -21,6 +29,38 @@ def _get_metadata(metadata_path):
     return data
 
 
+def _cache_prefix(metadata_path):
+    # like the bytecode of a module: in __pycache__ or under sys.pycache_prefix
+    base = importlib.util.cache_from_source(os.path.abspath(metadata_path))
+    return base[: -len(".pyc")]
+
+
+def _load_code(cache_path):
+    try:
+        with open(cache_path, "rb") as f:
+            return marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+
+def _write_code(cache_prefix, cache_path, code):
+    if sys.dont_write_bytecode:
+        return
+    directory = os.path.dirname(cache_path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        # the code of the previous versions of the metadata is of no use
+        for path in glob.glob(glob.escape(cache_prefix) + ".*.dash-components"):
+            os.remove(path)
+        fd, tmp_path = tempfile.mkstemp(dir=directory)
+        with os.fdopen(fd, "wb") as f:
+            marshal.dump(code, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # a read-only installation, the classes are compiled on each load
+        pass
+
+
 def load_components(metadata_path, namespace="default_namespace"):
     """Load React component metadata into a format Dash can parse.
 
@@ -33,31 +73,50 @@ def load_components(metadata_path, namespace="default_namespace"):
     Returns:
     components -- a list of component objects with keys
     `type`, `valid_kwargs`, and `setup`.
+
+    The compiled classes are cached next to the metadata, keyed by its hash,
+    the namespace and the Dash version, so later loads skip generating and
+    compiling them.
     """
 
     # Register the component lib for index include.
     ComponentRegistry.registry.add(namespace)
-    components = []
-
-    data = _get_metadata(metadata_path)
-
-    # Iterate over each property name (which is a path to the component)
-    for componentPath in data:
-        componentData = data[componentPath]
-
-        # Extract component name from path
-        # e.g. src/components/MyControl.react.js
-        # TODO Make more robust - some folks will write .jsx and others
-        # will be on windows. Unfortunately react-docgen doesn't include
-        # the name of the component atm.
-        name = componentPath.split("/").pop().split(".")[0]
-        component = generate_class(
-            name, componentData["props"], componentData["description"], namespace
-        )
-
-        components.append(component)
 
-    return components
+    with open(metadata_path, "rb") as f:
+        key = hashlib.sha1(f.read())
+    key.update("\0{}\0{}".format(namespace, __version__).encode("utf-8"))
+    cache_prefix = _cache_prefix(metadata_path)
+    cache_path = "{}.{}.dash-components".format(cache_prefix, key.hexdigest()[:16])
+
+    code = _load_code(cache_path)
+    if code is None:
+        code = []
+        data = _get_metadata(metadata_path)
+
+        # Iterate over each property name (which is a path to the component)
+        for componentPath in data:
+            componentData = data[componentPath]
+
+            # Extract component name from path
+            # e.g. src/components/MyControl.react.js
+            # TODO Make more robust - some folks will write .jsx and others
+            # will be on windows. Unfortunately react-docgen doesn't include
+            # the name of the component atm.
+            name = componentPath.split("/").pop().split(".")[0]
+            code.append(
+                (
+                    name,
+                    generate_class_code(
+                        name,
+                        componentData["props"],
+                        componentData["description"],
+                        namespace,
+                    ),
+                )
+            )
+        _write_code(cache_prefix, cache_path, code)
+
+    return [class_from_code(name, class_code) for name, class_code in code]
 
 
 def generate_classes(namespace, metadata_path="lib/metadata.json"):
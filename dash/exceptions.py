@@ -77,3 +77,11 @@ class UnsupportedRelativePath(CallbackException):
 
 class ProxyError(DashException):
     pass
+
+
+class StaticExportError(DashException):
+    pass
+
+
+class ServerError(DashException):
+    pass
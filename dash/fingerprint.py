@@ -1,3 +1,4 @@
+import hashlib
 import re
 
 cache_regex = re.compile(r"^v[\w-]+m[0-9a-fA-F]+$")
@@ -26,3 +27,8 @@ def check_fingerprint(path):
         return "/".join(path_parts[:-1] + [original_name]), True
 
     return path, False
+
+
+def content_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()[:16]
@@ -0,0 +1,145 @@
+"""Static HTML of a layout, sent in the index page with ``prerender_layout``
+and shown until the renderer has loaded the app."""
+import re
+from html import escape
+
+from .development.base_component import Component
+
+_renderers = {}
+
+_html_namespace = "dash_html_components"
+
+_void_elements = {
+    "area",
+    "base",
+    "br",
+    "col",
+    "embed",
+    "hr",
+    "img",
+    "input",
+    "keygen",
+    "link",
+    "meta",
+    "param",
+    "source",
+    "track",
+    "wbr",
+}
+
+# props of the html components that aren't attributes of their element
+_skipped_props = {
+    "children",
+    "n_clicks",
+    "n_clicks_timestamp",
+    "loading_state",
+    "key",
+    "setProps",
+}
+
+_attribute_names = {"className": "class", "htmlFor": "for"}
+
+# style properties React leaves unitless, the other numbers are in px
+_unitless = {
+    "animationIterationCount",
+    "columnCount",
+    "fillOpacity",
+    "flex",
+    "flexGrow",
+    "flexShrink",
+    "fontWeight",
+    "gridColumn",
+    "gridRow",
+    "lineHeight",
+    "opacity",
+    "order",
+    "orphans",
+    "strokeOpacity",
+    "tabSize",
+    "widows",
+    "zIndex",
+    "zoom",
+}
+
+
+class _Markup(str):
+    """HTML written as is, the other strings are text."""
+
+
+def register_renderer(namespace, component_type):
+    """Decorator registering ``func(component)``, returning the static HTML
+    of the ``component_type`` components of ``namespace``. ``render`` can be
+    used for their children.
+
+    Components with no renderer are rendered as their ``children``.
+    """
+
+    def wrap(func):
+        _renderers[(namespace, component_type)] = func
+        return func
+
+    return wrap
+
+
+def _style(style):
+    declarations = []
+    for name, value in style.items():
+        if value is None or isinstance(value, bool):
+            continue
+        if isinstance(value, (int, float)) and value and name not in _unitless:
+            value = "{}px".format(value)
+        prop = re.sub("([A-Z])", r"-\1", name).lower()
+        if name.startswith("ms") and name[2:3].isupper():
+            prop = "-" + prop
+        declarations.append("{}: {}".format(prop, value))
+    return "; ".join(declarations)
+
+
+def _open_tag(tag, component):
+    attributes = [tag]
+    # the props given to the component, with its data-* and aria-* ones
+    for prop, value in component.to_plotly_json()["props"].items():
+        if prop in _skipped_props or value is None or value is False:
+            continue
+        name = _attribute_names.get(prop, prop)
+        if value is True:
+            attributes.append(name)
+            continue
+        if prop == "style" and isinstance(value, dict):
+            value = _style(value)
+        elif not isinstance(value, (str, int, float)):
+            continue
+        attributes.append('{}="{}"'.format(name, escape(str(value))))
+    return "<{}>".format(" ".join(attributes))
+
+
+def render(value):
+    """The static HTML of a layout, or of any value of a ``children`` prop."""
+    chunks = []
+    # a stack rather than recursion, for deeply nested layouts
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, _Markup):
+            chunks.append(item)
+        elif isinstance(item, str):
+            chunks.append(escape(item, quote=False))
+        elif isinstance(item, (list, tuple)):
+            stack.extend(reversed(item))
+        elif isinstance(item, Component):
+            # pylint: disable=protected-access
+            renderer = _renderers.get((item._namespace, item._type))
+            if renderer is not None:
+                chunks.append(renderer(item))
+            elif item._namespace == _html_namespace:
+                # MapEl and ObjectEl are named to not shadow the builtins
+                tag = re.sub("El$", "", item._type).lower()
+                chunks.append(_open_tag(tag, item))
+                if tag not in _void_elements:
+                    stack.append(_Markup("</{}>".format(tag)))
+                    stack.append(getattr(item, "children", None))
+            else:
+                stack.append(getattr(item, "children", None))
+        elif isinstance(item, (int, float)) and not isinstance(item, bool):
+            chunks.append(str(item))
+    return "".join(chunks)
@@ -10,9 +10,16 @@ class Resources:
     def __init__(self, resource_name):
         self._resources = []
         self.resource_name = resource_name
+        # bumped on each change of the resources, see `Dash._index_signature`
+        self.version = 0
 
     def append_resource(self, resource):
         self._resources.append(resource)
+        self.version += 1
+
+    def remove_resource(self, resource):
+        self._resources.remove(resource)
+        self.version += 1
 
     # pylint: disable=too-many-branches
     def _filter_resources(self, all_resources, dev_bundles=False):
@@ -49,6 +56,8 @@ class Resources:
                 filtered_resource["namespace"] = s["namespace"]
             if "external_url" in s and not self.config.serve_locally:
                 filtered_resource["external_url"] = s["external_url"]
+                if "integrity" in s:
+                    filtered_resource["integrity"] = s["integrity"]
             elif "dev_package_path" in s and dev_bundles:
                 filtered_resource["relative_package_path"] = s["dev_package_path"]
             elif "relative_package_path" in s:
@@ -56,9 +65,12 @@ class Resources:
             elif "absolute_path" in s:
                 filtered_resource["absolute_path"] = s["absolute_path"]
             elif "asset_path" in s:
-                info = os.stat(s["filepath"])
                 filtered_resource["asset_path"] = s["asset_path"]
-                filtered_resource["ts"] = info.st_mtime
+                if "hash" in s:
+                    filtered_resource["hash"] = s["hash"]
+                    filtered_resource["filepath"] = s["filepath"]
+                else:
+                    filtered_resource["ts"] = os.stat(s["filepath"]).st_mtime
             elif self.config.serve_locally:
                 warnings.warn(
                     (
@@ -86,8 +98,8 @@ class Resources:
 
         return filtered_resources
 
-    def get_all_resources(self, dev_bundles=False):
-        lib_resources = ComponentRegistry.get_resources(self.resource_name)
+    def get_all_resources(self, dev_bundles=False, namespaces=None):
+        lib_resources = ComponentRegistry.get_resources(self.resource_name, namespaces)
         all_resources = lib_resources + self._resources
 
         return self._filter_resources(all_resources, dev_bundles)
@@ -108,8 +120,8 @@ class Css:
     def append_css(self, stylesheet):
         self._resources.append_resource(stylesheet)
 
-    def get_all_css(self):
-        return self._resources.get_all_resources()
+    def get_all_css(self, namespaces=None):
+        return self._resources.get_all_resources(namespaces=namespaces)
 
 
 class Scripts:
@@ -120,5 +132,5 @@ class Scripts:
     def append_script(self, script):
         self._resources.append_resource(script)
 
-    def get_all_scripts(self, dev_bundles=False):
-        return self._resources.get_all_resources(dev_bundles)
+    def get_all_scripts(self, dev_bundles=False, namespaces=None):
+        return self._resources.get_all_resources(dev_bundles, namespaces)
@@ -36,6 +36,7 @@ setup(
             "dash-generate-components = "
             "dash.development.component_generator:cli",
             "renderer = dash.development.build_process:renderer",
+            "dash-export-static = dash._static_export:cli",
         ],
         "pytest11": ["dash = dash.testing.plugin"],
     },
@@ -0,0 +1,79 @@
+"""Time `load_components` takes in a new process, with and without the cache.
+
+Writes metadata with `--components` components (300 by default), copies of
+the test Table component, and loads it `--repeat` times in new processes:
+
+- cold: the cache is removed before each load
+- warm: the classes come from the cache written by the previous load
+
+Usage: python tests/benchmarks/component_loading.py [--components N]
+"""
+import argparse
+import glob
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+_metadata_test = os.path.join(
+    os.path.dirname(__file__), "..", "unit", "development", "metadata_test.json"
+)
+
+# prints the seconds spent in load_components, not in starting python
+_load = """
+import sys, time
+from dash.development.component_loader import load_components
+start = time.perf_counter()
+load_components(sys.argv[1], "benchmark_components")
+print(time.perf_counter() - start)
+"""
+
+
+def make_metadata(path, components):
+    with open(_metadata_test) as f:
+        table = json.load(f)
+    metadata = {
+        "src/components/Table{}.react.js".format(i): table for i in range(components)
+    }
+    with open(path, "w") as f:
+        json.dump(metadata, f)
+
+
+def load(metadata_path):
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    out = subprocess.check_output([sys.executable, "-c", _load, metadata_path], env=env)
+    return float(out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--components", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        metadata_path = os.path.join(root, "metadata.json")
+        make_metadata(metadata_path, args.components)
+        cache = os.path.join(root, "__pycache__", "*.dash-components")
+
+        cold = []
+        for _ in range(args.repeat):
+            for path in glob.glob(cache):
+                os.remove(path)
+            cold.append(load(metadata_path))
+
+        warm = [load(metadata_path) for _ in range(args.repeat)]
+
+    for name, times in (("cold", cold), ("warm", warm)):
+        print(
+            "{} {:>8.1f}ms median, {} components".format(
+                name, 1000 * statistics.median(times), args.components
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Memory used by a large in-memory component tree.
+
+Builds a tree of `--nodes` components (100k by default) and reports the
+traced memory per node, before and after serializing it, for:
+
+- legacy: the installed `dash_html_components.Div`, generated with the
+  metadata lists assigned on every instance
+- class: `Div` regenerated from the same metadata by the current generator,
+  which keeps the metadata as class attributes
+
+Usage: python tests/benchmarks/component_memory.py [--nodes N]
+"""
+import argparse
+import gc
+import os
+import tracemalloc
+
+import dash_html_components as html
+
+from dash.development.component_loader import load_components
+
+
+def build_tree(div, nodes, width=100):
+    rows = []
+    for i in range(nodes // width):
+        rows.append(
+            div(
+                [
+                    div("cell {}-{}".format(i, j), id="cell-{}-{}".format(i, j))
+                    for j in range(width - 1)
+                ],
+                id="row-{}".format(i),
+                className="row",
+            )
+        )
+    return div(rows, id="root")
+
+
+def measure(div, nodes):
+    gc.collect()
+    tracemalloc.start()
+    tree = build_tree(div, nodes)
+    built = tracemalloc.get_traced_memory()[0]
+    tree.to_plotly_json()
+    for row in tree.children:
+        for cell in row.children:
+            cell.to_plotly_json()
+    serialized = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del tree
+    return built, serialized
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=100000)
+    args = parser.parse_args()
+
+    metadata_path = os.path.join(os.path.dirname(html.__file__), "metadata.json")
+
+    regenerated = next(
+        c
+        for c in load_components(metadata_path, "dash_html_components")
+        if c.__name__ == "Div"
+    )
+
+    for name, div in (("legacy", html.Div), ("class", regenerated)):
+        built, serialized = measure(div, args.nodes)
+        print(
+            "{:<8} {:>8.1f} bytes/node built {:>8.1f} bytes/node serialized".format(
+                name, built / args.nodes, serialized / args.nodes
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Time the component tree traversals on deep and wide trees.
+
+- deep: a chain of `--depth` nested components (900 by default)
+- wide: `--width` components (100k by default) in rows of 100
+
+Usage: python tests/benchmarks/traversal.py [--depth N] [--width N]
+"""
+import argparse
+import time
+
+import dash_html_components as html
+
+from dash import exceptions
+from dash._validate import fail_callback_output, validate_layout
+from dash.dependencies import Output
+
+
+def deep_tree(depth):
+    tree = html.Div(id="leaf")
+    for i in range(depth):
+        tree = html.Div(tree if i % 2 else [tree], id="node-{}".format(i))
+    return tree
+
+
+def wide_tree(width):
+    return html.Div(
+        [
+            html.Div(
+                [html.Span(id="cell-{}-{}".format(i, j)) for j in range(99)],
+                id="row-{}".format(i),
+            )
+            for i in range(width // 100)
+        ]
+    )
+
+
+def with_bad_leaf(tree):
+    leaf = tree
+    while isinstance(getattr(leaf, "children", None), (html.Div, list)):
+        leaf = (
+            leaf.children if isinstance(leaf.children, html.Div) else leaf.children[-1]
+        )
+    leaf.children = [object()]
+    return tree
+
+
+def fail_output(tree):
+    try:
+        fail_callback_output(tree, Output("out", "children"))
+    except exceptions.InvalidCallbackReturnValue:
+        pass
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--depth", type=int, default=900)
+    parser.add_argument("--width", type=int, default=100000)
+    args = parser.parse_args()
+
+    for name, make_tree in (
+        ("deep", lambda: deep_tree(args.depth)),
+        ("wide", lambda: wide_tree(args.width)),
+    ):
+        tree = make_tree()
+        # pylint: disable=protected-access
+        for label, func in (
+            ("_traverse", lambda t: list(t._traverse())),
+            ("_traverse_with_paths", lambda t: list(t._traverse_with_paths())),
+            ("_traverse_ids", lambda t: list(t._traverse_ids())),
+            ("validate_layout", lambda t: validate_layout(t, t)),
+        ):
+            print("{:<5} {:<22} {:>8.3f}s".format(name, label, timed(func, tree)))
+
+        bad_tree = with_bad_leaf(make_tree())
+        print(
+            "{:<5} {:<22} {:>8.3f}s".format(
+                name, "fail_callback_output", timed(fail_output, bad_tree)
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
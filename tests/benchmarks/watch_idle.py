@@ -0,0 +1,76 @@
+"""Idle CPU use of the hot reload file watcher.
+
+Creates `--files` files (50k by default) in directories of 100 and reports
+the CPU time the watcher uses over `--seconds` without any change, for:
+
+- polling: the folders walked every `--interval` seconds
+- inotify: the Linux backend, blocked until a file changes
+
+Usage: python tests/benchmarks/watch_idle.py [--files N] [--seconds S]
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from dash import _watch
+
+
+def make_tree(root, files):
+    for i in range(files):
+        directory = os.path.join(root, "dir-{}".format(i // 100))
+        if not i % 100:
+            os.mkdir(directory)
+        with open(os.path.join(directory, "file-{}.js".format(i)), "w") as f:
+            f.write("")
+
+
+def measure(root, backend, seconds, interval, results):
+    # in a process of its own, so the watcher thread of the other backend
+    # doesn't count
+    if backend == "polling":
+        sys.platform = "polling"
+    thread = threading.Thread(
+        target=_watch.watch,
+        args=([root], lambda *_: None),
+        kwargs={"sleep_time": interval},
+    )
+    thread.daemon = True
+    thread.start()
+    # setting up the watches or the first walk isn't idle time
+    time.sleep(max(2, 4 * interval))
+    start = time.process_time()
+    time.sleep(seconds)
+    results.put(time.process_time() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=50000)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--interval", type=float, default=0.5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        make_tree(root, args.files)
+        for backend in ("polling", "inotify"):
+            results = multiprocessing.Queue()
+            process = multiprocessing.Process(
+                target=measure,
+                args=(root, backend, args.seconds, args.interval, results),
+            )
+            process.start()
+            cpu = results.get()
+            process.join()
+            print(
+                "{:<8} {:>7.2f}s CPU in {}s, {:>5.1f}% of a core".format(
+                    backend, cpu, args.seconds, 100 * cpu / args.seconds
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,6 @@
+import base64
+import hashlib
+
 import pytest
 
 import dash._utils as utils
@@ -59,3 +62,16 @@ def test_ddut001_attribute_dict():
         a.x = 4
     assert err.value.args == ("Object is final: No new keys may be added.", "x")
     assert "x" not in a
+
+
+def test_ddut002_file_digests(tmp_path):
+    # binary, with line endings and bytes that aren't UTF-8, over many chunks
+    bundle = tmp_path / "bundle.js"
+    data = b"var a = 1;\r\n\xff" * 100000
+    bundle.write_bytes(data)
+
+    md5, sri = utils.compute_digests(str(bundle))
+    assert md5 == hashlib.md5(data).hexdigest()
+    assert sri == "sha384-" + base64.b64encode(hashlib.sha384(data).digest()).decode()
+    assert utils.compute_md5(str(bundle)) == md5
+    assert utils.compute_sri(str(bundle)) == sri
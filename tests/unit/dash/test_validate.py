@@ -0,0 +1,27 @@
+import pytest
+
+import dash_html_components as html
+from dash import exceptions
+from dash._validate import fail_callback_output
+from dash.dependencies import Output
+
+
+def test_fail_callback_output_path():
+    bad = object()
+    value = html.Div(
+        [html.Span("a"), html.Div(id="inner", children=[html.B("b"), bad])]
+    )
+
+    with pytest.raises(exceptions.InvalidCallbackReturnValue) as err:
+        fail_callback_output(value, Output("out", "children"))
+
+    assert "[1] Div (id=inner)\n[1] object" in err.value.args[0]
+
+
+def test_fail_callback_output_single_child_path():
+    value = html.Div([html.Div(id="inner", children=html.Div(children={1}))])
+
+    with pytest.raises(exceptions.InvalidCallbackReturnValue) as err:
+        fail_callback_output(value, Output("out", "children"))
+
+    assert "[0] Div (id=inner)\n[*] Div\n[*] set" in err.value.args[0]
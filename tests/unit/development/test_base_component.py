@@ -1,4 +1,6 @@
+import copy
 import json
+import pickle
 
 import plotly
 import pytest
@@ -474,3 +476,135 @@ def test_debc027_component_error_message():
         + "keyword argument: `asdf`\n"
         + "Allowed arguments: {}".format(", ".join(sorted(html.Div()._prop_names)))
     )
+
+
+def test_debc028_get_item_with_dict_id():
+    c1 = Component(id={"type": "cell", "index": 1})
+    c2 = Component(id="2", children=[Component(), c1])
+    c3 = Component(children=c2)
+
+    assert c3[{"index": 1, "type": "cell"}] is c1
+    assert c3['{"index":1,"type":"cell"}'] is c1
+    assert {"type": "cell", "index": 1} in c3
+    assert {"type": "cell", "index": 2} not in c3
+    with pytest.raises(KeyError):
+        c3[{"type": "cell", "index": 2}]
+    with pytest.raises(KeyError):
+        c3[["not", "hashable"]]
+
+
+def test_debc029_get_item_first_match_depth_first():
+    deep = Component(id="x")
+    shallow = Component(id="x")
+    c = Component(children=[Component(children=[deep]), shallow])
+
+    assert c["x"] is deep
+    del c["x"]
+    assert c["x"] is shallow
+
+
+def test_debc030_index_follows_changes_outside_mapping_interface():
+    c, c1, c2, c3, c4, c5 = nested_tree()
+    assert c["0.1.x.x.0"] is c1
+
+    # add a component directly to the children
+    c6 = Component(id="0.2")
+    c.children.append(c6)
+    assert c["0.2"] is c6
+
+    # replace a subtree directly
+    c7 = Component(id="0.1.y")
+    c4.children = c7
+    assert c["0.1.y"] is c7
+    for key in ["0.1.x", "0.1.x.x", "0.1.x.x.0"]:
+        assert key not in c
+        with pytest.raises(KeyError):
+            c[key]
+
+    # change an id directly
+    c5.id = "0.0.new"
+    assert c["0.0.new"] is c5
+    with pytest.raises(KeyError):
+        c["0.0"]
+
+
+def test_debc031_del_item_updates_sibling_positions():
+    items = [Component(id=str(i)) for i in range(5)]
+    c = Component(id="root", children=[Component(children=list(items))])
+
+    del c["0"]
+    del c["2"]
+    assert c["4"] is items[4]
+
+    new_item = Component(id="new")
+    c["3"] = new_item
+    assert c.children[0].children == [items[1], new_item, items[4]]
+    assert list(c) == ["1", "new", "4"]
+
+
+def test_debc032_update_many():
+    c, c1, c2, c3, c4, c5 = nested_tree()
+    new_c1 = Component(id="new 0.1.x.x.0")
+    new_c5 = Component(id="new 0.0", children=[Component(id="new 0.0.0")])
+
+    c.update_many({"0.1.x.x.0": new_c1, "0.0": new_c5})
+
+    assert c2.children[3] is new_c1
+    assert c.children[0] is new_c5
+    assert c["new 0.0.0"] is new_c5.children[0]
+    assert "0.0" not in c
+
+    c.update_many([("new 0.0.0", Component(id="b")), ("0.1.x.x", "text")])
+    assert new_c5.children[0].id == "b"
+    assert c3.children == "text"
+
+    # nothing is changed if an id is missing
+    with pytest.raises(KeyError):
+        c.update_many({"b": Component(id="c"), "missing": Component(id="d")})
+    assert c["b"] is new_c5.children[0]
+
+
+def test_debc033_id_index_not_copied():
+    c = nested_tree()[0]
+    assert c["0.1.x.x.0"].children == "string"
+
+    c_copy = copy.deepcopy(c)
+    assert "_id_index" in vars(c)
+    assert "_id_index" not in vars(c_copy)
+    assert c_copy["0.1.x.x.0"] is c_copy.children[1].children.children.children[3]
+
+    c_pickled = pickle.loads(pickle.dumps(c))
+    assert "_id_index" not in vars(c_pickled)
+    assert json.dumps(c_pickled, cls=plotly.utils.PlotlyJSONEncoder) == json.dumps(
+        c, cls=plotly.utils.PlotlyJSONEncoder
+    )
+
+
+def test_debc034_traverse_with_paths():
+    c, c1, c2, c3, c4, c5 = nested_tree()
+    paths = dict((id(t), p) for p, t in c._traverse_with_paths())
+
+    assert [t for _, t in c._traverse_with_paths()] == list(c._traverse())
+    assert paths[id(c5)] == "[0] Component (id=0.0)"
+    assert paths[id(c1)] == "\n".join(
+        [
+            "[1] Component (id=0.1)",
+            "[*] Component (id=0.1.x)",
+            "[*] Component (id=0.1.x.x)",
+            "[3] Component (id=0.1.x.x.0)",
+        ]
+    )
+    assert c._get_path(c1) == paths[id(c1)]
+    with pytest.raises(KeyError):
+        c._get_path(Component())
+
+
+def test_debc035_traverse_deep_tree():
+    depth = 5000
+    leaf = tree = Component(id="leaf")
+    for i in range(depth):
+        tree = Component(id=str(i), children=[tree] if i % 2 else tree)
+
+    assert len(list(tree._traverse())) == depth
+    assert list(tree._traverse_ids())[-1] is leaf
+    assert tree._get_path(leaf).count("\n") == depth - 1
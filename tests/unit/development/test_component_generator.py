@@ -0,0 +1,89 @@
+import json
+import os
+
+import pytest
+
+from dash.development import component_generator
+
+
+class FakeExtract:
+    def __init__(self, paths):
+        self.paths = paths
+
+    def communicate(self):
+        metadata = {
+            path: {"description": "Read from " + path, "props": {}}
+            for path in self.paths
+            if path.endswith(".react.js")
+        }
+        return json.dumps(metadata).encode("utf-8"), b""
+
+    @staticmethod
+    def poll():
+        return 0
+
+
+@pytest.fixture
+def parsed(tmp_path, monkeypatch):
+    calls = []
+
+    def run_extract_meta(paths, reserved_patterns):
+        calls.append(sorted(paths))
+        return FakeExtract(paths)
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(component_generator, "_run_extract_meta", run_extract_meta)
+    os.makedirs(os.path.join("src", "components"))
+    for filename in ("B.react.js", "A.react.js", "utils.js", "_Private.react.js"):
+        with open(os.path.join("src", "components", filename), "w") as f:
+            f.write(filename)
+    return calls
+
+
+def extract(jobs=1, reserved_patterns="^UNDEFINED$"):
+    return component_generator._extract_metadata(
+        "src", "lib", "^_", reserved_patterns, cache=True, jobs=jobs
+    )
+
+
+def test_extract_metadata_cache(parsed):
+    metadata = extract(jobs=2)
+    assert list(metadata) == ["src/components/A.react.js", "src/components/B.react.js"]
+    assert sorted(sum(parsed, [])) == [
+        "src/components/A.react.js",
+        "src/components/B.react.js",
+        "src/components/utils.js",
+    ]
+
+    del parsed[:]
+    assert extract() == metadata
+    assert not parsed
+
+    with open(os.path.join("src", "components", "B.react.js"), "w") as f:
+        f.write("changed")
+    assert extract() == metadata
+    assert parsed == [["src/components/B.react.js"]]
+
+
+def test_extract_metadata_cache_key(parsed):
+    metadata = extract()
+    del parsed[:]
+    # parsed again with other reserved words, or another react-docgen
+    assert extract(reserved_patterns="^UNDEFINED$|^REQUIRED$") == metadata
+    assert len(parsed) == 1
+
+    del parsed[:]
+    os.makedirs(os.path.join("node_modules", "react-docgen"))
+    with open(os.path.join("node_modules", "react-docgen", "package.json"), "w") as f:
+        json.dump({"version": "5.4.0"}, f)
+    assert extract(reserved_patterns="^UNDEFINED$|^REQUIRED$") == metadata
+    assert len(parsed) == 1
+
+
+def test_extract_metadata_batches(parsed, monkeypatch):
+    # the command lines of the node processes stay short enough
+    monkeypatch.setattr(component_generator, "_command_line_limit", 40)
+    metadata = extract(jobs=2)
+    assert list(metadata) == ["src/components/A.react.js", "src/components/B.react.js"]
+    assert len(parsed) == 3
+    assert all(len(" ".join(paths)) < 40 for paths in parsed)
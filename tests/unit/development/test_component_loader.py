@@ -1,12 +1,15 @@
 import collections
+import glob
 import json
 import os
 import shutil
+import sys
 
 import pytest
 
 from dash.development._py_components_generation import generate_class
 from dash.development.base_component import Component
+from dash.development import component_loader
 from dash.development.component_loader import load_components, generate_classes
 
 METADATA_PATH = "metadata.json"
@@ -108,6 +111,9 @@ def write_metadata_file():
         f.write(METADATA_STRING)
     yield
     os.remove(METADATA_PATH)
+    cache_prefix = component_loader._cache_prefix(METADATA_PATH)
+    for path in glob.glob(cache_prefix + ".*"):
+        os.remove(path)
 
 
 @pytest.fixture
@@ -192,3 +198,25 @@ def test_loadcomponents_from_generated_class(write_metadata_file, make_namespace
     )
 
     assert repr(a_runtime(**a_kwargs)) == repr(A_buildtime(**a_kwargs))
+
+
+def test_loadcomponents_cache(write_metadata_file, mocker, monkeypatch):
+    monkeypatch.setattr(sys, "dont_write_bytecode", False)
+    a_kwargs = {"children": "Child", "href": "Hello World"}
+    expected = repr(load_components(METADATA_PATH)[1](**a_kwargs))
+
+    # loaded from the cache, without generating the classes
+    generate = mocker.patch.object(component_loader, "generate_class_code")
+    assert repr(load_components(METADATA_PATH)[1](**a_kwargs)) == expected
+    generate.assert_not_called()
+
+    cache_prefix = component_loader._cache_prefix(METADATA_PATH)
+    assert len(glob.glob(cache_prefix + ".*")) == 1
+
+    # the metadata changed
+    with open(METADATA_PATH, "w") as f:
+        f.write(METADATA_STRING.replace("Description of prop foo.", "Foo"))
+    mocker.stopall()
+    components = load_components(METADATA_PATH)
+    assert "Foo" in components[0].__doc__
+    assert len(glob.glob(cache_prefix + ".*")) == 1
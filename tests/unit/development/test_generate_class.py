@@ -145,3 +145,22 @@ def test_attrs_match_forbidden_props(component_class):
         "id",
         "optionalArray",
     }, "explicit props were added as attrs"
+
+
+def test_metadata_is_shared_by_instances(component_class):
+    c1 = component_class(id="1")
+    c2 = component_class(id="2")
+
+    for attr in (
+        "_prop_names",
+        "_type",
+        "_namespace",
+        "_valid_wildcard_attributes",
+        "available_properties",
+        "available_wildcard_properties",
+    ):
+        assert attr not in vars(c1), "{} is a class attribute".format(attr)
+        assert getattr(c1, attr) is getattr(c2, attr)
+
+    assert c1.available_properties == component_class.available_properties
+    assert c1._type == "Table"
@@ -1,5 +1,6 @@
 import os
 import shutil
+import sys
 from difflib import unified_diff
 
 import pytest
@@ -8,7 +9,10 @@ import pytest
 from dash.development._py_components_generation import (
     generate_class_string,
     generate_class_file,
+    generate_classes_files,
+    generate_imports,
 )
+from dash.development.base_component import ComponentRegistry
 from . import _dir, has_trailing_space
 
 # Import string not included in generated class string
@@ -77,3 +81,74 @@ def test_class_file(expected_class_string, written_class_string):
         )
     )
     assert not has_trailing_space(written_class_string)
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_classes_files_cache(make_component_dir, jobs):
+    metadata = {
+        "src/components/Table.react.js": make_component_dir,
+        "src/components/Other.react.js": make_component_dir,
+    }
+    cache = {}
+    components = generate_classes_files(
+        "TableComponents", metadata, generate_class_file, cache=cache, jobs=jobs
+    )
+    assert components == ["Table", "Other"]
+    assert sorted(os.listdir("TableComponents")) == ["Other.py", "Table.py"]
+
+    # unchanged components are skipped
+    os.remove(os.path.join("TableComponents", "Table.py"))
+    generate_classes_files(
+        "TableComponents", metadata, generate_class_file, cache=cache, jobs=jobs
+    )
+    assert os.listdir("TableComponents") == ["Other.py"]
+
+    changed = dict(make_component_dir, description="Changed")
+    metadata["src/components/Table.react.js"] = changed
+    generate_classes_files(
+        "TableComponents", metadata, generate_class_file, cache=cache, jobs=jobs
+    )
+    with open(os.path.join("TableComponents", "Table.py")) as f:
+        assert "Changed" in f.read()
+
+
+def test_lazy_imports(load_test_metadata_json, tmp_path, monkeypatch):
+    package = tmp_path / "lazy_components"
+    package.mkdir()
+    (package / "__init__.py").write_text(
+        "from ._imports_ import __all__, __getattr__, __dir__\n_js_dist = []\n"
+    )
+    metadata = {
+        "src/components/Table.react.js": load_test_metadata_json,
+        "src/components/Other.react.js": load_test_metadata_json,
+    }
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    components = generate_classes_files(
+        "lazy_components", metadata, generate_class_file
+    )
+    generate_imports("lazy_components", components, lazy=True)
+
+    try:
+        import lazy_components  # pylint: disable=import-error,import-outside-toplevel
+
+        assert "lazy_components" in ComponentRegistry.registry
+        assert "lazy_components.Table" not in sys.modules
+        assert {"Table", "Other"} <= set(dir(lazy_components))
+
+        table = lazy_components.Table
+        assert table.__name__ == "Table"
+        assert lazy_components.Table is table
+        assert "lazy_components.Other" not in sys.modules
+
+        scope = {}
+        exec("from lazy_components import *", scope)  # pylint: disable=exec-used
+        assert scope["Other"].__name__ == "Other"
+
+        with pytest.raises(AttributeError):
+            lazy_components.Missing  # pylint: disable=pointless-statement
+    finally:
+        for name in list(sys.modules):
+            if name.split(".")[0] == "lazy_components":
+                del sys.modules[name]
+        ComponentRegistry.registry.discard("lazy_components")
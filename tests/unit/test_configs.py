@@ -1,10 +1,20 @@
 import os
+import json
 import logging
+import re
+import sys
+import threading
+import types
+import time
 
 import pytest
 from flask import Flask
+import dash_core_components as dcc
+import dash_html_components as html
 
 from dash import Dash, exceptions as _exc
+from dash.dependencies import Input, Output
+from dash.development.base_component import Component, ComponentRegistry
 
 # noinspection PyProtectedMember
 from dash._configs import (
@@ -370,3 +380,279 @@ def test_title():
     assert "<title>Hello World</title>" in app.index()
     app = Dash(title="Custom Title")
     assert "<title>Custom Title</title>" in app.index()
+
+
+class StatMock(object):
+    st_mtime = 1
+
+
+def test_index_cache(mocker):
+    stat = mocker.patch("dash.dash.os.stat", return_value=StatMock())
+    app = Dash()
+
+    index = app.index()
+    stats = stat.call_count
+    assert stats
+    assert app.index() is index
+    assert stat.call_count == stats, "cached index does not stat the bundles"
+
+    app.title = "Hello World"
+    assert "<title>Hello World</title>" in app.index()
+
+    app.clientside_callback(
+        "function(v) { return v; }", Output("out", "children"), Input("in", "value")
+    )
+    assert "/_dash-clientside/clientside.v" in app.index()
+
+    index = app.index()
+    app._on_assets_change("elsewhere.js", 0, False)
+    assert app.index() is not index
+
+    # replaced, the number of scripts stays the same
+    asset = {"asset_path": "first.js", "hash": "1", "filepath": "first.js"}
+    app.scripts.append_script(asset)
+    assert "/assets/first." in app.index()
+    scripts = app.scripts._resources
+    scripts.remove_resource(scripts._resources[-1])
+    app.scripts.append_script(dict(asset, asset_path="second.js"))
+    assert "/assets/first." not in app.index()
+    assert "/assets/second." in app.index()
+
+    # changed in place
+    app.config.external_scripts.append("https://example.com/in-place.js")
+    assert "https://example.com/in-place.js" in app.index()
+
+
+def test_index_interpolated_per_request(mocker):
+    mocker.patch("dash.dash.os.stat", return_value=StatMock())
+    nonces = iter(range(10))
+
+    class NonceDash(Dash):
+        def interpolate_index(self, **kwargs):
+            kwargs["scripts"] += "<!-- nonce {} -->".format(next(nonces))
+            return super().interpolate_index(**kwargs)
+
+    app = NonceDash()
+    app.layout = html.Div()
+    client = app.server.test_client()
+    # rendered once per request, not cached
+    assert "<!-- nonce 0 -->" in client.get("/").get_data(as_text=True)
+    assert "<!-- nonce 1 -->" in client.get("/").get_data(as_text=True)
+
+
+def test_index_etag(mocker):
+    mocker.patch("dash.dash.os.stat", return_value=StatMock())
+    app = Dash()
+    app.layout = html.Div()
+    client = app.server.test_client()
+
+    response = client.get("/")
+    etag = response.headers["ETag"]
+    assert response.status_code == 200
+    assert response.get_data(as_text=True) == app.index()
+
+    response = client.get("/some/route", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+
+    app.title = "Hello World"
+    assert client.get("/", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_clientside_scripts(mocker):
+    mocker.patch("dash.dash.os.stat", return_value=StatMock())
+    app = Dash()
+    app.layout = html.Div()
+    app.clientside_callback(
+        "function(v) { return v; }", Output("out", "children"), Input("in", "value")
+    )
+    client = app.server.test_client()
+
+    index = client.get("/").get_data(as_text=True)
+    assert "function(v) { return v; }" not in index
+    (url,) = re.findall(r'src="(/_dash-clientside/[^"]+)"', index)
+
+    response = client.get(url)
+    assert response.mimetype == "application/javascript"
+    assert response.cache_control.immutable
+    assert "function(v) { return v; }" in response.get_data(as_text=True)
+    assert len(app.csp_hashes()) == 1, "only the renderer is inline"
+
+    app.clientside_callback(
+        "function(v) { return 2 * v; }",
+        Output("out2", "children"),
+        Input("in", "value"),
+    )
+    assert url not in client.get("/").get_data(as_text=True)
+    assert client.get("/_dash-clientside/other.js").status_code == 404
+
+
+def test_index_preload(mocker):
+    mocker.patch("dash.dash.os.stat", return_value=StatMock())
+    app = Dash(external_stylesheets=["https://example.com/style.css"])
+    app.layout = html.Div()
+    client = app.server.test_client()
+
+    index = client.get("/").get_data(as_text=True)
+    head = index[: index.index("</head>")]
+    preloads = re.findall(r'<link rel="preload" href="([^"]+)" as="script">', head)
+    scripts = re.findall(r'<script src="([^"]+)"></script>', index)
+    assert preloads == scripts
+    assert "Link" not in client.get("/").headers
+
+    app = Dash(
+        external_stylesheets=["https://example.com/style.css"], preload_headers=True
+    )
+    app.layout = html.Div()
+    client = app.server.test_client()
+    early_hints = mocker.Mock()
+
+    response = client.get("/", environ_base={"wsgi.early_hints": early_hints})
+    links = response.headers["Link"]
+    assert "<https://example.com/style.css>; rel=preload; as=style" in links
+    assert "<{}>; rel=preload; as=script".format(scripts[-1]) in links
+    early_hints.assert_called_once_with([("Link", links)])
+
+
+def test_lazy_component_suites(mocker):
+    mocker.patch("dash.dash.os.stat", return_value=StatMock())
+
+    def scripts_of(index):
+        return " ".join(re.findall(r'<script src="([^"]+)"></script>', index))
+
+    def config_of(index):
+        return json.loads(
+            re.search(
+                r'<script id="_dash-config" type="application/json">(.*?)</script>',
+                index,
+            ).group(1)
+        )
+
+    app = Dash(lazy_component_suites=True)
+    app.layout = html.Div(html.Span())
+    index = app.server.test_client().get("/").get_data(as_text=True)
+    assert "dash_html_components/dash_html_components" in scripts_of(index)
+    assert "dash_core_components/dash_core_components" not in scripts_of(index)
+    lazy = config_of(index)["lazy_component_suites"]
+    assert "dash_html_components" not in lazy
+    assert any(
+        "dash_core_components/dash_core_components" in src
+        for src in lazy["dash_core_components"]["scripts"]
+    )
+
+    # the cached page follows the layout
+    app.layout = html.Div(dcc.Input())
+    index = app.server.test_client().get("/").get_data(as_text=True)
+    assert "dash_core_components/dash_core_components" in scripts_of(index)
+    assert "lazy_component_suites" not in config_of(index)
+
+    app = Dash(lazy_component_suites=True, eager_namespaces=[dcc.Input])
+    app.layout = html.Div()
+    index = app.server.test_client().get("/").get_data(as_text=True)
+    assert "dash_core_components/dash_core_components" in scripts_of(index)
+
+    app = Dash()
+    app.layout = html.Div()
+    index = app.server.test_client().get("/").get_data(as_text=True)
+    assert "dash_core_components/dash_core_components" in scripts_of(index)
+    assert "lazy_component_suites" not in config_of(index)
+
+
+def test_lazy_component_suites_namespace(mocker, monkeypatch, tmp_path):
+    mocker.patch("dash.dash.os.stat", return_value=StatMock())
+    # a library whose components' `_namespace` isn't its package name
+    module = types.ModuleType("fake_lib")
+    module.__file__ = str(tmp_path / "fake_lib" / "__init__.py")
+    module.__version__ = "1.0.0"
+    module._js_dist = [{"relative_package_path": "fake.js", "namespace": "fake_lib"}]
+    monkeypatch.setitem(sys.modules, "fake_lib", module)
+    monkeypatch.setattr(ComponentRegistry, "registry", set(ComponentRegistry.registry))
+    FakeComponent = type(  # noqa: F841
+        "FakeComponent",
+        (Component,),
+        {"__module__": "fake_lib", "_namespace": "FakeLib", "_type": "Fake"},
+    )
+
+    app = Dash(lazy_component_suites=True)
+    app.layout = html.Div()
+    index = app.server.test_client().get("/").get_data(as_text=True)
+    config = json.loads(
+        re.search(
+            r'<script id="_dash-config" type="application/json">(.*?)</script>',
+            index,
+        ).group(1)
+    )
+    lazy = config["lazy_component_suites"]
+    assert lazy["FakeLib"]["scripts"] == [
+        "/_dash-component-suites/fake_lib/fake.v1_0_0m1.js"
+    ]
+
+
+def test_inline_bootstrap(mocker):
+    mocker.patch("dash.dash.os.stat", return_value=StatMock())
+
+    def block(index, script_id):
+        match = re.search(
+            r'<script id="{}" type="application/json">(.*?)</script>'.format(script_id),
+            index,
+        )
+        return match and json.loads(match.group(1))
+
+    app = Dash(inline_bootstrap=True)
+    app.layout = html.Div([html.Div(id="in"), html.Div("</script>", id="out")])
+
+    @app.callback(Output("out", "title"), Input("in", "children"))
+    def update(value):
+        return value
+
+    client = app.server.test_client()
+    index = client.get("/").get_data(as_text=True)
+    assert block(index, "_dash-layout") == client.get("/_dash-layout").get_json()
+    assert (
+        block(index, "_dash-dependencies")
+        == client.get("/_dash-dependencies").get_json()
+    )
+    assert "<\\/script>" in index
+
+    app.layout = lambda: html.Div()
+    index = client.get("/").get_data(as_text=True)
+    assert block(index, "_dash-layout") is None
+    assert block(index, "_dash-dependencies")
+
+    app = Dash()
+    app.layout = html.Div()
+    index = app.server.test_client().get("/").get_data(as_text=True)
+    assert block(index, "_dash-layout") is None
+    assert block(index, "_dash-dependencies") is None
+
+
+def test_reload_hash_long_poll(mocker):
+    mocker.patch("dash.dash.os.stat", return_value=StatMock())
+    mocker.patch("dash.dash._watch.watch")
+    mocker.patch("dash.dash._long_poll_timeout", 0.5)
+    app = Dash()
+    app.layout = html.Div()
+    app.enable_dev_tools(debug=True, dev_tools_hot_reload_long_poll=True)
+    client = app.server.test_client()
+    known = client.get("/_reload-hash").get_json()["reloadHash"]
+
+    # no change within the timeout, the same hash is returned
+    start = time.time()
+    assert client.get("/_reload-hash?wait=" + known).get_json()["reloadHash"] == known
+    assert time.time() - start >= 0.5
+
+    timer = threading.Timer(
+        0.1, app._on_assets_change, ("/outside/assets/app.py", 1, False)
+    )
+    timer.start()
+    start = time.time()
+    content = client.get("/_reload-hash?wait=" + known).get_json()
+    assert content["reloadHash"] != known
+    assert content["hard"]
+    assert time.time() - start < 0.5
+
+    # without long polling the request is answered at once
+    app.enable_dev_tools(debug=True)
+    start = time.time()
+    client.get("/_reload-hash?wait=" + content["reloadHash"])
+    assert time.time() - start < 0.5
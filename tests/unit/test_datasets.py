@@ -0,0 +1,118 @@
+import os
+
+import pytest
+
+from dash.datasets import Registry
+
+
+@pytest.fixture
+def loads():
+    calls = []
+
+    def load():
+        calls.append(len(calls))
+        return "version {}".format(len(calls)).encode("utf-8")
+
+    return calls, load
+
+
+def dataset_files(path):
+    return sorted(f for f in os.listdir(str(path)) if f.endswith(".dash-dataset"))
+
+
+def test_dataset_loaded_once(tmp_path, loads):
+    calls, load = loads
+    # a registry per process, sharing the folder
+    first, second = Registry(str(tmp_path)), Registry(str(tmp_path))
+    first.register("ref", load)
+    second.register("ref", load)
+
+    data = first["ref"]
+    assert bytes(data) == b"version 1"
+    assert data.readonly
+    assert bytes(second.get("ref")) == b"version 1"
+    assert first.get("ref") is data
+    assert len(calls) == 1
+    assert dataset_files(tmp_path) == ["ref.1.dash-dataset"]
+
+    with pytest.raises(KeyError):
+        first.get("missing")
+
+
+def test_dataset_refresh(tmp_path, loads):
+    calls, load = loads
+    first, second = Registry(str(tmp_path)), Registry(str(tmp_path))
+    first.register("ref", load)
+
+    second.register("ref", load)
+    before = second.get("ref")
+    assert first.refresh("ref") == 2
+    assert len(calls) == 2
+    assert dataset_files(tmp_path) == ["ref.2.dash-dataset"]
+
+    # still readable until let go, the next get switches to the new version
+    assert bytes(before) == b"version 1"
+    assert bytes(second.get("ref")) == b"version 2"
+    assert second.version("ref") == 2
+
+    assert first.publish("ref", bytearray(b"pushed")) == 3
+    assert bytes(second.get("ref")) == b"pushed"
+
+
+def test_dataset_types(tmp_path):
+    registry = Registry(str(tmp_path))
+    with pytest.raises(TypeError):
+        registry.publish("ref", ["not", "shareable"])
+    for name in ("../ref", "ref/..", ""):
+        with pytest.raises(ValueError):
+            registry.register(name, bytes)
+        with pytest.raises(ValueError):
+            registry.publish(name, b"outside")
+        with pytest.raises(ValueError):
+            registry.get(name)
+    assert registry.version("ref") is None
+    # nothing written outside the folder
+    assert [f for f in os.listdir(str(tmp_path.parent)) if f.startswith("ref")] == []
+
+
+def test_dataset_release(tmp_path, loads):
+    _, load = loads
+    first, second = Registry(str(tmp_path)), Registry(str(tmp_path))
+    first.register("ref", load)
+    first.register("other", load)
+    first.get("ref")
+    first.get("other")
+    second.get("ref")
+    second.get("other")
+
+    # still current, kept
+    second.release()
+    assert sorted(second._attached) == ["other", "ref"]
+
+    first.refresh("ref")
+    second.release("other")
+    assert sorted(second._attached) == ["other", "ref"]
+    # the idle process lets go of the version replaced
+    second.release()
+    assert list(second._attached) == ["other"]
+    assert bytes(second.get("ref")) == b"version 3"
+
+
+def test_numpy_datasets(tmp_path):
+    numpy = pytest.importorskip("numpy")
+    registry = Registry(str(tmp_path))
+
+    array = numpy.arange(12, dtype="f8").reshape(3, 4)
+    registry.publish("array", array)
+    shared = registry.get("array")
+    assert (shared == array).all()
+    assert not shared.flags.writeable
+
+    columns = {"x": numpy.arange(3), "when": numpy.array(["2021-01-01"] * 3, "M8[D]")}
+    registry.publish("columns", columns)
+    shared = registry.get("columns")
+    assert list(shared) == ["x", "when"]
+    assert (shared["when"] == columns["when"]).all()
+
+    with pytest.raises(ValueError):
+        registry.publish("objects", numpy.array([{}, []], dtype=object))
@@ -0,0 +1,144 @@
+import os
+import sys
+
+import pytest
+
+from dash import _hot_swap
+
+app_module = """
+import dash
+app = dash.Dash(__name__)
+"""
+
+callbacks_module = """
+from dash.dependencies import Input, Output
+from swap_app import app
+
+@app.callback(Output("out", "children"), Input({input}, "value"))
+def update(value):
+    return {result}
+"""
+
+
+@pytest.fixture
+def modules(tmp_path):
+    (tmp_path / "swap_app.py").write_text(app_module)
+    callbacks = tmp_path / "swap_callbacks.py"
+    sys.path.insert(0, str(tmp_path))
+    try:
+        yield callbacks
+    finally:
+        sys.path.remove(str(tmp_path))
+        for name in ("swap_app", "swap_callbacks"):
+            sys.modules.pop(name, None)
+
+
+def write(path, **values):
+    # the lengths differ, so the cached bytecode isn't reused
+    path.write_text(callbacks_module.format(**values))
+
+
+def test_swap_rebinds_callbacks(modules):
+    write(modules, input='"in"', result='"one"')
+    import swap_app  # noqa: F401 pylint: disable=import-error,import-outside-toplevel
+    import swap_callbacks  # noqa: F401 pylint: disable=import-error,import-outside-toplevel
+
+    app = sys.modules["swap_app"].app
+    root = os.path.realpath(str(modules.parent))
+    swappable = _hot_swap.swappable_modules(app, root)
+    assert list(swappable.values()) == ["swap_callbacks"]
+
+    write(modules, input='"in"', result='"second"')
+    names = _hot_swap.dependents(["swap_callbacks"], swappable)
+    assert _hot_swap.swap(app, names) is False
+
+    assert len(app._callback_list) == 1
+    assert app.callback_map["out.children"]["callback"].__wrapped__("x") == "second"
+
+
+def test_swap_restarts_for_new_dependencies(modules):
+    write(modules, input='"in"', result='"one"')
+    import swap_app  # noqa: F401 pylint: disable=import-error,import-outside-toplevel
+    import swap_callbacks  # noqa: F401 pylint: disable=import-error,import-outside-toplevel
+
+    app = sys.modules["swap_app"].app
+    callback = app.callback_map["out.children"]["callback"]
+
+    write(modules, input='"other"', result='"one"')
+    with pytest.raises(_hot_swap.RestartRequired):
+        _hot_swap.swap(app, ["swap_callbacks"])
+
+    # left as it was
+    assert len(app._callback_list) == 1
+    assert app._callback_list[0]["inputs"][0]["id"] == "in"
+    assert app.callback_map["out.children"]["callback"] is callback
+
+
+def test_swap_keeps_the_app_when_reloading_fails(modules):
+    write(modules, input='"in"', result='"one"')
+    import swap_app  # noqa: F401 pylint: disable=import-error,import-outside-toplevel
+    import swap_callbacks  # noqa: F401 pylint: disable=import-error,import-outside-toplevel
+
+    app = sys.modules["swap_app"].app
+    callback = app.callback_map["out.children"]["callback"]
+
+    write(modules, input='"in"', result="one +")
+    assert _hot_swap.swap(app, ["swap_callbacks"]) is None
+    assert app.callback_map["out.children"]["callback"] is callback
+
+
+def test_swap_restarts_for_modules_the_app_imports(modules):
+    write(modules, input='"in"', result='"one"')
+    (modules.parent / "swap_app.py").write_text(
+        app_module + "from swap_callbacks import update\n"
+    )
+    import swap_app  # noqa: F401 pylint: disable=import-error,import-outside-toplevel
+
+    app = sys.modules["swap_app"].app
+    with pytest.raises(_hot_swap.RestartRequired):
+        _hot_swap.swap(app, ["swap_callbacks"])
+
+
+clientside_module = """
+# {padding}
+from dash.dependencies import Input, Output
+from swap_app import app
+
+app.clientside_callback(
+    "function(value) {{ return {result}; }}",
+    Output("out", "children"),
+    Input("in", "value"),
+)
+"""
+
+
+def test_swap_clientside_callbacks(modules):
+    modules.write_text(clientside_module.format(result="value", padding=""))
+    import swap_app  # noqa: F401 pylint: disable=import-error,import-outside-toplevel
+    import swap_callbacks  # noqa: F401 pylint: disable=import-error,import-outside-toplevel
+
+    app = sys.modules["swap_app"].app
+    scripts, version = list(app._inline_scripts), app._inline_scripts_version
+    callback_map = app.callback_map
+
+    # registered again, the same function
+    modules.write_text(clientside_module.format(result="value", padding="again"))
+    assert _hot_swap.swap(app, ["swap_callbacks"]) is False
+    assert app._inline_scripts == scripts
+    assert app.callback_map is not callback_map
+
+    modules.write_text(clientside_module.format(result="value + 1", padding=""))
+    assert _hot_swap.swap(app, ["swap_callbacks"]) is True
+    assert len(app._inline_scripts) == 2
+    assert app._inline_scripts_version > version
+
+    # restored as it was, with a version not served before
+    scripts, version = list(app._inline_scripts), app._inline_scripts_version
+    callback_map = app.callback_map
+    modules.write_text(
+        clientside_module.format(result="value - 1", padding="") + "raise ValueError"
+    )
+    assert _hot_swap.swap(app, ["swap_callbacks"]) is None
+    assert app.callback_map is callback_map
+    assert app._inline_scripts == scripts
+    assert app._inline_scripts_version > version
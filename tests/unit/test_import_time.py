@@ -0,0 +1,66 @@
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+import pytest
+
+# `-X importtime` is new in Python 3.7, and without module `__getattr__` on
+# 3.6 dash.development imports the component loader with dash
+pytestmark = pytest.mark.skipif(sys.version_info < (3, 7), reason="Python 3.7+")
+
+# the time `import dash` may take on top of flask, relative to the time
+# flask takes in the same import, so it holds on a slow or busy machine:
+# ~0.25 with the heavy dependencies deferred, over 1 without
+IMPORT_TIME_BUDGET = 0.5
+
+# imported when used rather than with dash
+DEFERRED = (
+    "pkg_resources",
+    "plotly",
+    "flask_compress",
+    "werkzeug.debug.tbtools",
+    "future",
+    "multiprocessing",
+    "dash.development.component_loader",
+)
+
+
+def run(code, *options):
+    env = dict(os.environ)
+    # with the bytecode cached, as it is once dash is installed
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return subprocess.run(
+        [sys.executable] + list(options) + ["-c", code],
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+
+
+def import_time():
+    # the time of dash on top of flask, relative to flask, from the
+    # cumulative microseconds of the modules imported at the top level and
+    # by dash.dash in the -X importtime report
+    cumulative = {}
+    for line in run("import dash", "-X", "importtime").stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \|( *)(\S+)$", line)
+        if match and len(match.group(2)) <= 5:
+            cumulative[match.group(3)] = int(match.group(1))
+    return (cumulative["dash"] - cumulative["flask"]) / cumulative["flask"]
+
+
+def test_import_deferred_modules():
+    imported = run("import sys, dash; print(' '.join(sys.modules))").stdout.split()
+    assert [name for name in DEFERRED if name in imported] == []
+
+
+def test_import_time_budget():
+    run("import dash")
+    median = statistics.median(import_time() for _ in range(5))
+    assert median < IMPORT_TIME_BUDGET, "import dash took {:.0%} of flask".format(
+        median
+    )
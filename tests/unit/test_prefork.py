@@ -0,0 +1,94 @@
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from urllib.request import urlopen
+
+import pytest
+
+from dash import Dash
+from dash.exceptions import InvalidConfig
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+
+app_script = """
+import os, sys
+import dash
+import dash_html_components as html
+
+app = dash.Dash(__name__, serve_locally=False)
+app.layout = html.Div(id="root")
+app.server.route("/pid")(lambda: str(os.getpid()))
+app.run_server(port=int(sys.argv[1]), workers=2, threads=2, max_requests=3)
+"""
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def served(tmp_path):
+    notify = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    notify.bind(str(tmp_path / "notify"))
+    notify.settimeout(20)
+    (tmp_path / "prefork_app.py").write_text(app_script)
+
+    port = free_port()
+    env = dict(os.environ, NOTIFY_SOCKET=str(tmp_path / "notify"))
+    server = subprocess.Popen(
+        [sys.executable, str(tmp_path / "prefork_app.py"), str(port)],
+        cwd=str(tmp_path),
+        env=env,
+    )
+    try:
+        yield server, notify, "http://127.0.0.1:{}".format(port)
+    finally:
+        notify.close()
+        if server.poll() is None:
+            server.kill()
+            server.wait()
+
+
+def pids(url, count):
+    return [int(urlopen(url + "/pid", timeout=10).read()) for _ in range(count)]
+
+
+def test_workers_are_recycled_and_replaced(served):
+    server, notify, url = served
+    assert notify.recv(64) == b"READY=1"
+
+    assert b'"root"' in urlopen(url + "/_dash-layout", timeout=10).read()
+    # each worker serves 3 requests, the 3 first ones included
+    assert len(set(pids(url, 10))) > 2
+
+    server.send_signal(signal.SIGHUP)
+    assert notify.recv(64) == b"RELOADING=1"
+    assert notify.recv(64) == b"READY=1"
+    assert pids(url, 1)
+
+    server.send_signal(signal.SIGTERM)
+    assert server.wait(20) == 0
+    assert notify.recv(64) == b"STOPPING=1"
+
+
+def test_production_mode_options():
+    app = Dash()
+    with pytest.raises(InvalidConfig):
+        app.run_server(workers=2, debug=True)
+    with pytest.raises(InvalidConfig):
+        app.run_server(workers=2, use_reloader=True)
+
+
+def test_interrupt_stops_the_workers(served):
+    server, notify, url = served
+    assert notify.recv(64) == b"READY=1"
+
+    start = time.monotonic()
+    server.send_signal(signal.SIGINT)
+    assert server.wait(20) == 0
+    assert time.monotonic() - start < 10
@@ -0,0 +1,84 @@
+import dash_core_components as dcc
+import dash_html_components as html
+
+from dash import Dash
+from dash.prerender import register_renderer, render
+
+
+def test_render_html_components():
+    layout = html.Div(
+        [
+            html.H1("1 < 2", className="title", style={"marginTop": 10, "zIndex": 2}),
+            html.Img(src="/a.png", alt='"a"'),
+            html.Label("name", htmlFor="name", hidden=True, **{"data-x": "y"}),
+            html.ObjectEl(),
+            None,
+            3,
+        ],
+        id="root",
+        n_clicks=1,
+    )
+    assert render(layout) == (
+        '<div id="root">'
+        '<h1 class="title" style="margin-top: 10px; z-index: 2">1 &lt; 2</h1>'
+        '<img alt="&quot;a&quot;" src="/a.png">'
+        '<label hidden for="name" data-x="y">name</label>'
+        "<object></object>"
+        "3</div>"
+    )
+
+
+def test_render_other_components(mocker):
+    mocker.patch.dict("dash.prerender._renderers")
+    layout = html.Div([dcc.Loading(html.P("loaded")), dcc.Input(value="x")])
+    assert render(layout) == "<div><p>loaded</p></div>"
+
+    @register_renderer("dash_core_components", "Input")
+    def render_input(component):
+        return '<input value="{}">'.format(component.value)
+
+    assert render(layout) == '<div><p>loaded</p><input value="x"></div>'
+
+
+def test_render_deep_layout():
+    layout = html.Span("leaf")
+    for _ in range(5000):
+        layout = html.Div(layout)
+    assert render(layout) == "<div>" * 5000 + "<span>leaf</span>" + "</div>" * 5000
+
+
+def test_prerender_layout(mocker):
+    mocker.patch("dash.dash.os.stat", return_value=mocker.Mock(st_mtime=1))
+    app = Dash(prerender_layout=True)
+    app.layout = html.Div("static")
+    client = app.server.test_client()
+    assert '<div class="_dash-prerendered"><div>static</div></div>' in client.get(
+        "/"
+    ).get_data(as_text=True)
+
+    views = []
+
+    def layout():
+        views.append(None)
+        return html.Div("view {}".format(len(views)))
+
+    app.layout = layout
+    # the setter calls it once, to validate it
+    del views[:]
+    for view in range(1, 3):
+        response = client.get("/")
+        index = response.get_data(as_text=True)
+        # evaluated once per view, the layout rendered is also inlined
+        assert len(views) == view
+        assert "<div>view {}</div>".format(view) in index
+        assert '<script id="_dash-layout" type="application/json">' in index
+        assert '"children": "view {}"'.format(view) in index
+    # each view has its own layout, and ETag
+    etag = response.get_etag()[0]
+    assert client.get("/", headers={"If-None-Match": etag}).status_code == 200
+
+    app = Dash()
+    app.layout = html.Div("static")
+    index = app.server.test_client().get("/").get_data(as_text=True)
+    assert "_dash-prerendered" not in index
+    assert "Loading..." in index
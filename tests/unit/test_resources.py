@@ -1,6 +1,10 @@
+import gzip
+import pkgutil
+import re
+
 import mock
 import dash_core_components as dcc
-import dash_html_components as html  # noqa: F401
+import dash_html_components as html
 import dash
 from dash.development.base_component import ComponentRegistry
 
@@ -105,3 +109,240 @@ def test_internal(mocker):
     ), "Dynamic resource not available in registered path {}".format(
         app.registered_paths["dash_core_components"]
     )
+
+
+def test_serve_component_suites(mocker):
+    mocker.patch("dash.dash.os.stat", return_value=StatMock())
+    app = dash.Dash(__name__)
+    app.layout = html.Div()
+    app.registered_paths["dash_html_components"].add("dash_html_components.min.js")
+    client = app.server.test_client()
+    url = "/_dash-component-suites/dash_html_components/dash_html_components.min.js"
+    data = pkgutil.get_data("dash_html_components", "dash_html_components.min.js")
+
+    get_data = mocker.spy(pkgutil, "get_data")
+    response = client.get(url, headers={"Accept-Encoding": "identity"})
+    assert response.status_code == 200
+    assert response.get_data() == data
+    assert "Content-Encoding" not in response.headers
+    etag = response.headers["ETag"]
+
+    response = client.get(url, headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["ETag"] != etag
+    assert gzip.decompress(response.get_data()) == data
+    gzipped = response.get_data()
+
+    response = client.get(
+        url, headers={"Accept-Encoding": "gzip", "Range": "bytes=0-99"}
+    )
+    assert response.status_code == 206
+    assert response.get_data() == gzipped[:100]
+
+    response = client.get(
+        url, headers={"Accept-Encoding": "identity", "If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert get_data.call_count == 1, "the file is only read once"
+
+
+def test_serve_component_suites_uncompressed(mocker):
+    mocker.patch("dash.dash.os.stat", return_value=StatMock())
+    app = dash.Dash(__name__, compress=False)
+    app.layout = html.Div()
+    app.registered_paths["dash_html_components"].add("dash_html_components.min.js")
+    client = app.server.test_client()
+    url = "/_dash-component-suites/dash_html_components/dash_html_components.min.js"
+
+    response = client.get(
+        url, headers={"Accept-Encoding": "gzip", "Range": "bytes=5-9"}
+    )
+    assert response.status_code == 206
+    assert "Content-Encoding" not in response.headers
+    assert (
+        response.get_data()
+        == pkgutil.get_data("dash_html_components", "dash_html_components.min.js")[5:10]
+    )
+
+
+def test_assets_fingerprint(mocker, tmp_path):
+    mocker.patch.object(dash.Dash, "_setup_server")
+    style = tmp_path / "style.css"
+    style.write_text("body { color: red; }")
+    app = dash.Dash(__name__, assets_folder=str(tmp_path))
+    app._walk_assets_directory()
+    client = app.server.test_client()
+
+    (url,) = app._collect_and_register_resources(app.css.get_all_css())
+    assert url.startswith("/assets/style.v") and url.endswith(".css")
+    response = client.get(url)
+    assert response.get_data(as_text=True) == "body { color: red; }"
+    assert response.cache_control.max_age == 31536000
+    assert response.cache_control.immutable
+
+    response = client.get("/assets/style.css")
+    assert response.get_data(as_text=True) == "body { color: red; }"
+    assert not response.cache_control.immutable
+
+    style.write_text("body { color: blue; }")
+    app._on_assets_change(str(style), 1, False)
+    (new_url,) = app._collect_and_register_resources(app.css.get_all_css())
+    assert new_url != url
+    assert client.get(new_url).get_data(as_text=True) == "body { color: blue; }"
+
+
+def test_assets_external_path(mocker, tmp_path):
+    (tmp_path / "style.css").write_text("body { color: red; }")
+    app = dash.Dash(
+        __name__,
+        assets_folder=str(tmp_path),
+        assets_external_path="https://cdn.example.com/",
+    )
+    app.layout = html.Div()
+    client = app.server.test_client()
+
+    with mock.patch("dash.dash.os.stat", return_value=StatMock()):
+        response = client.get("/")
+    assert response.status_code == 200
+    # served locally, the assets still come from the external host, by name
+    assert re.search(
+        r'href="https://cdn\.example\.com/assets/style\.css\?m=\w+"',
+        response.get_data(as_text=True),
+    )
+
+
+def test_assets_bundle(mocker, tmp_path):
+    mocker.patch.object(dash.Dash, "_setup_server")
+    (tmp_path / "a.js").write_text("var a = 1\nvar b = 2")
+    (tmp_path / "b.js").write_text("var c = 3;\n")
+    (tmp_path / "ignored.js").write_text("var d = 4;\n")
+    (tmp_path / "style.css").write_text("body { color: red; }\n")
+    app = dash.Dash(
+        __name__,
+        assets_folder=str(tmp_path),
+        assets_ignore="ignored",
+        bundle_assets=True,
+        assets_inline_threshold=30,
+    )
+    app._walk_assets_directory()
+    client = app.server.test_client()
+
+    # the component libraries come first, then the bundle
+    url = app._collect_and_register_resources(app.scripts.get_all_scripts())[-1]
+    assert url.startswith("/_dash-assets-bundle/bundle.v")
+    response = client.get(url)
+    assert response.cache_control.immutable
+    bundle = response.get_data(as_text=True)
+    assert bundle.startswith("var a = 1\nvar b = 2\n;\nvar c = 3;\n;\n")
+    assert "sourceMappingURL={}.map".format(url.split("/")[-1]) in bundle
+
+    source_map = client.get(url + ".map").get_json()
+    assert source_map["sources"] == ["/assets/a.js", "/assets/b.js"]
+    assert source_map["mappings"] == "AAAA;AACA;;ACDA;"
+
+    # below the threshold, the css bundle is inlined
+    assert "<style>body { color: red; }\n</style>" in app._generate_css_dist_html(
+        app._css_links()
+    )
+
+    (tmp_path / "b.js").write_text("var c = 5;\n")
+    app._on_assets_change(str(tmp_path / "b.js"), 1, False)
+    new_url = app._collect_and_register_resources(app.scripts.get_all_scripts())[-1]
+    assert new_url != url
+    assert "var c = 5;" in client.get(new_url).get_data(as_text=True)
+    assert client.get("/_dash-assets-bundle/bundle.py").status_code == 404
+
+
+def test_assets_bundle_css(mocker, tmp_path):
+    mocker.patch.object(dash.Dash, "_setup_server")
+    (tmp_path / "fonts").mkdir()
+    (tmp_path / "zz").mkdir()
+    (tmp_path / "a.css").write_text(
+        "body { background: url(img.png); }\n"
+        "@font-face { src: url('fonts/x.woff'), url(data:font/woff;base64,AA); }\n"
+    )
+    (tmp_path / "fonts" / "b.css").write_text(
+        'h1 { background: url("../img.png"), url(/root.png), url(#svg); }\n'
+    )
+    (tmp_path / "zz" / "imports.css").write_text("@import url(other.css);\n")
+    (tmp_path / "zz" / "last.css").write_text("p { color: red; }\n")
+    app = dash.Dash(
+        __name__,
+        assets_folder=str(tmp_path),
+        bundle_assets=True,
+        assets_inline_threshold=0,
+    )
+    app._walk_assets_directory()
+    client = app.server.test_client()
+
+    # bundled up to the stylesheet with an @import, to keep the order
+    links = app._collect_and_register_resources(app.css.get_all_css(), tag="link")
+    assert links[0].startswith("/_dash-assets-bundle/bundle.v")
+    assert links[1].startswith("/assets/zz/imports.v")
+    assert links[2].startswith("/assets/zz/last.v")
+
+    bundle = client.get(links[0]).get_data(as_text=True)
+    assert "url(/assets/img.png)" in bundle
+    assert "url('/assets/fonts/x.woff')" in bundle
+    assert "url(data:font/woff;base64,AA)" in bundle
+    assert 'url("/assets/img.png"), url(/root.png), url(#svg)' in bundle
+
+
+def test_external_integrity(mocker):
+    mocker.patch("dash.development.base_component.ComponentRegistry.registry")
+    ComponentRegistry.registry = {"dash_core_components"}
+    mocker.patch("dash_core_components._js_dist")
+    mocker.patch("dash_core_components._css_dist", create=True)
+    dcc._js_dist = [
+        {
+            "external_url": "https://cdn.example.com/dcc.js",
+            "relative_package_path": "dcc.js",
+            "integrity": "sha384-js",
+            "namespace": "dash_core_components",
+        }
+    ]
+    dcc._css_dist = [
+        {
+            "external_url": "https://cdn.example.com/dcc.css",
+            "relative_package_path": "dcc.css",
+            "integrity": "sha384-css",
+            "namespace": "dash_core_components",
+        }
+    ]
+
+    app = dash.Dash(__name__, serve_locally=False)
+    app.layout = dcc.Markdown()
+
+    scripts = app._generate_scripts_html(app._script_srcs())
+    assert (
+        '<script src="https://cdn.example.com/dcc.js" integrity="sha384-js" '
+        'crossorigin="anonymous"></script>'
+    ) in scripts
+    css = app._generate_css_dist_html(app._css_links())
+    assert (
+        '<link rel="stylesheet" href="https://cdn.example.com/dcc.css" '
+        'integrity="sha384-css" crossorigin="anonymous">'
+    ) in css
+
+    # served locally, the integrity is left out
+    app.scripts.config.serve_locally = True
+    app.css.config.serve_locally = True
+    mocker.patch("dash.dash.os.stat", return_value=StatMock())
+    assert "integrity" not in app._generate_scripts_html(app._script_srcs())
+
+
+def test_generate_html_overrides(mocker):
+    mocker.patch("dash.dash.os.stat", return_value=StatMock())
+
+    class CustomDash(dash.Dash):
+        def _generate_scripts_html(self):
+            return super()._generate_scripts_html() + "\n<!-- scripts -->"
+
+        def _generate_css_dist_html(self):
+            return "<!-- css -->"
+
+    app = CustomDash(__name__)
+    app.layout = html.Div()
+    index = app.index()
+    assert "dash_renderer" in index and "<!-- scripts -->" in index
+    assert "<!-- css -->" in index
@@ -0,0 +1,130 @@
+import importlib.util
+import json
+import os
+import re
+import sys
+import textwrap
+
+import dash_core_components as dcc
+import dash_html_components as html
+
+from dash import Dash, _dash_renderer
+from dash.development.base_component import ComponentRegistry
+from dash.dependencies import Input, Output, State
+from dash.exceptions import PreventUpdate
+
+
+def test_export_static(tmp_path):
+    assets = tmp_path / "assets"
+    assets.mkdir()
+    (assets / "style.css").write_text("body { color: red; }")
+    (assets / "logo.svg").write_text("<svg></svg>")
+
+    app = Dash(serve_locally=False, assets_folder=str(assets))
+    app.layout = html.Div(
+        [
+            dcc.Dropdown(id="dropdown", options=[], value="a"),
+            dcc.Input(id="suffix", value="!"),
+            html.Div(id="out"),
+        ]
+    )
+
+    @app.callback(
+        Output("out", "children"), Input("dropdown", "value"), State("suffix", "value")
+    )
+    def update(value, suffix):
+        if value == "none":
+            raise PreventUpdate
+        return value + suffix
+
+    out = tmp_path / "out"
+    app.export_static(str(out), input_values={"dropdown.value": ["b", "none"]})
+
+    index = (out / "index.html").read_text()
+    assert re.search(r'<script id="_dash-layout" type="application/json">', index)
+    assert '"static_callbacks": "/_dash-callbacks.json"' in index
+
+    css = re.search(r'href="/(assets/style\.v[^"]+\.css)"', index).group(1)
+    assert (out / css).read_text() == "body { color: red; }"
+    assert (out / "assets" / "logo.svg").exists()
+    assert (out / "_favicon.ico").exists()
+    assert json.loads((out / "_dash-layout").read_text())["type"] == "Div"
+    assert json.loads((out / "_dash-dependencies").read_text())[0]["output"] == (
+        "out.children"
+    )
+
+    table = json.loads((out / "_dash-callbacks.json").read_text())
+    results = {entry["inputs"][0]: entry["response"] for entry in table["out.children"]}
+    assert results["a"]["response"]["out"]["children"] == "a!"
+    assert results["b"]["response"]["out"]["children"] == "b!"
+    assert results["none"] is None
+
+    # the app is served as before
+    index = app.server.test_client().get("/").get_data(as_text=True)
+    assert "static_callbacks" not in index
+    assert "_dash-layout" not in index
+
+
+def test_export_static_suites(monkeypatch, tmp_path):
+    # a package with a script and an async chunk loaded with its fingerprint,
+    # standing in for the renderer too as its bundles are built separately
+    package = tmp_path / "fake_suite"
+    package.mkdir()
+    (package / "__init__.py").write_text(
+        textwrap.dedent(
+            """
+            from dash.development.base_component import Component
+
+            __version__ = "1.0.0"
+            _js_dist = [
+                {"relative_package_path": "fake.js", "namespace": "fake_suite"},
+                {
+                    "relative_package_path": "async-fake.js",
+                    "namespace": "fake_suite",
+                    "async": True,
+                },
+            ]
+
+
+            class FakeComponent(Component):
+                pass
+            """
+        )
+    )
+    for name, mtime in (("fake.js", 1), ("async-fake.js", 2), ("dash_renderer.js", 1)):
+        (package / name).write_text("// " + name)
+        os.utime(str(package / name), (mtime, mtime))
+
+    monkeypatch.setattr(ComponentRegistry, "registry", set())
+    spec = importlib.util.spec_from_file_location(
+        "fake_suite",
+        str(package / "__init__.py"),
+        submodule_search_locations=[str(package)],
+    )
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, "fake_suite", module)
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(_dash_renderer, "_js_dist_dependencies", [])
+    monkeypatch.setattr(
+        _dash_renderer,
+        "_js_dist",
+        [{"relative_package_path": "dash_renderer.js", "namespace": "fake_suite"}],
+    )
+
+    app = Dash(assets_folder=str(tmp_path / "assets"))
+    app.layout = html.Div()
+    out = tmp_path / "out"
+    # into an existing folder
+    out.mkdir()
+    app.export_static(str(out))
+
+    index = (out / "index.html").read_text()
+    assert "/_dash-component-suites/fake_suite/fake.v1_0_0m1.js" in index
+    suites = out / "_dash-component-suites" / "fake_suite"
+    # only with the fingerprints the page references
+    assert sorted(os.listdir(str(suites))) == [
+        "async-fake.v1_0_0m1.js",
+        "dash_renderer.v1_0_0m1.js",
+        "fake.v1_0_0m1.js",
+    ]
+    assert (suites / "async-fake.v1_0_0m1.js").read_text() == "// async-fake.js"
@@ -0,0 +1,98 @@
+import gc
+import json
+
+import dash_html_components as html
+import pytest
+
+from dash import Dash
+from dash.dependencies import Input, Output
+from dash.exceptions import DuplicateIdError
+
+
+class StatMock(object):
+    st_mtime = 1
+
+
+def make_app(tmp_path):
+    (tmp_path / "style.css").write_text("body { margin: 0; }")
+    app = Dash(assets_folder=str(tmp_path))
+    app.layout = html.Div([html.Div(id="in"), html.Div(id="out")])
+
+    @app.callback(Output("out", "children"), Input("in", "children"))
+    def update(value):
+        return value
+
+    return app
+
+
+def test_warmup_sets_up_once(mocker, tmp_path):
+    mocker.patch("dash.dash.os.stat", return_value=StatMock())
+    freeze = mocker.patch.object(gc, "freeze", create=True)
+    app = make_app(tmp_path)
+
+    app.warmup()
+    assert freeze.call_count == 1
+    assert [css["asset_path"] for css in app.css.get_all_css()] == ["style.css"]
+    assert app._index_cache
+
+    # the first request doesn't walk the assets again
+    client = app.server.test_client()
+    assert client.get("/").status_code == 200
+    assert [css["asset_path"] for css in app.css.get_all_css()] == ["style.css"]
+
+
+def test_setup_retried_after_a_failed_first_request(mocker, tmp_path):
+    mocker.patch("dash.dash.os.stat", return_value=StatMock())
+    app = Dash(assets_folder=str(tmp_path), suppress_callback_exceptions=True)
+    app.server.testing = True
+    views = []
+
+    def layout():
+        views.append(None)
+        if len(views) == 1:
+            raise RuntimeError("the database is still starting")
+        return html.Div([html.Div(id="same"), html.Div(id="same")])
+
+    app.layout = layout
+    client = app.server.test_client()
+    with pytest.raises(RuntimeError):
+        client.get("/")
+    # the layout is validated on the next request
+    with pytest.raises(DuplicateIdError):
+        client.get("/")
+
+
+def test_warmup_serves_frozen_responses(mocker, tmp_path):
+    mocker.patch("dash.dash.os.stat", return_value=StatMock())
+    app = make_app(tmp_path)
+    app.warmup(freeze=False)
+    client = app.server.test_client()
+
+    layout = client.get("/_dash-layout")
+    assert layout.data == app._frozen["layout"].encode("utf-8")
+    assert json.loads(layout.data)["props"]["children"][0]["props"]["id"] == "in"
+
+    dependencies = client.get("/_dash-dependencies")
+    assert [dep["output"] for dep in json.loads(dependencies.data)] == ["out.children"]
+
+    app.layout = html.Div(id="changed")
+    assert "layout" not in app._frozen
+    assert json.loads(client.get("/_dash-layout").data)["props"]["id"] == "changed"
+
+    @app.callback(Output("changed", "children"), Input("in", "children"))
+    def update(value):
+        return value
+
+    assert "dependencies" not in app._frozen
+    assert len(json.loads(client.get("/_dash-dependencies").data)) == 2
+
+
+def test_warmup_leaves_layout_functions(mocker, tmp_path):
+    mocker.patch("dash.dash.os.stat", return_value=StatMock())
+    app = make_app(tmp_path)
+    app.layout = lambda: html.Div(id="function")
+    app.warmup(freeze=False)
+
+    assert "layout" not in app._frozen
+    client = app.server.test_client()
+    assert json.loads(client.get("/_dash-layout").data)["props"]["id"] == "function"
@@ -0,0 +1,126 @@
+import sys
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from dash import _watch
+
+
+@pytest.fixture
+def start():
+    watchers = []
+
+    def start_watcher(folder, **kwargs):
+        changes = []
+
+        def on_change(path, modified, deleted):
+            changes.append((path, deleted))
+
+        stop = threading.Event()
+        thread = threading.Thread(
+            target=_watch.watch,
+            args=([str(folder)], on_change),
+            kwargs=dict(kwargs, stop=stop),
+        )
+        thread.daemon = True
+        thread.start()
+        watchers.append((stop, thread))
+        # let the watcher walk the folder first
+        time.sleep(0.2)
+        return changes
+
+    yield start_watcher
+
+    for stop, thread in watchers:
+        stop.set()
+        thread.join(5)
+        assert not thread.is_alive()
+
+
+def wait_for(changes, count, timeout=3):
+    end = time.time() + timeout
+    while len(changes) < count and time.time() < end:
+        time.sleep(0.02)
+    # anything reported late would be a duplicate
+    time.sleep(0.3)
+    return changes
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify")
+def test_watch_inotify(tmp_path, start):
+    style = tmp_path / "style.css"
+    style.write_text("a")
+    changes = start(tmp_path, sleep_time=0.1, ignore=r"\.swp$")
+
+    # several writes in a row are reported once
+    for i in range(5):
+        style.write_text("b" * i)
+    (tmp_path / "style.css.swp").write_text("ignored")
+    assert wait_for(changes, 1) == [(str(style), False)]
+
+    del changes[:]
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "app.js").write_text("1")
+    style.unlink()
+    assert sorted(wait_for(changes, 2)) == [
+        (str(style), True),
+        (str(tmp_path / "sub" / "app.js"), False),
+    ]
+
+    # a folder moved is watched at its new path
+    (tmp_path / "sub").rename(tmp_path / "moved")
+    wait_for(changes, 3)
+    del changes[:]
+    (tmp_path / "moved" / "app.js").write_text("2")
+    assert wait_for(changes, 1) == [(str(tmp_path / "moved" / "app.js"), False)]
+
+    # and no longer once moved out
+    outside = tmp_path.parent / (tmp_path.name + "-outside")
+    (tmp_path / "moved").rename(outside)
+    wait_for(changes, 2, timeout=0.5)
+    del changes[:]
+    (outside / "app.js").write_text("3")
+    assert wait_for(changes, 1, timeout=0.5) == []
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify")
+def test_watch_inotify_callback_errors(tmp_path):
+    errors = []
+
+    def on_change(path, modified, deleted):
+        raise PermissionError(path)
+
+    def target():
+        try:
+            _watch.watch([str(tmp_path)], on_change, sleep_time=0.05)
+        except OSError as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=target)
+    thread.daemon = True
+    thread.start()
+    time.sleep(0.2)
+    (tmp_path / "style.css").write_text("a")
+    # raised to the caller rather than falling back to polling
+    thread.join(3)
+    assert not thread.is_alive()
+    assert [type(e) for e in errors] == [PermissionError]
+
+
+def test_watch_polling(tmp_path, start):
+    style = tmp_path / "style.css"
+    style.write_text("a")
+    ignored = tmp_path / "style.css.swp"
+    ignored.write_text("a")
+    # as without inotify, only while the watcher starts
+    with mock.patch.object(_watch, "_Inotify", side_effect=OSError):
+        changes = start(tmp_path, sleep_time=0.05, ignore=r"\.swp$")
+
+    time.sleep(0.05)
+    style.write_text("changed")
+    ignored.unlink()
+    wait_for(changes, 1)
+    style.unlink()
+    assert wait_for(changes, 2) == [(str(style), False), (str(style), True)]